@@ -0,0 +1,323 @@
+import math
+from typing import Any, Sequence
+
+import vector_math
+from vector_math import ONE, ZERO, Vec3
+
+# Canais numéricos de um componente e seu valor quando o componente não aparece no frame
+CHANNELS = ("pos", "rotation", "scale")
+REST: dict[str, Vec3] = {"pos": ZERO, "rotation": ZERO, "scale": ONE}
+# Campos discretos que, com esses valores, equivalem ao componente ausente
+DISCRETE_DEFAULTS: dict[str, Any] = {"show": True, "color": "0"}
+
+
+# Animação em colunas: para cada canal, uma linha de floats por frame com x, y, z de todos os
+# storeIDs lado a lado. Erros e interpolações viram laços sobre listas planas, sem dicionários.
+class Tracks:
+    def __init__(self, frames: Sequence[Any]) -> None:
+        components = [
+            [c for c in frame.get("components", []) if isinstance(c, dict) and isinstance(c.get("storeID"), int)]
+            if isinstance(frame, dict) and isinstance(frame.get("components"), list)
+            else []
+            for frame in frames
+        ]
+        self.store_ids: list[int] = sorted({c["storeID"] for comps in components for c in comps})
+        self.column: dict[int, int] = {sid: position * 3 for position, sid in enumerate(self.store_ids)}
+        self.components: list[dict[int, dict[str, Any]]] = [{c["storeID"]: c for c in comps} for comps in components]
+        self.present: list[frozenset[int]] = [frozenset(c["storeID"] for c in comps) for comps in components]
+        # Campos não numéricos por frame (show, color...), comparados como estão
+        self.discrete: list[tuple[tuple[int, str, Any], ...]] = []
+        self.rows: dict[str, list[list[float]]] = {channel: [] for channel in CHANNELS}
+        for comps, by_sid in zip(components, self.components):
+            for channel in CHANNELS:
+                row: list[float] = []
+                rest = REST[channel]
+                for sid in self.store_ids:
+                    comp = by_sid.get(sid)
+                    row.extend(vector_math.read(comp.get(channel), rest) if comp else rest)
+                self.rows[channel].append(row)
+            self.discrete.append(
+                tuple(
+                    sorted(
+                        (c["storeID"], key, repr(value))
+                        for c in comps
+                        for key, value in c.items()
+                        if key != "storeID" and key not in CHANNELS
+                    )
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+
+def max_error(row: Sequence[float], start: Sequence[float], end: Sequence[float], t: float) -> float:
+    return max((abs(v - (a + (b - a) * t)) for v, a, b in zip(row, start, end)), default=0.0)
+
+
+def _decimation_fits(tracks: Tracks, step: int, loop: bool, tolerances: dict[str, float]) -> bool:
+    # Com passo `step` ficam os frames 0, step, 2*step...; cada frame removido precisa ser reconstruído
+    # pela interpolação linear entre os vizinhos mantidos (o último volta ao primeiro em loop, senão segura)
+    count = len(tracks)
+    for index in range(count):
+        offset = index % step
+        if offset == 0:
+            continue
+        start = index - offset
+        end = start + step
+        if end >= count:
+            end = 0 if loop else start
+        if tracks.discrete[index] != tracks.discrete[start]:
+            return False
+        t = offset / step
+        for channel, tolerance in tolerances.items():
+            rows = tracks.rows[channel]
+            if max_error(rows[index], rows[start], rows[end], t) > tolerance:
+                return False
+    return True
+
+
+def _at_rest(comp: dict[str, Any], tolerances: dict[str, float]) -> bool:
+    for key, value in comp.items():
+        if key == "storeID":
+            continue
+        if key in CHANNELS:
+            rest = REST[key]
+            if any(abs(v - r) > tolerances[key] for v, r in zip(vector_math.read(value, rest), rest)):
+                return False
+        elif DISCRETE_DEFAULTS.get(key, object()) != value:
+            return False
+    return True
+
+
+def reduce_frames(
+    frames: list[Any], loop: bool, tolerances: dict[str, float]
+) -> tuple[list[Any], int, int]:
+    # Devolve (frames, frames removidos, componentes removidos). O formato espaça os frames por igual
+    # ao longo de "duration", então só uma dizimação uniforme (passo que divide o total) mantém o tempo
+    # dos frames que ficam; componentes em repouso saem quando os vizinhos também estão em repouso.
+    tracks = Tracks(frames)
+    count = len(tracks)
+    kept = list(frames)
+    present = list(tracks.present)
+    # Passo == count deixa só o frame 0, que segura (ou volta a ele em loop): o caso da animação toda parada
+    for step in range(count, 1, -1):
+        if count % step == 0 and _decimation_fits(tracks, step, loop, tolerances):
+            kept = frames[::step]
+            present = present[::step]
+            break
+    removed_frames = count - len(kept)
+
+    resting: list[set[int]] = []
+    for frame in kept:
+        comps = frame.get("components") if isinstance(frame, dict) else None
+        resting.append(
+            {
+                c["storeID"]
+                for c in comps
+                if isinstance(c, dict) and isinstance(c.get("storeID"), int) and _at_rest(c, tolerances)
+            }
+            if isinstance(comps, list)
+            else set()
+        )
+
+    def quiet(index: int, sid: int) -> bool:
+        if not loop and (index < 0 or index >= len(kept)):
+            return True
+        index %= len(kept)
+        return sid in resting[index] or sid not in present[index]
+
+    removed_components = 0
+    result: list[Any] = []
+    for index, frame in enumerate(kept):
+        drop = {sid for sid in resting[index] if quiet(index - 1, sid) and quiet(index + 1, sid)}
+        if not drop:
+            result.append(frame)
+            continue
+        comps = [c for c in frame["components"] if not (isinstance(c, dict) and c.get("storeID") in drop)]
+        removed_components += len(frame["components"]) - len(comps)
+        result.append(dict(frame) | {"components": comps})
+    return result, removed_frames, removed_components
+
+
+INTERPOLATIONS = ("linear", "cubica", "degrau")
+
+
+def _neighbour(index: int, count: int, loop: bool) -> int:
+    return index % count if loop else min(max(index, 0), count - 1)
+
+
+def _catmull_rom(
+    p0: Sequence[float], p1: Sequence[float], p2: Sequence[float], p3: Sequence[float], t: float
+) -> list[float]:
+    t2 = t * t
+    t3 = t2 * t
+    return [
+        0.5 * (2 * b + (c - a) * t + (2 * a - 5 * b + 4 * c - d) * t2 + (3 * b - a - 3 * c + d) * t3)
+        for a, b, c, d in zip(p0, p1, p2, p3)
+    ]
+
+
+def resample_frames(frames: list[Any], count: int, loop: bool, mode: str = "linear") -> list[dict[str, Any]]:
+    # O frame i de n toca em i/n da duração; o novo frame j de `count` lê as trilhas em j*n/count.
+    # Em loop o último segmento volta ao primeiro frame, senão o último frame segura até o fim.
+    if mode not in INTERPOLATIONS:
+        raise ValueError(f"Interpolação desconhecida: {mode} (use {', '.join(INTERPOLATIONS)})")
+    if count <= 0:
+        raise ValueError("Quantidade de frames deve ser positiva")
+    tracks = Tracks(frames)
+    total = len(tracks)
+    if total == 0:
+        raise ValueError("Animação sem frames")
+    result: list[dict[str, Any]] = []
+    for index in range(count):
+        position = index * total / count
+        start = int(position)
+        t = position - start
+        end = _neighbour(start + 1, total, loop)
+        rows: dict[str, list[float]] = {}
+        for channel in CHANNELS:
+            channel_rows = tracks.rows[channel]
+            if mode == "degrau" or t == 0.0:
+                rows[channel] = channel_rows[end if mode == "degrau" and t >= 0.5 else start]
+            elif mode == "linear":
+                rows[channel] = [a + (b - a) * t for a, b in zip(channel_rows[start], channel_rows[end])]
+            else:
+                rows[channel] = _catmull_rom(
+                    channel_rows[_neighbour(start - 1, total, loop)],
+                    channel_rows[start],
+                    channel_rows[end],
+                    channel_rows[_neighbour(start + 2, total, loop)],
+                    t,
+                )
+        # Campos discretos e o formato dos vetores vêm do frame anterior (ou do seguinte, se faltar lá)
+        nearest = end if mode == "degrau" and t >= 0.5 else start
+        other = start if nearest == end else end
+        comps: list[dict[str, Any]] = []
+        for sid in tracks.store_ids:
+            template = tracks.components[nearest].get(sid)
+            if template is None and t:
+                template = tracks.components[other].get(sid)
+            if template is None:
+                continue
+            comp = dict(template)
+            column = tracks.column[sid]
+            for channel in CHANNELS:
+                vec = tuple(rows[channel][column : column + 3])
+                if channel in template or any(abs(v - r) > 1e-9 for v, r in zip(vec, REST[channel])):
+                    comp[channel] = vector_math.write(vec, template.get(channel))
+            comps.append(comp)
+        source = frames[nearest] if isinstance(frames[nearest], dict) else {}
+        result.append(dict(source) | {"components": comps})
+    return result
+
+
+# Espelho pelo plano YZ (esquerda/direita no modelo do jogador): x da posição troca de sinal e as
+# rotações em Y e Z também, já que o eixo X continua o mesmo
+MIRROR_POS: Vec3 = (-1.0, 1.0, 1.0)
+MIRROR_ROTATION: Vec3 = (1.0, -1.0, -1.0)
+
+
+def mirror_frames(frames: list[Any], pairs: dict[int, int]) -> list[dict[str, Any]]:
+    # Cada componente vai para o storeID do par (ou fica no mesmo, se for central/sem par) com os canais
+    # espelhados; todos os vetores da animação passam de uma vez pelo kernel
+    comps: list[dict[str, Any]] = []
+    result: list[dict[str, Any]] = []
+    for frame in frames:
+        source = frame if isinstance(frame, dict) else {}
+        components = source.get("components")
+        mirrored: list[Any] = []
+        for comp in components if isinstance(components, list) else []:
+            if isinstance(comp, dict) and isinstance(comp.get("storeID"), int):
+                comp = dict(comp)
+                comp["storeID"] = pairs.get(comp["storeID"], comp["storeID"])
+                comps.append(comp)
+            mirrored.append(comp)
+        result.append(dict(source) | {"components": mirrored})
+    for channel, factor in (("pos", MIRROR_POS), ("rotation", MIRROR_ROTATION)):
+        targets = [comp for comp in comps if channel in comp]
+        likes = [comp[channel] for comp in targets]
+        # Somar 0.0 troca -0.0 por 0.0 e não suja o JSON
+        mirrored_values = vector_math.scale_many(vector_math.read_many(likes), factor)
+        values = [(x + 0.0, y + 0.0, z + 0.0) for x, y, z in mirrored_values]
+        for comp, value in zip(targets, vector_math.write_many(values, likes)):
+            comp[channel] = value
+    return result
+
+
+BLEND_MODES = ("mistura", "aditiva")
+
+
+def blend_frames(
+    layers: Sequence[tuple[list[Any], float, str, frozenset[int] | None]], count: int, loop: bool, mode: str = "linear"
+) -> list[dict[str, Any]]:
+    # Camadas (frames, peso, modo, máscara) aplicadas em ordem sobre a pose de repouso, já reamostradas para
+    # `count` frames. "mistura" interpola o resultado até a camada pelo peso; "aditiva" soma o desvio da
+    # camada em relação ao repouso (escala multiplica). As contas correm sobre as linhas planas de cada canal,
+    # com os índices de coluna de cada camada no resultado calculados uma vez só.
+    if not layers:
+        raise ValueError("Nenhuma camada para misturar")
+    base: list[Any] = []
+    resampled: list[Tracks] = []
+    for frames, _, blend, _ in layers:
+        if blend not in BLEND_MODES:
+            raise ValueError(f"Modo de camada desconhecido: {blend} (use {', '.join(BLEND_MODES)})")
+        frames = frames if len(frames) == count else resample_frames(frames, count, loop, mode)
+        base = base or frames
+        resampled.append(Tracks(frames))
+    store_ids = sorted({sid for tracks, (_, _, _, mask) in zip(resampled, layers) for sid in _masked(tracks, mask)})
+    column = {sid: position * 3 for position, sid in enumerate(store_ids)}
+
+    rows = {channel: [list(REST[channel]) * len(store_ids) for _ in range(count)] for channel in CHANNELS}
+    for tracks, (_, weight, blend, mask) in zip(resampled, layers):
+        sids = _masked(tracks, mask)
+        pairs = [(column[sid] + axis, tracks.column[sid] + axis) for sid in sids for axis in range(3)]
+        starts = [(column[sid], tracks.column[sid]) for sid in sids]
+        ones = [ONE] * len(starts)
+        for channel in CHANNELS:
+            for out, row in zip(rows[channel], tracks.rows[channel]):
+                if blend == "mistura":
+                    for target, source in pairs:
+                        out[target] += (row[source] - out[target]) * weight
+                elif channel == "scale":
+                    # O fator aditivo para em zero: peso alto sobre uma escala menor que 1 não vira o elemento
+                    # do avesso
+                    deltas = vector_math.sub_many([tuple(row[source : source + 3]) for _, source in starts], ones)
+                    factors = vector_math.clamp_many(
+                        vector_math.add_many(ones, vector_math.scale_many(deltas, weight)), 0.0, math.inf
+                    )
+                    for (target, _), (fx, fy, fz) in zip(starts, factors):
+                        out[target] *= fx
+                        out[target + 1] *= fy
+                        out[target + 2] *= fz
+                else:
+                    for target, source in pairs:
+                        out[target] += row[source] * weight
+
+    # Campos discretos e o formato dos vetores vêm da última camada que traz o componente no frame
+    result: list[dict[str, Any]] = []
+    for index in range(count):
+        templates: dict[int, dict[str, Any]] = {}
+        for tracks, (_, _, _, mask) in zip(resampled, layers):
+            by_sid = tracks.components[index]
+            for sid in _masked(tracks, mask):
+                if sid in by_sid:
+                    templates[sid] = by_sid[sid]
+        comps: list[dict[str, Any]] = []
+        for sid in store_ids:
+            template = templates.get(sid, {})
+            comp = dict(template) | {"storeID": sid}
+            start = column[sid]
+            for channel in CHANNELS:
+                vec = tuple(rows[channel][index][start : start + 3])
+                if channel in template or any(abs(v - r) > 1e-9 for v, r in zip(vec, REST[channel])):
+                    comp[channel] = vector_math.write(vec, template.get(channel))
+            if len(comp) > 1:
+                comps.append(comp)
+        source = base[index] if isinstance(base[index], dict) else {}
+        result.append(dict(source) | {"components": comps})
+    return result
+
+
+def _masked(tracks: Tracks, mask: frozenset[int] | None) -> list[int]:
+    return tracks.store_ids if mask is None else [sid for sid in tracks.store_ids if sid in mask]
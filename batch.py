@@ -0,0 +1,218 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+from cli import operation_parser, parse_operation
+from json_merger import JSONMergerLogic
+
+# Uma lógica por processo: o Projeto 1 (pacote de animações) é lido uma vez só em cada worker
+_worker_logic: JSONMergerLogic | None = None
+
+
+def collect_projects(sources: list[str]) -> list[str]:
+    found: list[str] = []
+    for source in sources:
+        if os.path.isdir(source):
+            matches = glob.glob(os.path.join(source, "**", "*.cpmproject"), recursive=True)
+        else:
+            matches = glob.glob(source, recursive=True)
+        found.extend(os.path.abspath(path) for path in matches if path.lower().endswith(".cpmproject"))
+    return sorted(set(found))
+
+
+def source_base(source: str) -> str:
+    # Pasta fixa da origem: a própria pasta, ou o trecho do glob antes do primeiro componente com curinga
+    # (skins/**/*.cpmproject -> skins), para as subpastas casadas pelo curinga continuarem na saída
+    if os.path.isdir(source):
+        return os.path.abspath(source)
+    parts = os.path.normpath(source).split(os.sep)
+    fixed: list[str] = []
+    for part in parts[:-1]:
+        if glob.has_magic(part):
+            break
+        fixed.append(part)
+    base = os.sep.join(fixed) or ("." if not source.startswith(os.sep) else os.sep)
+    return os.path.abspath(base)
+
+
+def output_path(project: str, sources: list[str], output_dir: str | None) -> str:
+    if not output_dir:
+        return project
+    # Mantém as subpastas relativas à pasta de origem que contém o projeto
+    for source in sources:
+        base = source_base(source)
+        if project.startswith(base.rstrip(os.sep) + os.sep):
+            return os.path.join(output_dir, os.path.relpath(project, base))
+    return os.path.join(output_dir, os.path.basename(project))
+
+
+def output_paths(projects: list[str], sources: list[str], output_dir: str | None) -> dict[str, str]:
+    # Duas origens caindo na mesma saída se sobrescreveriam (e disputariam o mesmo .tmp entre workers)
+    outputs = {project: output_path(project, sources, output_dir) for project in projects}
+    seen: dict[str, str] = {}
+    clashes: list[str] = []
+    for project, output in outputs.items():
+        key = os.path.normcase(os.path.abspath(output))
+        if key in seen:
+            clashes.append(f"{seen[key]} e {project} -> {output}")
+        seen.setdefault(key, project)
+    if clashes:
+        raise ValueError("Projetos com a mesma saída: " + "; ".join(clashes))
+    return outputs
+
+
+def load_report(path: str) -> tuple[list[str] | None, dict[str, dict[str, Any]]]:
+    # O relatório é JSON por linha e só cresce, então uma interrupção perde no máximo a linha em curso.
+    # A primeira linha guarda as operações do lote, conferidas ao retomar.
+    operations: list[str] | None = None
+    entries: dict[str, dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return operations, entries
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and "projeto" in entry:
+                entries[entry["projeto"]] = entry
+            elif isinstance(entry, dict) and isinstance(entry.get("operacoes"), list):
+                operations = entry["operacoes"]
+    return operations, entries
+
+
+def _init_worker(project1: str | None) -> None:
+    global _worker_logic
+    _worker_logic = JSONMergerLogic()
+    if project1:
+        _worker_logic.load_project1(project1)
+
+
+def process_project(project: str, output: str, operations: list[str], dry_run: bool) -> dict[str, Any]:
+    if _worker_logic is None:
+        _init_worker(None)
+    logic = _worker_logic
+    assert logic is not None
+    parser = operation_parser()
+    started = time.perf_counter()
+    steps: list[dict[str, Any]] = []
+    entry: dict[str, Any] = {"projeto": project, "saida": output, "passos": steps}
+    try:
+        logic.load_project2(project)
+        for operation in operations:
+            step_started = time.perf_counter()
+            args = parse_operation(parser, operation)
+            message = args.handler(logic, args)
+            steps.append(
+                {"operacao": operation, "mensagem": message, "ms": (time.perf_counter() - step_started) * 1000}
+            )
+        if not dry_run:
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            # save_project2_as grava num temporário e troca no fim: a saída nunca fica pela metade
+            logic.save_project2_as(output)
+        entry["status"] = "ok"
+    except Exception as exc:  # noqa: BLE001
+        entry["status"] = "erro"
+        entry["erro"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        logic.clear_clipboard()
+    entry["ms"] = (time.perf_counter() - started) * 1000
+    return entry
+
+
+def run_batch(
+    sources: list[str],
+    operations: list[str],
+    output_dir: str | None = None,
+    project1: str | None = None,
+    report_path: str | None = None,
+    jobs: int | None = None,
+    resume: bool = False,
+    dry_run: bool = False,
+) -> list[dict[str, Any]]:
+    parser = operation_parser()
+    for operation in operations:
+        parse_operation(parser, operation)
+    projects = collect_projects(sources)
+    outputs = output_paths(projects, sources, output_dir)
+    report_path = report_path or os.path.join(output_dir or ".", "lote_relatorio.jsonl")
+    recorded, done = load_report(report_path) if resume else (None, {})
+    if done and recorded != operations:
+        raise ValueError(f"O relatório {report_path} foi gerado com outras operações; rode sem --retomar")
+    pending = [project for project in projects if done.get(project, {}).get("status") != "ok"]
+    if recorded != operations and os.path.exists(report_path):
+        # Relatório novo (ou sem nenhum projeto registrado): começa do zero com o cabeçalho das operações
+        os.remove(report_path)
+        recorded = None
+    results: list[dict[str, Any]] = [done[project] for project in projects if project not in pending]
+    if not pending:
+        return results
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, "a", encoding="utf-8") as report, ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(project1,)
+    ) as pool:
+        if recorded is None:
+            report.write(json.dumps({"operacoes": operations}, ensure_ascii=False) + "\n")
+            report.flush()
+        futures = {
+            pool.submit(process_project, project, outputs[project], operations, dry_run): project
+            for project in pending
+        }
+        for future in as_completed(futures):
+            try:
+                entry = future.result()
+            except Exception as exc:  # noqa: BLE001
+                entry = {"projeto": futures[future], "status": "erro", "erro": f"{type(exc).__name__}: {exc}"}
+            report.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            report.flush()
+            results.append(entry)
+            status = "ok  " if entry["status"] == "ok" else "ERRO"
+            detail = f" — {entry['erro']}" if "erro" in entry else ""
+            print(f"[{len(results)}/{len(projects)}] {status} {entry['projeto']} ({entry.get('ms', 0):.0f} ms){detail}")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Aplica as mesmas operações a vários .cpmproject em paralelo")
+    parser.add_argument("origens", nargs="+", help="Pastas ou padrões glob com os projetos")
+    parser.add_argument(
+        "--op",
+        action="append",
+        required=True,
+        help="Operação no formato do python -m json_merger, ex.: --op 'movment --skin-x128' (repetível, em ordem)",
+    )
+    parser.add_argument("-o", "--saida", help="Pasta de saída (sem ela os projetos são sobrescritos)")
+    parser.add_argument("--projeto1", help="Projeto 1 usado por copiar-animacao")
+    parser.add_argument("--relatorio", help="Relatório JSON por linha (padrão: lote_relatorio.jsonl na saída)")
+    parser.add_argument("-j", "--processos", type=int, help="Quantidade de processos (padrão: CPUs)")
+    parser.add_argument("--retomar", action="store_true", help="Pula os projetos já concluídos no relatório")
+    parser.add_argument("--simular", action="store_true", help="Aplicar sem salvar nada")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    try:
+        results = run_batch(
+            args.origens,
+            args.op,
+            output_dir=args.saida,
+            project1=args.projeto1,
+            report_path=args.relatorio,
+            jobs=args.processos,
+            resume=args.retomar,
+            dry_run=args.simular,
+        )
+    except ValueError as exc:
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 2
+    failed = [entry for entry in results if entry["status"] != "ok"]
+    elapsed = time.perf_counter() - started
+    print(f"{len(results) - len(failed)} ok, {len(failed)} com erro em {elapsed:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
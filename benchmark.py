@@ -0,0 +1,157 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from json_merger import JSONMergerLogic
+from synthetic_project import generate_project
+
+# Tamanhos padrão dos projetos sintéticos; "grande" se aproxima dos nossos maiores rigs
+SIZES: dict[str, dict[str, int]] = {
+    "pequeno": {"elements": 100, "depth": 3, "animations": 2, "frames": 30, "components": 10, "texture": 64},
+    "medio": {"elements": 600, "depth": 5, "animations": 4, "frames": 120, "components": 40, "texture": 128},
+    "grande": {"elements": 2500, "depth": 7, "animations": 8, "frames": 300, "components": 120, "texture": 256},
+}
+
+# Cada caso: (preparação fora do tempo, operação medida). A preparação recebe o projeto recém-carregado.
+Case = tuple[Callable[[JSONMergerLogic], Any], Callable[[JSONMergerLogic, Any], Any]]
+
+
+def _first_animation(logic: JSONMergerLogic) -> str:
+    return sorted(entry["path"] for entry in logic.list_animations(2))[0]
+
+
+def _first_animated_id(logic: JSONMergerLogic, path: str) -> int:
+    frame = logic.load_animation(2, path)["frames"][0]
+    return frame["components"][0]["storeID"]
+
+
+def build_cases(project: str, scratch: str) -> dict[str, Case]:
+    saved = os.path.join(scratch, "saida.cpmproject")
+
+    def nothing(logic: JSONMergerLogic) -> None:
+        return None
+
+    def animation(logic: JSONMergerLogic) -> str:
+        return _first_animation(logic)
+
+    def animation_and_id(logic: JSONMergerLogic) -> tuple[str, int]:
+        path = _first_animation(logic)
+        return path, _first_animated_id(logic, path)
+
+    return {
+        "load_project1": (nothing, lambda logic, _: logic.load_project1(project)),
+        "load_project2": (nothing, lambda logic, _: logic.load_project2(project)),
+        "save_project2": (nothing, lambda logic, _: logic.save_project2_as(saved)),
+        "list_elements": (nothing, lambda logic, _: logic.list_elements()),
+        "apply_movement_tool": (
+            lambda logic: logic.detect_movement_limbs(),
+            lambda logic, selection: logic.apply_movement_tool(selection),
+        ),
+        "interpolate_frames": (animation, lambda logic, path: logic.interpolate_frames(2, path, 0, 1, 10, None)),
+        "apply_frame_to_model": (animation, lambda logic, path: logic.apply_frame_to_model(2, path, 1)),
+        "copy_element_transform_all_frames": (
+            animation_and_id,
+            lambda logic, data: logic.copy_element_transform_all_frames(2, data[0], 0, data[1]),
+        ),
+        "insert_clean_frame": (animation, lambda logic, path: logic.insert_clean_frame(2, path, 1)),
+    }
+
+
+def run_case(project: str, case: Case, repeats: int) -> list[float]:
+    setup, operation = case
+    timings: list[float] = []
+    for _ in range(repeats):
+        # Projeto limpo a cada rodada: operações que alteram o modelo não acumulam efeito
+        logic = JSONMergerLogic()
+        logic.load_project2(project)
+        data = setup(logic)
+        gc.collect()
+        started = time.perf_counter()
+        operation(logic, data)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def run_benchmarks(
+    sizes: list[str], repeats: int = 5, only: list[str] | None = None, seed: int = 0
+) -> dict[str, Any]:
+    results: dict[str, dict[str, Any]] = {}
+    scratch = tempfile.mkdtemp(prefix="cpm_bench_")
+    try:
+        for size in sizes:
+            project = os.path.join(scratch, f"{size}.cpmproject")
+            generate_project(project, seed=seed, **SIZES[size])
+            for name, case in build_cases(project, scratch).items():
+                if only and name not in only:
+                    continue
+                timings = run_case(project, case, repeats)
+                results[f"{size}/{name}"] = {
+                    "min_ms": min(timings),
+                    "median_ms": statistics.median(timings),
+                    "runs": [round(value, 3) for value in timings],
+                }
+                print(f"{size:<8} {name:<36} mediana {results[f'{size}/{name}']['median_ms']:9.2f} ms")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": repeats,
+            "seed": seed,
+            "sizes": {size: SIZES[size] for size in sizes},
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    # Compara medianas; casos ausentes em uma das execuções são ignorados
+    regressions: list[str] = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        ratio = result["median_ms"] / max(previous["median_ms"], 1e-6)
+        marker = "REGRESSÃO" if ratio > threshold else ""
+        print(f"{name:<46} {previous['median_ms']:9.2f} → {result['median_ms']:9.2f} ms  x{ratio:.2f} {marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks da lógica sobre projetos sintéticos")
+    parser.add_argument("--tamanhos", nargs="+", choices=list(SIZES), default=["pequeno", "medio"])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--somente", nargs="+", help="Rodar só estes casos (ex.: load_project2 list_elements)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("-o", "--saida", help="Salvar os resultados em JSON")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--limite", type=float, default=1.25, help="Razão da mediana considerada regressão")
+    args = parser.parse_args(argv)
+    current = run_benchmarks(args.tamanhos, args.repeticoes, args.somente, args.semente)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(current, baseline, args.limite)
+        if regressions:
+            print(f"{len(regressions)} regressão(ões) acima de x{args.limite}: " + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
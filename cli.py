@@ -0,0 +1,458 @@
+import argparse
+import inspect
+import shlex
+import sys
+import time
+from typing import Any, Callable, List
+
+from animation_tracks import BLEND_MODES, INTERPOLATIONS
+from json_merger import JSONMergerLogic
+
+
+# Interface de linha de comando sobre a lógica, sem Qt: abre, aplica uma ferramenta e salva o Projeto 2
+def find_element(logic: JSONMergerLogic, selector: str) -> List[int | str]:
+    # Aceita o nome do elemento ou o storeID (número)
+    elements = logic.list_elements()
+    for label, path in elements:
+        if label == selector:
+            return path
+    lowered = selector.lower()
+    for label, path in elements:
+        if label.lower() == lowered:
+            return path
+    if selector.lstrip("-").isdigit():
+        return find_element_by_store_id(logic, int(selector))
+    raise ValueError(f"Elemento não encontrado: {selector}")
+
+
+def find_element_by_store_id(logic: JSONMergerLogic, store_id: int) -> List[int | str]:
+    for _, path in logic.list_elements():
+        element = logic.get_by_path(logic.json2, path)
+        if isinstance(element, dict) and element.get("storeID") == store_id:
+            return path
+    raise ValueError(f"Elemento não encontrado: storeID {store_id}")
+
+
+def find_animation(logic: JSONMergerLogic, project: int, selector: str) -> str:
+    # Aceita o caminho dentro do arquivo, o nome do arquivo ou o rótulo mostrado na interface
+    entries = logic.list_animations(project)
+    for key in ("path", "file", "label"):
+        for entry in entries:
+            value = entry["path"].split("/")[-1] if key == "file" else entry.get(key)
+            if value == selector:
+                return entry["path"]
+    raise ValueError(f"Animação não encontrada no Projeto {project}: {selector}")
+
+
+def find_animations(logic: JSONMergerLogic, project: int, selector: str | None) -> list[str]:
+    # Sem seletor, todas as animações do projeto
+    if selector is None:
+        return sorted(entry["path"] for entry in logic.list_animations(project))
+    return [find_animation(logic, project, selector)]
+
+
+def resolve_element(logic: JSONMergerLogic, selector: Any) -> List[int | str]:
+    # Nome, storeID ou {"nome"|"storeID": ...} (este último vem das receitas)
+    if isinstance(selector, dict):
+        if "storeID" in selector:
+            return find_element_by_store_id(logic, selector["storeID"])
+        return find_element(logic, selector["nome"])
+    if isinstance(selector, int):
+        return find_element_by_store_id(logic, selector)
+    return find_element(logic, selector)
+
+
+LAYER_FIELDS = {"animacao", "peso", "modo", "mascara"}
+
+
+def split_layer(spec: str) -> dict[str, Any]:
+    # ANIMACAO[@PESO[@MODO[@storeIDs]]], ex.: "andar", "acenar@1@mistura@12,13" ou "respirar@0.5@aditiva";
+    # devolve os mesmos campos de uma camada escrita como objeto na receita
+    selector, *options = spec.split("@")
+    weight, blend, mask = (options + ["", "", ""])[:3]
+    layer: dict[str, Any] = {"animacao": selector}
+    try:
+        if len(options) > 3 or not selector:
+            raise ValueError(spec)
+        if weight:
+            layer["peso"] = float(weight)
+        if mask:
+            layer["mascara"] = [int(sid) for sid in mask.split(",") if sid.strip()]
+    except ValueError as exc:
+        raise ValueError(f"Camada inválida (use animacao@peso@modo@ids): {spec}") from exc
+    if blend:
+        layer["modo"] = blend
+    return layer
+
+
+def layer_problems(layer: Any) -> list[str]:
+    if isinstance(layer, str):
+        try:
+            layer = split_layer(layer)
+        except ValueError as exc:
+            return [str(exc)]
+    if not isinstance(layer, dict) or not isinstance(layer.get("animacao"), str):
+        return [f"camada sem 'animacao': {layer}"]
+    problems = [f"campo de camada desconhecido '{name}'" for name in sorted(set(layer) - LAYER_FIELDS)]
+    weight = layer.get("peso", 1.0)
+    if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+        problems.append(f"'peso' da camada {layer['animacao']} deve ser número")
+    if layer.get("modo") is not None and layer["modo"] not in BLEND_MODES:
+        problems.append(f"'modo' da camada {layer['animacao']} deve ser um de: {', '.join(BLEND_MODES)}")
+    mask = layer.get("mascara")
+    if mask is not None and not (
+        isinstance(mask, list) and all(isinstance(sid, int) and not isinstance(sid, bool) for sid in mask)
+    ):
+        problems.append(f"'mascara' da camada {layer['animacao']} deve ser uma lista de storeIDs")
+    return problems
+
+
+def resample_targets(frames: int | None, speed: float | None, fps: list[float] | None) -> list[dict[str, float]]:
+    targets: list[dict[str, float]] = []
+    if frames is not None:
+        targets.append({"frame_count": frames})
+    if speed is not None:
+        targets.append({"speed": speed})
+    targets.extend({"fps": value} for value in fps or [])
+    if not targets:
+        raise ValueError("Informe a quantidade de frames, a velocidade ou o(s) fps")
+    return targets
+
+
+def _pair(text: str) -> tuple[str, str]:
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"use chave=valor: {text}")
+    return key, value
+
+
+def _store_pair(text: str) -> tuple[int, int]:
+    source, target = _pair(text)
+    try:
+        return int(source), int(target)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"mapeamento inválido (use origem=destino): {text}") from exc
+
+
+# Uma função por operação, com os campos das receitas como parâmetros: a linha de comando, o lote e as
+# receitas chegam todos por aqui. Pares (membros, mapa) aceitam dicionário ou lista de (chave, valor).
+def run_info(logic: JSONMergerLogic) -> str | None:
+    names = logic.storeid_name_map(2)
+    print(f"Projeto 2: {logic.project2_path}")
+    print(f"  {len(logic.list_elements())} elemento(s), {len(names)} com storeID")
+    for entry in logic.list_animations(2):
+        print(f"  {entry['path']}  ({entry.get('label', '')})")
+    if logic.project1_path:
+        print(f"Projeto 1: {logic.project1_path}")
+        for entry in logic.list_animations(1):
+            print(f"  {entry['path']}  ({entry.get('label', '')})")
+    return None
+
+
+def run_movement(
+    logic: JSONMergerLogic, skin_x128: bool = False, recalcular_animacoes: bool = False, membros: Any = ()
+) -> str:
+    selection = logic.detect_movement_limbs()
+    for key, selector in dict(membros).items():
+        if key not in JSONMergerLogic.MOVEMENT_LIMB_NAMES:
+            raise ValueError(f"Membro desconhecido: {key}")
+        selection[key] = resolve_element(logic, selector)
+    missing = sorted(set(JSONMergerLogic.MOVEMENT_LIMB_NAMES) - set(selection))
+    if missing:
+        raise ValueError("Membros não encontrados: " + ", ".join(missing) + " (informe os membros à mão)")
+    logic.apply_movement_tool(selection, skin_x128=skin_x128, rebake=recalcular_animacoes)
+    return "Hierarquia +Movment gerada"
+
+
+def run_uv(logic: JSONMergerLogic, elemento: Any, du: int = 0, dv: int = 0) -> str:
+    logic.adjust_uv_by_path(resolve_element(logic, elemento), du, dv)
+    return f"UV de {elemento} deslocado em ({du}, {dv})"
+
+
+def run_affixes(
+    logic: JSONMergerLogic, elemento: Any, prefixo: str = "", sufixo: str = "", filhos: bool = False
+) -> str:
+    if not (prefixo or sufixo):
+        raise ValueError("Informe o prefixo e/ou o sufixo")
+    logic.apply_affixes(resolve_element(logic, elemento), prefixo, sufixo, filhos)
+    return f"{elemento} renomeado"
+
+
+def run_colors(logic: JSONMergerLogic) -> str:
+    logic.apply_name_colors()
+    return "Hierarquia colorida"
+
+
+def run_copy_animation(
+    logic: JSONMergerLogic, animacao: str, mapa: Any = (), sugerir: bool = False, confianca: float = 0.45
+) -> str:
+    logic.copy_animation_from_project1(find_animation(logic, 1, animacao))
+    mapping: dict[int, int] = {}
+    if sugerir:
+        suggestions = logic.suggest_storeid_mapping(min_score=confianca)
+        mapping = {source: target for source, (target, _) in suggestions.items()}
+    mapping.update({int(source): int(target) for source, target in dict(mapa).items()})
+    logic.paste_animation_to_project2(mapping)
+    return f"Animação {logic.animation_clipboard_name} copiada com {len(mapping)} storeID(s) mapeado(s)"
+
+
+def run_interpolate(
+    logic: JSONMergerLogic, animacao: str, de: int, ate: int, frames: int, nova: str | None = None
+) -> str:
+    path = find_animation(logic, 2, animacao)
+    logic.interpolate_frames(2, path, de - 1, ate - 1, frames, nova)
+    return f"{frames} frame(s) interpolado(s) entre {de} e {ate}"
+
+
+def run_apply_frame(logic: JSONMergerLogic, animacao: str, frame: int) -> str:
+    logic.apply_frame_to_model(2, find_animation(logic, 2, animacao), frame - 1)
+    return f"Frame {frame} aplicado ao modelo"
+
+
+def run_reduce(
+    logic: JSONMergerLogic,
+    animacao: str | None = None,
+    tol_pos: float = 0.01,
+    tol_rot: float = 0.1,
+    tol_escala: float = 0.001,
+) -> str:
+    paths = find_animations(logic, 2, animacao)
+    frames = components = before = after = 0
+    for path in paths:
+        report = logic.reduce_keyframes(2, path, tol_pos, tol_rot, tol_escala)
+        frames += report["removed_frames"]
+        components += report["removed_components"]
+        before += report["bytes_before"]
+        after += report["bytes_after"]
+    return (
+        f"{len(paths)} animação(ões) reduzida(s): {frames} frame(s) e {components} componente(s) removidos, "
+        f"{before} → {after} bytes"
+    )
+
+
+def run_resample(
+    logic: JSONMergerLogic,
+    animacao: str | None = None,
+    frames: int | None = None,
+    velocidade: float | None = None,
+    fps: float | list[float] | None = None,
+    modo: str = "linear",
+    variante: bool = False,
+) -> str:
+    fps = [fps] if isinstance(fps, (int, float)) else fps
+    targets = resample_targets(frames, velocidade, fps)
+    results = logic.resample_animations(2, find_animations(logic, 2, animacao), targets, modo, variante)
+    details = "; ".join(
+        f"{result['path'].split('/')[-1]} {result['frames_before']}→{result['frames_after']}" for result in results
+    )
+    return f"{len(results)} animação(ões) reamostrada(s): {details}"
+
+
+def run_mirror(
+    logic: JSONMergerLogic, animacao: str | None = None, nova: str | None = None, variante: bool = False
+) -> str:
+    paths = find_animations(logic, 2, animacao)
+    if nova and variante:
+        raise ValueError("Use um nome novo ou a variante, não os dois")
+    if nova and len(paths) > 1:
+        raise ValueError("Nome novo só vale para uma animação; use a variante para várias")
+    results = [
+        logic.mirror_animation(2, path, logic.animation_variant_name(path, "espelhada") if variante else nova)
+        for path in paths
+    ]
+    details = "; ".join(
+        f"{result['path'].split('/')[-1]} {result['pairs']} par(es), {result['unpaired']} sem par" for result in results
+    )
+    return f"{len(results)} animação(ões) espelhada(s): {details}"
+
+
+def run_blend(
+    logic: JSONMergerLogic,
+    camadas: list[Any],
+    nova: str | None = None,
+    frames: int | None = None,
+    modo: str = "linear",
+) -> str:
+    layers: list[dict[str, Any]] = []
+    for layer in camadas:
+        problems = layer_problems(layer)
+        if problems:
+            raise ValueError("; ".join(problems))
+        fields = split_layer(layer) if isinstance(layer, str) else layer
+        layers.append(
+            {
+                "path": find_animation(logic, 2, fields["animacao"]),
+                "weight": fields.get("peso", 1.0),
+                "blend": fields.get("modo"),
+                "mask": fields.get("mascara"),
+            }
+        )
+    result = logic.blend_animations(2, layers, nova, frames, modo)
+    return f"{result['layers']} camada(s) misturada(s) em {result['path'].split('/')[-1]} ({result['frames']} frames)"
+
+
+OPERATIONS: dict[str, Callable[..., str | None]] = {
+    "info": run_info,
+    "movment": run_movement,
+    "uv": run_uv,
+    "afixos": run_affixes,
+    "cores": run_colors,
+    "copiar-animacao": run_copy_animation,
+    "interpolar": run_interpolate,
+    "aplicar-frame": run_apply_frame,
+    "reduzir": run_reduce,
+    "reamostrar": run_resample,
+    "espelhar": run_mirror,
+    "misturar": run_blend,
+}
+
+
+def run_command(logic: JSONMergerLogic, args: argparse.Namespace) -> str | None:
+    # Os destinos do argparse têm os nomes dos parâmetros da operação
+    operation = OPERATIONS[args.comando]
+    names = list(inspect.signature(operation).parameters)[1:]
+    return operation(logic, **{name: getattr(args, name) for name in names if hasattr(args, name)})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m json_merger", description="Ferramentas do CPM_Editor sem interface gráfica"
+    )
+    parser.add_argument("projeto2", help="Projeto 2 (.cpmproject), o alvo das alterações")
+    parser.add_argument("--projeto1", help="Projeto 1 (.cpmproject), origem das animações")
+    parser.add_argument("-o", "--saida", help="Salvar em outro arquivo em vez de sobrescrever o Projeto 2")
+    parser.add_argument("--simular", action="store_true", help="Aplicar sem salvar nada")
+    add_commands(parser)
+    return parser
+
+
+def operation_parser() -> argparse.ArgumentParser:
+    # Só os comandos, para quem aplica operações numa lógica já carregada (ex.: o lote)
+    parser = argparse.ArgumentParser(prog="operação", add_help=False, exit_on_error=False)
+    add_commands(parser)
+    return parser
+
+
+def parse_operation(parser: argparse.ArgumentParser, operation: str) -> argparse.Namespace:
+    try:
+        return parser.parse_args(shlex.split(operation))
+    except (argparse.ArgumentError, SystemExit) as exc:
+        raise ValueError(f"Operação inválida: {operation}") from exc
+
+
+def add_commands(parser: argparse.ArgumentParser) -> None:
+    commands = parser.add_subparsers(dest="comando", required=True)
+
+    def add(name: str, help_text: str) -> Any:
+        sub = commands.add_parser(name, help=help_text)
+        sub.set_defaults(handler=run_command, modifies=name != "info")
+        return sub
+
+    add("info", "Lista elementos e animações")
+
+    sub = add("movment", "Gera a hierarquia +Movment detectando os membros")
+    sub.add_argument("--skin-x128", action="store_true", help="Multiplicador de UV para skins 128x128")
+    sub.add_argument(
+        "--recalcular-animacoes",
+        action="store_true",
+        help="Reescreve as animações para manter o movimento na hierarquia nova",
+    )
+    sub.add_argument(
+        "--membro",
+        dest="membros",
+        type=_pair,
+        action="append",
+        default=[],
+        help="Força um membro, ex.: left_arm='Left Arm' (nome ou storeID)",
+    )
+
+    sub = add("uv", "Desloca o UV de um elemento")
+    sub.add_argument("elemento", help="Nome ou storeID")
+    sub.add_argument("--du", type=int, default=0)
+    sub.add_argument("--dv", type=int, default=0)
+
+    sub = add("afixos", "Renomeia com prefixo/sufixo")
+    sub.add_argument("elemento", help="Nome ou storeID")
+    sub.add_argument("--prefixo", default="")
+    sub.add_argument("--sufixo", default="")
+    sub.add_argument("--filhos", action="store_true", help="Aplicar também aos filhos")
+
+    add("cores", "Pinta nameColor pela profundidade")
+
+    sub = add("copiar-animacao", "Copia uma animação do Projeto 1 para o Projeto 2")
+    sub.add_argument("animacao", help="Caminho, arquivo ou rótulo da animação no Projeto 1")
+    sub.add_argument(
+        "--mapa", type=_store_pair, action="append", default=[], help="storeID origem=destino (repetível)"
+    )
+    sub.add_argument("--sugerir", action="store_true", help="Mapear storeIDs pelos nomes dos elementos")
+    sub.add_argument("--confianca", type=float, default=0.45, help="Confiança mínima das sugestões")
+
+    sub = add("interpolar", "Insere frames interpolados")
+    sub.add_argument("animacao", help="Caminho, arquivo ou rótulo da animação no Projeto 2")
+    sub.add_argument("--de", type=int, required=True, help="Frame inicial (a partir de 1)")
+    sub.add_argument("--ate", type=int, required=True, help="Frame final (a partir de 1)")
+    sub.add_argument("--frames", type=int, required=True, help="Quantidade de frames inseridos")
+    sub.add_argument("--nova", help="Salvar numa nova animação com este nome")
+
+    sub = add("aplicar-frame", "Soma um frame à pose do modelo")
+    sub.add_argument("animacao", help="Caminho, arquivo ou rótulo da animação no Projeto 2")
+    sub.add_argument("--frame", type=int, required=True, help="Frame (a partir de 1)")
+
+    sub = add("reduzir", "Remove frames e componentes reconstruíveis dentro da tolerância")
+    sub.add_argument("animacao", nargs="?", help="Caminho, arquivo ou rótulo (padrão: todas do Projeto 2)")
+    sub.add_argument("--tol-pos", type=float, default=0.01, help="Erro máximo de posição")
+    sub.add_argument("--tol-rot", type=float, default=0.1, help="Erro máximo de rotação (graus)")
+    sub.add_argument("--tol-escala", type=float, default=0.001, help="Erro máximo de escala")
+
+    sub = add("reamostrar", "Reamostra animações para outra quantidade de frames")
+    sub.add_argument("animacao", nargs="?", help="Caminho, arquivo ou rótulo (padrão: todas do Projeto 2)")
+    target = sub.add_mutually_exclusive_group(required=True)
+    target.add_argument("--frames", type=int, help="Nova quantidade de frames")
+    target.add_argument("--velocidade", type=float, help="Fator de velocidade (2 = duas vezes mais rápida)")
+    target.add_argument("--fps", type=float, nargs="+", help="Taxa(s) de frames sobre a duration, ex.: 20 30 60")
+    sub.add_argument("--modo", choices=INTERPOLATIONS, default="linear", help="Interpolação entre os frames")
+    sub.add_argument(
+        "--variante", action="store_true", help="Gravar como animação nova (automático com vários fps)"
+    )
+
+    sub = add("espelhar", "Troca esquerda e direita das animações pelos nomes dos elementos")
+    sub.add_argument("animacao", nargs="?", help="Caminho, arquivo ou rótulo (padrão: todas do Projeto 2)")
+    name = sub.add_mutually_exclusive_group()
+    name.add_argument("--nova", help="Salvar numa nova animação com este nome")
+    name.add_argument("--variante", action="store_true", help="Salvar ao lado da original com o sufixo -espelhada")
+
+    sub = add("misturar", "Mistura ou soma animações em camadas numa animação nova")
+    sub.add_argument(
+        "camadas", nargs="+", help="Camadas em ordem: animacao[@peso[@mistura|aditiva[@storeIDs]]], ex.: pernas@1@@3,4"
+    )
+    sub.add_argument("--nova", help="Nome da animação nova (padrão: primeira camada com o sufixo -mistura)")
+    sub.add_argument("--frames", type=int, help="Quantidade de frames (padrão: a maior entre as camadas)")
+    sub.add_argument("--modo", choices=INTERPOLATIONS, default="linear", help="Interpolação ao reamostrar")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logic = JSONMergerLogic()
+    started = time.perf_counter()
+    try:
+        if args.projeto1:
+            logic.load_project1(args.projeto1)
+        logic.load_project2(args.projeto2)
+        message = args.handler(logic, args)
+        if args.modifies and not args.simular:
+            if args.saida:
+                logic.save_project2_as(args.saida)
+            else:
+                logic.save_project2()
+    except Exception as exc:  # noqa: BLE001
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 1
+    if message:
+        elapsed = (time.perf_counter() - started) * 1000
+        saved = "" if args.simular else f" → {logic.project2_path}"
+        print(f"{message} em {elapsed:.0f} ms{saved}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
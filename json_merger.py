@@ -1,11 +1,33 @@
 import copy
+import heapq
 import json
+import os
 import re
+import struct
+import sys
+import traceback
 import zipfile
 from typing import Any, Callable, List, Optional
 
+import vector_math
+from animation_tracks import blend_frames, mirror_frames, reduce_frames, resample_frames
+from pose import Matrix, PoseEvaluator, changed_store_ids, rebake_frame
+from uv_sweep import CoverageIndex, IntervalIndex
+
 
 class JSONMergerLogic:
+    # Nomes padrão dos membros do skin que o +Movment procura sozinho
+    MOVEMENT_LIMB_NAMES = {
+        "left_arm": "Left Arm",
+        "right_arm": "Right Arm",
+        "left_leg": "Left Leg",
+        "right_leg": "Right Leg",
+        "left_sleeve": "Left Sleeve",
+        "right_sleeve": "Right Sleeve",
+        "left_pants": "Left Pants Leg",
+        "right_pants": "Right Pants Leg",
+    }
+
     def __init__(self) -> None:
         self.json1: Any = {}
         self.json2: Any = {}
@@ -19,48 +41,168 @@ class JSONMergerLogic:
         self.animation_clipboard: dict[str, Any] | None = None
         self.animation_clipboard_name: str | None = None
         self.animation_clipboard_project: int | None = None
+        self._listeners: list[Callable[[str, dict[str, Any]], None]] = []
+        self._model_cache: dict[int, dict[str, Any]] = {}
+        self._modified_cache: dict[tuple[int, str], tuple[bytes, list[frozenset[int] | None]]] = {}
+        self._snapshot_origin: dict[str, Any] = {}
+        # Membros como estão no disco (mesmos objetos bytes do arquivo lido/gravado) e modelos alterados
+        # desde então; é a base para separar mudanças externas das locais
+        self._disk_members: dict[int, dict[str, bytes]] = {1: {}, 2: {}}
+        self._model_dirty: set[int] = set()
+        self.progress_hook: Callable[[int, int], None] | None = None
+        # Chamado quando um ouvinte falha; sem ele o erro só vai para o stderr
+        self.listener_error: Callable[[str, Exception], None] | None = None
+        self.io_counters = {"bytes_parsed": 0, "bytes_serialized": 0}
+
+    def subscribe(self, listener: Callable[[str, dict[str, Any]], None]) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, dict[str, Any]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     def load_project1(self, path: str) -> None:
-        with zipfile.ZipFile(path, "r") as archive:
-            self.project1_archive = {n: archive.read(n) for n in archive.namelist()}
-            config_names = [n for n in archive.namelist() if n.lower().endswith("config.json")]
-            if not config_names:
-                raise ValueError("Nenhum config.json no projeto")
-            raw_json = self._decode_bytes(self.project1_archive[config_names[0]])
-            self.json1 = json.loads(raw_json)
-            self.project1_path = path
+        archive = self._read_archive(path)
+        config_names = [n for n in archive if n.lower().endswith("config.json")]
+        if not config_names:
+            raise ValueError("Nenhum config.json no projeto")
+        self.json1 = self._parse_json(archive[config_names[0]])
+        self.project1_archive = archive
+        self.project1_path = path
+        self._disk_members[1] = dict(archive)
+        self._model_dirty.discard(1)
+        self._invalidate_model_cache(1)
 
     def load_project2(self, path: str) -> None:
-        with zipfile.ZipFile(path, "r") as archive:
-            names = [n for n in archive.namelist() if n.lower().endswith("config.json")]
-            if not names:
-                raise ValueError("Nenhum config.json no projeto")
-            self.project2_archive = {n: archive.read(n) for n in archive.namelist()}
-            self.project2_path = path
-            raw_json = self._decode_bytes(self.project2_archive[names[0]])
-            self.json2 = json.loads(raw_json)
+        archive = self._read_archive(path)
+        names = [n for n in archive if n.lower().endswith("config.json")]
+        if not names:
+            raise ValueError("Nenhum config.json no projeto")
+        self.json2 = self._parse_json(archive[names[0]])
+        self.project2_archive = archive
+        self.project2_path = path
+        self._disk_members[2] = dict(archive)
+        self._model_dirty.discard(2)
+        self._invalidate_model_cache(2)
 
     def save_project2(self) -> None:
         if not self.project2_path:
             raise ValueError("Carregue o Projeto 2 antes de salvar")
-        with zipfile.ZipFile(self.project2_path, "w") as archive:
-            for name, data in self.project2_archive.items():
-                if name.lower().endswith("config.json"):
-                    archive.writestr(name, json.dumps(self.json2, indent=2, ensure_ascii=False))
-                else:
-                    archive.writestr(name, data)
+        self._write_archive(self.project2_path)
 
     def save_project2_as(self, path: str) -> None:
         if not self.project2_archive:
             raise ValueError("Carregue o Projeto 2 antes de salvar")
-        with zipfile.ZipFile(path, "w") as archive:
-            for name, data in self.project2_archive.items():
-                if name.lower().endswith("config.json"):
-                    archive.writestr(name, json.dumps(self.json2, indent=2, ensure_ascii=False))
-                else:
-                    archive.writestr(name, data)
+        self._write_archive(path)
         self.project2_path = path
 
+    def sync_from_disk(self, project: int, resolve: str | None = None) -> dict[str, list[str]]:
+        # Recarrega só os membros que mudaram no disco desde a última leitura/gravação. Membros
+        # alterados dos dois lados são conflitos: ficam de fora, a menos que resolve seja "disco"
+        # (descarta o local) ou "local" (mantém o local e aceita o disco como nova base).
+        path = self.project1_path if project == 1 else self.project2_path
+        if not path:
+            raise ValueError(f"Projeto {project} não carregado")
+        disk = self._read_archive(path)
+        base = self._disk_members[project]
+        archive = self.project1_archive if project == 1 else self.project2_archive
+        result: dict[str, list[str]] = {"reloaded": [], "conflicts": [], "kept": []}
+        for name in sorted(set(disk) | set(base)):
+            data = disk.get(name)
+            if data == base.get(name):
+                continue
+            if name.lower().endswith("config.json"):
+                local_changed = project in self._model_dirty
+            else:
+                local_changed = archive.get(name) is not base.get(name)
+            if local_changed and resolve != "disco":
+                if resolve == "local":
+                    result["kept"].append(name)
+                    self._set_disk_member(project, name, data)
+                else:
+                    result["conflicts"].append(name)
+                continue
+            self._apply_disk_member(project, name, data)
+            result["reloaded"].append(name)
+        return result
+
+    def _set_disk_member(self, project: int, name: str, data: bytes | None) -> None:
+        if data is None:
+            self._disk_members[project].pop(name, None)
+        else:
+            self._disk_members[project][name] = data
+
+    def _apply_disk_member(self, project: int, name: str, data: bytes | None) -> None:
+        archive = self.project1_archive if project == 1 else self.project2_archive
+        self._set_disk_member(project, name, data)
+        if name.lower().endswith("config.json"):
+            if data is None:
+                return
+            setattr(self, f"json{project}", self._parse_json(data))
+            archive[name] = data
+            self._model_dirty.discard(project)
+            self._emit("project_replaced", project=project, reloaded=False)
+            return
+        existed = name in archive
+        if data is None:
+            archive.pop(name, None)
+            change = "removed"
+        else:
+            archive[name] = data
+            change = "updated" if existed else "added"
+        if name.startswith("animations/") and name.lower().endswith(".json") and (existed or data is not None):
+            self._emit("animation_changed", project=project, path=name, change=change)
+
+    def snapshot(self, copy_model: bool = True) -> "JSONMergerLogic":
+        clone = JSONMergerLogic()
+        clone.json1 = self.json1
+        # O config.json veio de JSON, então ida e volta pelo json é uma cópia profunda fiel e mais rápida
+        clone.json2 = json.loads(json.dumps(self.json2)) if copy_model else self.json2
+        clone.project1_path = self.project1_path
+        clone.project2_path = self.project2_path
+        clone.project1_archive = dict(self.project1_archive)
+        clone.project2_archive = dict(self.project2_archive)
+        clone.clipboard = self.clipboard
+        clone.clipboard_mode = self.clipboard_mode
+        clone.clipboard_orig_path = self.clipboard_orig_path
+        clone.animation_clipboard = self.animation_clipboard
+        clone.animation_clipboard_name = self.animation_clipboard_name
+        clone.animation_clipboard_project = self.animation_clipboard_project
+        clone._modified_cache = dict(self._modified_cache)
+        clone._disk_members = {project: dict(members) for project, members in self._disk_members.items()}
+        clone._model_dirty = set(self._model_dirty)
+        clone._snapshot_origin = {"json1": clone.json1, "json2": clone.json2}
+        return clone
+
+    def adopt(self, other: "JSONMergerLogic", events: list[tuple[str, dict[str, Any]]]) -> None:
+        reloaded = {
+            project
+            for project in (1, 2)
+            if getattr(other, f"json{project}") is not other._snapshot_origin.get(f"json{project}")
+        }
+        changed = {payload.get("project", 2) for event, payload in events if event != "animation_changed"}
+        for project in reloaded | changed:
+            setattr(self, f"json{project}", getattr(other, f"json{project}"))
+        self.project1_path = other.project1_path
+        self.project2_path = other.project2_path
+        self.project1_archive = other.project1_archive
+        self.project2_archive = other.project2_archive
+        self.clipboard = other.clipboard
+        self.clipboard_mode = other.clipboard_mode
+        self.clipboard_orig_path = other.clipboard_orig_path
+        self.animation_clipboard = other.animation_clipboard
+        self.animation_clipboard_name = other.animation_clipboard_name
+        self.animation_clipboard_project = other.animation_clipboard_project
+        self._modified_cache.update(other._modified_cache)
+        self._disk_members = other._disk_members
+        self._model_dirty = other._model_dirty
+        for project in sorted(reloaded | changed):
+            self._emit("project_replaced", project=project, reloaded=project in reloaded)
+        for event, payload in events:
+            if event == "animation_changed" and payload.get("project") not in reloaded:
+                self._emit(event, **payload)
+
     def clear_clipboard(self) -> None:
         self.clipboard = None
         self.clipboard_mode = None
@@ -92,18 +234,21 @@ class JSONMergerLogic:
             if suffix:
                 new_name = f"{new_name} {suffix}" if new_name else suffix
             el[key] = new_name.strip()
+            self._emit("attribute_changed", project=2, path=list(path), key=key)
 
         rename_element(node)
         if include_children:
             for key in ("children", "elements"):
                 child_list = node.get(key)
                 if isinstance(child_list, list):
-                    for child in child_list:
+                    for idx, child in enumerate(child_list):
                         if isinstance(child, dict):
-                            self._rename_descendants(child, prefix, suffix)
+                            self._rename_descendants(child, prefix, suffix, path + [key, idx])
 
-    def _rename_descendants(self, node: dict[str, Any], prefix: str, suffix: str) -> None:
-        def rename(el: Any) -> None:
+    def _rename_descendants(
+        self, node: dict[str, Any], prefix: str, suffix: str, path: List[int | str] | None = None
+    ) -> None:
+        def rename(el: Any, el_path: List[int | str]) -> None:
             if not isinstance(el, dict):
                 return
             key = "name" if isinstance(el.get("name"), str) else ("id" if isinstance(el.get("id"), str) else None)
@@ -115,13 +260,15 @@ class JSONMergerLogic:
                 if suffix:
                     new_name = f"{new_name} {suffix}" if new_name else suffix
                 el[key] = new_name.strip()
+                if path is not None:
+                    self._emit("attribute_changed", project=2, path=el_path, key=key)
             for child_key in ("children", "elements"):
                 arr = el.get(child_key)
                 if isinstance(arr, list):
-                    for ch in arr:
-                        rename(ch)
+                    for idx, ch in enumerate(arr):
+                        rename(ch, el_path + [child_key, idx])
 
-        rename(node)
+        rename(node, list(path or []))
 
     @staticmethod
     def _strip_numeric_suffix(text: str) -> str:
@@ -140,6 +287,8 @@ class JSONMergerLogic:
             parent.pop(idx)
         else:
             raise ValueError("Não é lista para remover")
+        if data is self.json2:
+            self._emit("node_removed", project=2, path=list(path))
 
     def adjust_uv(self, node: Any, du: int, dv: int) -> None:
         if isinstance(node, dict):
@@ -163,6 +312,10 @@ class JSONMergerLogic:
             for item in node:
                 self.adjust_uv(item, du, dv)
 
+    def adjust_uv_by_path(self, path: List[int | str], du: int, dv: int) -> None:
+        self.adjust_uv(self.get_by_path(self.json2, path), du, dv)
+        self._emit("attribute_changed", project=2, path=list(path), key=None)
+
     def compute_uv_bbox(self, element: dict[str, Any]) -> tuple[int, int, int, int] | None:
         if not isinstance(element, dict):
             return None
@@ -189,6 +342,138 @@ class JSONMergerLogic:
         height = y + z
         return int(u), int(v), int(u + width), int(v + height)
 
+    def face_uv_rects(self, element: dict[str, Any]) -> list[tuple[str, float, float, float, float]]:
+        if not isinstance(element, dict):
+            return []
+        if "faceUV" in element and isinstance(element["faceUV"], dict):
+            rects = []
+            for face_name, face in element["faceUV"].items():
+                if isinstance(face, dict) and {"sx", "sy", "ex", "ey"} <= face.keys():
+                    sx, sy, ex, ey = (float(face[key]) for key in ("sx", "sy", "ex", "ey"))
+                    rects.append((str(face_name), min(sx, ex), min(sy, ey), max(sx, ex), max(sy, ey)))
+            return rects
+
+        uv = self._extract_uv(element)
+        size = self._extract_size(element)
+        if uv is None or size is None:
+            return []
+        u, v = uv
+        x, y, z = size
+        # Layout de box UV: tampas na faixa de cima, as quatro laterais lado a lado embaixo
+        return [
+            ("up", u + z, v, u + z + x, v + z),
+            ("down", u + z + x, v, u + z + 2 * x, v + z),
+            ("west", u, v + z, u + z, v + z + y),
+            ("north", u + z, v + z, u + z + x, v + z + y),
+            ("east", u + z + x, v + z, u + 2 * z + x, v + z + y),
+            ("south", u + 2 * z + x, v + z, u + 2 * z + 2 * x, v + z + y),
+        ]
+
+    def uv_faces(self) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        for label, path in self.list_elements():
+            element = self.get_by_path(self.json2, path)
+            if not element.get("texture", True) and "faceUV" not in element:
+                continue
+            faces = self.face_uv_rects(element)
+            if faces:
+                entries.append({"name": label, "path": path, "faces": faces})
+        return entries
+
+    def texture_size(self) -> tuple[int, int] | None:
+        for name, data in self.project2_archive.items():
+            # Largura e altura ficam no chunk IHDR logo após a assinatura do PNG
+            if name.lower().endswith("skin.png") and data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+                width, height = struct.unpack(">II", data[16:24])
+                return int(width), int(height)
+        size = self.json2.get("skinSize") if isinstance(self.json2, dict) else None
+        if isinstance(size, dict) and isinstance(size.get("x"), (int, float)) and isinstance(size.get("y"), (int, float)):
+            return int(size["x"]), int(size["y"])
+        return None
+
+    def analyze_uv(self, texture_size: tuple[int, int] | None = None) -> dict[str, Any]:
+        texture_size = texture_size or self.texture_size()
+        faces: list[dict[str, Any]] = []
+        for owner, entry in enumerate(self.uv_faces()):
+            for face, x1, y1, x2, y2 in entry["faces"]:
+                if x2 > x1 and y2 > y1:
+                    faces.append(
+                        {"name": entry["name"], "path": entry["path"], "face": face, "rect": (x1, y1, x2, y2), "owner": owner}
+                    )
+
+        # Varredura em x: um heap pelo x final descarta quem já saiu; os ativos ficam num índice de intervalos
+        # em y, então cada face nova só encontra quem realmente cruza a sua faixa
+        order = sorted(range(len(faces)), key=lambda idx: faces[idx]["rect"][0])
+        active: list[tuple[float, int]] = []
+        by_y = IntervalIndex(sorted({face["rect"][1] for face in faces} | {face["rect"][3] for face in faces}))
+        overlaps: list[dict[str, Any]] = []
+        for idx in order:
+            x1, y1, x2, y2 = faces[idx]["rect"]
+            while active and active[0][0] <= x1:
+                _, gone = heapq.heappop(active)
+                by_y.remove(gone, faces[gone]["rect"][1], faces[gone]["rect"][3])
+            for other in sorted(by_y.overlapping(y1, y2)):
+                if faces[other]["owner"] == faces[idx]["owner"]:
+                    continue
+                ox1, oy1, ox2, oy2 = faces[other]["rect"]
+                height = min(y2, oy2) - max(y1, oy1)
+                width = min(x2, ox2) - max(x1, ox1)
+                overlaps.append({"a": faces[other], "b": faces[idx], "area": width * height})
+            heapq.heappush(active, (x2, idx))
+            by_y.add(idx, y1, y2)
+
+        out_of_bounds: list[dict[str, Any]] = []
+        unused: list[tuple[float, float, float, float]] = []
+        if texture_size:
+            width, height = texture_size
+            out_of_bounds = [
+                face
+                for face in faces
+                if face["rect"][0] < 0 or face["rect"][1] < 0 or face["rect"][2] > width or face["rect"][3] > height
+            ]
+            unused = self._uncovered_regions([face["rect"] for face in faces], width, height)
+        unused_area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in unused)
+        return {
+            "texture_size": texture_size,
+            "faces": len(faces),
+            "overlaps": overlaps,
+            "out_of_bounds": out_of_bounds,
+            "unused": unused,
+            "unused_area": unused_area,
+        }
+
+    @staticmethod
+    def _uncovered_regions(
+        rects: list[tuple[float, float, float, float]], width: float, height: float
+    ) -> list[tuple[float, float, float, float]]:
+        # Faixas horizontais entre bordas consecutivas; faixas seguidas com as mesmas lacunas viram um retângulo
+        clipped = [
+            (max(x1, 0), max(y1, 0), min(x2, width), min(y2, height))
+            for x1, y1, x2, y2 in rects
+            if x2 > 0 and y2 > 0 and x1 < width and y1 < height
+        ]
+        # Os eventos de entrada/saída de cada borda atualizam a cobertura em x; só as lacunas são lidas por faixa
+        edges = sorted({0.0, float(height)} | {r[1] for r in clipped} | {r[3] for r in clipped})
+        events: dict[float, list[tuple[float, float, int]]] = {}
+        for x1, y1, x2, y2 in clipped:
+            events.setdefault(y1, []).append((x1, x2, 1))
+            events.setdefault(y2, []).append((x1, x2, -1))
+        coverage = CoverageIndex(sorted({0.0, float(width)} | {r[0] for r in clipped} | {r[2] for r in clipped}))
+        regions: list[tuple[float, float, float, float]] = []
+        open_gaps: dict[tuple[float, float], float] = {}
+        for top in edges[:-1]:
+            for x1, x2, delta in events.get(top, ()):
+                coverage.add(x1, x2, delta)
+            gaps = coverage.gaps()
+            current = set(gaps)
+            for gap in [gap for gap in open_gaps if gap not in current]:
+                regions.append((gap[0], open_gaps.pop(gap), gap[1], top))
+            for gap in gaps:
+                open_gaps.setdefault(gap, top)
+        for gap, top in open_gaps.items():
+            regions.append((gap[0], top, gap[1], float(height)))
+        return regions
+
     def copy_from_json1(self, path: List[int | str]) -> None:
         self.clipboard = copy.deepcopy(self.get_by_path(self.json1, path))
         self.clipboard_mode = "copy"
@@ -204,15 +489,19 @@ class JSONMergerLogic:
         parent = self.get_by_path(self.json2, dest_path)
         if isinstance(parent, list):
             parent.append(self.clipboard)
+            inserted_path = list(dest_path) + [len(parent) - 1]
         elif isinstance(parent, dict):
             if isinstance(parent.get("elements"), list):
                 parent["elements"].append(self.clipboard)
+                inserted_path = list(dest_path) + ["elements", len(parent["elements"]) - 1]
             elif isinstance(parent.get("children"), list):
                 parent["children"].append(self.clipboard)
+                inserted_path = list(dest_path) + ["children", len(parent["children"]) - 1]
             else:
                 raise ValueError("Destino não suporta inserir lista")
         else:
             raise ValueError("Destino não é lista nem dict")
+        self._emit("node_inserted", project=2, path=inserted_path)
         if self.clipboard_mode == "move" and self.clipboard_orig_path is not None:
             try:
                 self.remove_by_path(self.json2, self.clipboard_orig_path)
@@ -241,11 +530,22 @@ class JSONMergerLogic:
         walk(self.json2, [])
         return results
 
+    def detect_movement_limbs(self) -> dict[str, List[int | str]]:
+        by_label: dict[str, List[int | str]] = {}
+        for label, path in self.list_elements():
+            by_label.setdefault(label.lower(), path)
+        return {
+            key: by_label[name.lower()]
+            for key, name in self.MOVEMENT_LIMB_NAMES.items()
+            if name.lower() in by_label
+        }
+
     def apply_movement_tool(
         self,
         selection: dict[str, List[int | str]],
         debug_hook: Optional[Callable[[str], None]] = None,
         skin_x128: bool = False,
+        rebake: bool = False,
     ) -> None:
         if not self.project2_archive:
             raise ValueError("Naao tem que carregar o project 2 antes :d")
@@ -262,20 +562,28 @@ class JSONMergerLogic:
         if set(selection) != required_keys:
             raise ValueError("Faltou selecionar alguma coisa ai")
         refs = {key: self._element_ref(path) for key, path in selection.items()}
+        # Pose de repouso da hierarquia antiga, guardada antes de qualquer mudança
+        before = self._pose_evaluator(2) if rebake else None
         anti_refs: dict[str, dict[str, Any]] = {}
         for key, ref in refs.items():
             clone = copy.deepcopy(ref["obj"])
             self._prefix_element_name(clone, "Anti_")
             ref["parent_list"].append(clone)
             anti_refs[key] = {"obj": clone, "parent_list": ref["parent_list"]}
+            self._emit_node_event("node_inserted", clone)
         self._call_debug(debug_hook, "clone")
+        self._report_progress(1, 4)
         for key in required_keys:
             self._set_y_size(refs[key]["obj"], 7)
+            self._emit_node_event("attribute_changed", refs[key]["obj"], key="size")
         for anti in anti_refs.values():
             self._set_y_size(anti["obj"], 6)
+            self._emit_node_event("attribute_changed", anti["obj"], key="size")
         for key in ("left_arm", "right_arm", "left_leg", "right_leg"):
             self._set_y_position(anti_refs[key]["obj"], 6)
+            self._emit_node_event("attribute_changed", anti_refs[key]["obj"], key=None)
         self._call_debug(debug_hook, "tamanho_posicao")
+        self._report_progress(2, 4)
         self._build_hierarchy(
             parent_ref=refs["left_arm"],
             child_refs=[
@@ -309,6 +617,7 @@ class JSONMergerLogic:
             anti_child_ref=anti_refs["right_pants"],
         )
         self._call_debug(debug_hook, "hierarquia")
+        self._report_progress(3, 4)
         for key in (
             "left_arm",
             "right_arm",
@@ -320,22 +629,27 @@ class JSONMergerLogic:
             "right_pants",
         ):
             self._apply_per_face_uv(anti_refs[key]["obj"], skin_x128)
+            self._emit_node_event("attribute_changed", anti_refs[key]["obj"], key=None)
         self._call_debug(debug_hook, "textura")
+        self._report_progress(4, 4)
+        if before is not None:
+            self.rebake_animations(before)
 
     def list_animations(self, project: int) -> list[dict[str, str]]:
         archive = self.project1_archive if project == 1 else self.project2_archive
         items: list[dict[str, str]] = []
         for name in archive:
             if name.startswith("animations/") and name.lower().endswith(".json"):
-                parsed = self._parse_animation_name(name.split("/")[-1])
-                items.append(parsed | {"path": name})
+                items.append(self.animation_entry(name))
         return items
 
+    def animation_entry(self, path: str) -> dict[str, str]:
+        return self._parse_animation_name(path.split("/")[-1]) | {"path": path}
+
     def copy_animation_from_project1(self, path: str) -> None:
         if path not in self.project1_archive:
             raise ValueError("Animação não encontrada no Projeto 1")
-        raw = self._decode_bytes(self.project1_archive[path])
-        self.animation_clipboard = json.loads(raw)
+        self.animation_clipboard = self._parse_json(self.project1_archive[path])
         self.animation_clipboard_name = path.split("/")[-1]
         self.animation_clipboard_project = 1
 
@@ -345,14 +659,15 @@ class JSONMergerLogic:
         cloned = copy.deepcopy(self.animation_clipboard)
         self._apply_storeid_mapping(cloned, mapping)
         target_path = f"animations/{self.animation_clipboard_name}"
-        self.project2_archive[target_path] = json.dumps(cloned, indent=2, ensure_ascii=False).encode("utf-8")
+        change = "updated" if target_path in self.project2_archive else "added"
+        self.project2_archive[target_path] = self._encode_json(cloned)
+        self._emit("animation_changed", project=2, path=target_path, change=change)
 
     def load_animation(self, project: int, path: str) -> dict[str, Any]:
         archive = self.project1_archive if project == 1 else self.project2_archive
         if path not in archive:
             raise ValueError("Animação não encontrada")
-        raw = self._decode_bytes(archive[path])
-        return json.loads(raw)
+        return self._parse_json(archive[path])
 
     def move_frame(self, project: int, path: str, from_idx: int, to_idx: int) -> list[dict[str, Any]]:
         anim, frames = self._animation_with_frames(project, path)
@@ -362,7 +677,7 @@ class JSONMergerLogic:
             raise ValueError("Índice de destino inválido")
         frame = frames.pop(from_idx)
         frames.insert(to_idx, frame)
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="moved", index=from_idx, to_index=to_idx)
         return frames
 
     def delete_frame(self, project: int, path: str, index: int) -> list[dict[str, Any]]:
@@ -370,7 +685,7 @@ class JSONMergerLogic:
         if index < 0 or index >= len(frames):
             raise ValueError("Índice inválido para excluir")
         frames.pop(index)
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="removed", index=index, count=1)
         return frames
 
     def duplicate_frame(self, project: int, path: str, index: int) -> list[dict[str, Any]]:
@@ -378,7 +693,7 @@ class JSONMergerLogic:
         if index < 0 or index >= len(frames):
             raise ValueError("Índice inválido para duplicar")
         frames.insert(index + 1, copy.deepcopy(frames[index]))
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="inserted", index=index + 1, count=1)
         return frames
 
     def insert_clean_frame(self, project: int, path: str, index: int) -> list[dict[str, Any]]:
@@ -386,41 +701,72 @@ class JSONMergerLogic:
         base_components = self._base_components_from_model(project)
         insert_at = min(max(index, 0), len(frames))
         frames.insert(insert_at, {"components": base_components})
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="inserted", index=insert_at, count=1)
         return frames
 
     def frame_component_hierarchy(
         self, project: int, path: str, frame_index: int
     ) -> list[dict[str, Any]]:
-        anim = self.load_animation(project, path)
-        frames = anim.get("frames")
-        if not isinstance(frames, list) or frame_index < 0 or frame_index >= len(frames):
+        modified_sets = self.frame_modified_ids(project, path)
+        if frame_index < 0 or frame_index >= len(modified_sets):
             raise ValueError("Frame inválido")
-        frame = frames[frame_index]
-        comps = frame.get("components", []) if isinstance(frame, dict) else []
-        if not isinstance(comps, list):
+        store_ids = modified_sets[frame_index]
+        if store_ids is None:
             raise ValueError("Frame sem componentes")
-        store_ids = {c.get("storeID") for c in comps if isinstance(c, dict) and isinstance(c.get("storeID"), int)}
+        skeleton = self.model_hierarchy(project)
+        name_map = self._cached_model_data(project)["names"]
+
+        collected = [entry | {"modified": entry["storeID"] in store_ids} for entry in skeleton]
+        seen_ids = {entry["storeID"] for entry in skeleton}
+        remaining = [sid for sid in store_ids if sid not in seen_ids]
+        for sid in remaining:
+            label = name_map.get(sid, f"storeID {sid}")
+            collected.append({"storeID": sid, "name": str(label), "depth": 0, "modified": True})
+        return collected
+
+    def model_hierarchy(self, project: int) -> list[dict[str, Any]]:
+        return self._cached_model_data(project)["hierarchy"]
+
+    def frame_modified_ids(self, project: int, path: str) -> list[frozenset[int] | None]:
+        archive = self.project1_archive if project == 1 else self.project2_archive
+        raw = archive.get(path)
+        if raw is None:
+            raise ValueError("Animação não encontrada")
+        cached = self._modified_cache.get((project, path))
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        anim = self._parse_json(raw)
+        frames = anim.get("frames") if isinstance(anim, dict) else None
+        if not isinstance(frames, list):
+            raise ValueError("Frame inválido")
+        modified_sets: list[frozenset[int] | None] = []
+        for frame in frames:
+            comps = frame.get("components", []) if isinstance(frame, dict) else []
+            if not isinstance(comps, list):
+                modified_sets.append(None)
+                continue
+            modified_sets.append(
+                frozenset(
+                    c.get("storeID") for c in comps if isinstance(c, dict) and isinstance(c.get("storeID"), int)
+                )
+            )
+        self._modified_cache[(project, path)] = (raw, modified_sets)
+        return modified_sets
+
+    def _cached_model_data(self, project: int) -> dict[str, Any]:
+        cached = self._model_cache.get(project)
+        if cached is not None:
+            return cached
         model = self.json1 if project == 1 else self.json2
         name_map = self.storeid_name_map(project)
-
-        collected: list[dict[str, Any]] = []
-        seen_ids: set[int] = set()
+        hierarchy: list[dict[str, Any]] = []
 
         def walk(node: Any, depth: int) -> None:
             if isinstance(node, dict):
                 sid = node.get("storeID")
                 if isinstance(sid, int):
                     label = name_map.get(sid) or node.get("name") or node.get("id") or f"storeID {sid}"
-                    collected.append(
-                        {
-                            "storeID": sid,
-                            "name": str(label),
-                            "depth": depth,
-                            "modified": sid in store_ids,
-                        }
-                    )
-                    seen_ids.add(sid)
+                    hierarchy.append({"storeID": sid, "name": str(label), "depth": depth})
                 for key in ("children", "elements"):
                     val = node.get(key)
                     if isinstance(val, list):
@@ -431,11 +777,254 @@ class JSONMergerLogic:
                     walk(item, depth)
 
         walk(model, 0)
-        remaining = [sid for sid in store_ids if sid not in seen_ids]
-        for sid in remaining:
-            label = name_map.get(sid, f"storeID {sid}")
-            collected.append({"storeID": sid, "name": str(label), "depth": 0, "modified": True})
-        return collected
+        cached = {"hierarchy": hierarchy, "names": name_map}
+        self._model_cache[project] = cached
+        return cached
+
+    def _invalidate_model_cache(self, project: int) -> None:
+        self._model_cache.pop(project, None)
+
+    def _pose_evaluator(self, project: int) -> PoseEvaluator:
+        # A pose de repouso mora no cache do modelo: qualquer alteração estrutural a descarta
+        cached = self._cached_model_data(project)
+        evaluator = cached.get("pose")
+        if evaluator is None:
+            evaluator = PoseEvaluator(self.json1 if project == 1 else self.json2)
+            cached["pose"] = evaluator
+        return evaluator
+
+    def evaluate_pose(
+        self, project: int, path: str | None = None, frame_index: int = 0, store_ids: list[int] | None = None
+    ) -> dict[int, Matrix]:
+        evaluator = self._pose_evaluator(project)
+        if path is None:
+            return evaluator.rest(store_ids)
+        frames = self.load_animation(project, path).get("frames")
+        if not isinstance(frames, list) or frame_index < 0 or frame_index >= len(frames):
+            raise ValueError("Frame inválido")
+        frame = frames[frame_index]
+        return evaluator.evaluate(frame.get("components") if isinstance(frame, dict) else None, store_ids)
+
+    def rebake_animations(
+        self, before: PoseEvaluator, project: int = 2, paths: list[str] | None = None
+    ) -> dict[str, int]:
+        # Reescreve, em todas as animações, os componentes dos storeIDs cujo pai ou pose de repouso mudou
+        # desde `before`, para que o movimento visto no mundo continue o mesmo
+        after = self._pose_evaluator(project)
+        targets = changed_store_ids(before, after)
+        summary = {"animations": 0, "frames": 0, "components": 0}
+        if not targets:
+            return summary
+        if paths is None:
+            paths = [entry["path"] for entry in self.list_animations(project)]
+        for done, path in enumerate(paths):
+            self._report_progress(done, len(paths))
+            anim, frames = self._animation_with_frames(project, path)
+            changed_frames = 0
+            for frame in frames:
+                changed = rebake_frame(before, after, frame, targets)
+                if changed:
+                    changed_frames += 1
+                    summary["components"] += changed
+            if changed_frames:
+                summary["animations"] += 1
+                summary["frames"] += changed_frames
+                self._store_animation(project, path, anim, frame_op="changed", index=None)
+        return summary
+
+    def reduce_keyframes(
+        self,
+        project: int,
+        path: str,
+        pos_tolerance: float = 0.01,
+        rotation_tolerance: float = 0.1,
+        scale_tolerance: float = 0.001,
+        preview: bool = False,
+    ) -> dict[str, Any]:
+        anim, frames = self._animation_with_frames(project, path)
+        tolerances = {"pos": pos_tolerance, "rotation": rotation_tolerance, "scale": scale_tolerance}
+        reduced, removed_frames, removed_components = reduce_frames(frames, bool(anim.get("loop")), tolerances)
+        archive = self.project1_archive if project == 1 else self.project2_archive
+        anim["frames"] = reduced
+        encoded = self._encode_json(anim)
+        report: dict[str, Any] = {
+            "frames_before": len(frames),
+            "frames_after": len(reduced),
+            "removed_frames": removed_frames,
+            "removed_components": removed_components,
+            "bytes_before": len(archive[path]),
+            "bytes_after": len(encoded),
+        }
+        if preview:
+            # Só para mostrar na timeline; nada é gravado
+            report["frames"] = reduced
+        elif removed_frames or removed_components:
+            self._store_animation(project, path, anim, encoded=encoded)
+        return report
+
+    def resample_animation(
+        self,
+        project: int,
+        path: str,
+        frame_count: int | None = None,
+        speed: float | None = None,
+        fps: float | None = None,
+        mode: str = "linear",
+        new_name: str | None = None,
+    ) -> dict[str, Any]:
+        # Exatamente um alvo: número de frames, fator de velocidade ou taxa de frames sobre "duration" (ms)
+        if sum(value is not None for value in (frame_count, speed, fps)) != 1:
+            raise ValueError("Informe só um entre quantidade de frames, velocidade ou fps")
+        anim, frames = self._animation_with_frames(project, path)
+        duration = anim.get("duration")
+        if speed is not None:
+            if speed <= 0:
+                raise ValueError("Velocidade deve ser positiva")
+            count = max(1, round(len(frames) / speed))
+            if isinstance(duration, (int, float)):
+                anim["duration"] = max(1, round(duration / speed))
+        elif fps is not None:
+            if not isinstance(duration, (int, float)) or fps <= 0:
+                raise ValueError("Reamostrar por fps precisa de 'duration' na animação e fps positivo")
+            count = max(1, round(duration * fps / 1000))
+        else:
+            count = int(frame_count or 0)
+        anim["frames"] = resample_frames(frames, count, bool(anim.get("loop")), mode)
+        target_path = self._store_animation(project, path, anim, new_name)
+        return {"path": target_path, "frames_before": len(frames), "frames_after": count}
+
+    def resample_animations(
+        self,
+        project: int,
+        paths: list[str],
+        targets: list[dict[str, float]],
+        mode: str = "linear",
+        variants: bool = False,
+    ) -> list[dict[str, Any]]:
+        # Cada alvo é {"frame_count" | "speed" | "fps": valor}; com mais de um alvo (ex.: 20/30/60 fps)
+        # cada resultado vira uma animação nova ao lado da original
+        tags = {"frame_count": "{:g}f", "speed": "x{:g}", "fps": "{:g}fps"}
+        for target in targets:
+            if len(target) != 1 or next(iter(target)) not in tags:
+                raise ValueError(f"Alvo inválido: {target}")
+        variants = variants or len(targets) > 1
+        results: list[dict[str, Any]] = []
+        for done, path in enumerate(paths):
+            self._report_progress(done, len(paths))
+            for target in targets:
+                key, value = next(iter(target.items()))
+                new_name = self.animation_variant_name(path, tags[key].format(value)) if variants else None
+                results.append(self.resample_animation(project, path, mode=mode, new_name=new_name, **target))
+        return results
+
+    def animation_variant_name(self, path: str, tag: str) -> str:
+        # v_acao_nome_uuid.json -> v_acao_nome-tag_uuid.json, para o rótulo continuar legível
+        filename = path.split("/")[-1]
+        base = filename[:-5] if filename.lower().endswith(".json") else filename
+        parts = base.split("_")
+        if len(parts) >= 3:
+            parts[-2] = f"{parts[-2]}-{tag}"
+        else:
+            parts.append(tag)
+        return "animations/" + "_".join(parts) + ".json"
+
+    def mirror_pairs(self, project: int = 2) -> dict[int, int]:
+        # Pareia left_/right_, Left/Right, esquerdo/direito (e os clones Anti_) pelo nome sem o lado;
+        # o índice fica no cache do modelo e vale nos dois sentidos
+        cached = self._cached_model_data(project)
+        pairs = cached.get("mirror")
+        if pairs is not None:
+            return pairs
+        sides: dict[tuple[bool, tuple[str, ...]], dict[str, list[int]]] = {}
+        for sid, name in sorted(cached["names"].items()):
+            key = self._mirror_key(name)
+            if key is not None:
+                side, stem = key
+                sides.setdefault(stem, {"left": [], "right": []})[side].append(sid)
+        pairs = {}
+        for found in sides.values():
+            for left, right in zip(found["left"], found["right"]):
+                pairs[left] = right
+                pairs[right] = left
+        cached["mirror"] = pairs
+        return pairs
+
+    @classmethod
+    def _mirror_key(cls, name: str) -> tuple[str, tuple[bool, tuple[str, ...]]] | None:
+        anti, tokens = cls._name_tokens(name)
+        for index, token in enumerate(tokens):
+            side = cls._name_side([token])
+            stem = "*"
+            if side is None:
+                match = re.search(r"esquerd[oa]?|direit[oa]?", token)
+                if match is None:
+                    continue
+                side = "left" if match.group().startswith("esquerd") else "right"
+                stem = token[: match.start()] + "*" + token[match.end() :]
+            return side, (anti, tuple(tokens[:index] + [stem] + tokens[index + 1 :]))
+        return None
+
+    def mirror_animation(self, project: int, path: str, new_name: str | None = None) -> dict[str, Any]:
+        anim, frames = self._animation_with_frames(project, path)
+        pairs = self.mirror_pairs(project)
+        anim["frames"] = mirror_frames(frames, pairs)
+        used = {
+            comp["storeID"]
+            for frame in frames
+            if isinstance(frame, dict) and isinstance(frame.get("components"), list)
+            for comp in frame["components"]
+            if isinstance(comp, dict) and isinstance(comp.get("storeID"), int)
+        }
+        target_path = self._store_animation(project, path, anim, new_name, frame_op="changed", index=None)
+        return {
+            "path": target_path,
+            "pairs": len({min(sid, pairs[sid]) for sid in used if sid in pairs}),
+            "unpaired": len([sid for sid in used if sid not in pairs]),
+        }
+
+    def blend_animations(
+        self,
+        project: int,
+        layers: list[dict[str, Any]],
+        new_name: str | None = None,
+        frame_count: int | None = None,
+        mode: str = "linear",
+    ) -> dict[str, Any]:
+        # Cada camada é {"path", "weight"=1, "blend"="mistura"|"aditiva", "mask"=[storeIDs]}; sem "blend",
+        # animações de valor/camada (g_) somam e as de pose (v_) misturam. A máscara inclui os filhos de
+        # cada storeID, então "Body" leva o tronco inteiro. O resultado é sempre uma animação nova.
+        if len(layers) < 2:
+            raise ValueError("Informe ao menos duas animações para misturar")
+        loaded: list[tuple[list[Any], float, str, frozenset[int] | None]] = []
+        first: dict[str, Any] = {}
+        for layer in layers:
+            path = layer["path"]
+            anim, frames = self._animation_with_frames(project, path)
+            first = first or anim
+            blend = layer.get("blend") or ("aditiva" if path.split("/")[-1].startswith("g_") else "mistura")
+            mask = layer.get("mask")
+            if mask is not None:
+                mask = frozenset(
+                    sid for root in mask for sid in (root, *self._descendant_storeids(project, root))
+                )
+            loaded.append((frames, float(layer.get("weight", 1.0)), blend, mask))
+        count = frame_count or max(len(frames) for frames, _, _, _ in loaded)
+        anim = dict(first)
+        anim["frames"] = blend_frames(loaded, count, bool(first.get("loop")), mode)
+
+        new_name = new_name or self.animation_variant_name(layers[0]["path"], "mistura")
+        if any(self._animation_member(new_name) == layer["path"] for layer in layers):
+            raise ValueError("A mistura precisa de um nome diferente das camadas")
+        target_path = self._store_animation(project, layers[0]["path"], anim, new_name)
+        return {"path": target_path, "frames": count, "layers": len(loaded)}
+
+    def evaluate_animation_poses(
+        self, project: int, path: str, store_ids: list[int] | None = None
+    ) -> list[dict[int, Matrix]]:
+        frames = self.load_animation(project, path).get("frames")
+        if not isinstance(frames, list):
+            raise ValueError("Animação sem frames")
+        return self._pose_evaluator(project).evaluate_frames(frames, store_ids)
 
     def copy_element_transform(
         self, project: int, path: str, source_frame: int, target_frame: int, store_id: int
@@ -463,7 +1052,7 @@ class JSONMergerLogic:
             updated += 1
         if updated == 0:
             raise ValueError("Nenhum dado de posição/rotação encontrado para copiar")
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="changed", index=target_frame, count=1)
 
     def copy_element_transform_all_frames(
         self, project: int, path: str, source_frame: int, store_id: int
@@ -479,6 +1068,7 @@ class JSONMergerLogic:
 
         total_updated = 0
         for idx, frame in enumerate(frames):
+            self._report_progress(idx, len(frames))
             comps = frame.get("components") if isinstance(frame, dict) else None
             if not isinstance(comps, list):
                 raise ValueError(f"Frame {idx} sem componentes")
@@ -495,7 +1085,7 @@ class JSONMergerLogic:
 
         if total_updated == 0:
             raise ValueError("Nenhum dado de posição/rotação encontrado para copiar")
-        self._write_animation(project, path, anim)
+        self._store_animation(project, path, anim, frame_op="changed", index=None)
 
     def interpolate_frames(
         self, project: int, path: str, start_idx: int, end_idx: int, insert_count: int, new_name: str | None
@@ -515,19 +1105,34 @@ class JSONMergerLogic:
         end_map = self._components_by_storeid(end_frame)
         union_ids = set(start_map) | set(end_map)
 
+        # Os extremos são lidos uma vez; cada passo só interpola as listas de vetores
+        sids: list[int] = []
+        templates: list[dict[str, Any]] = []
+        starts: dict[str, list[vector_math.Vec3]] = {"pos": [], "rotation": []}
+        ends: dict[str, list[vector_math.Vec3]] = {"pos": [], "rotation": []}
+        for sid in union_ids:
+            src = start_map.get(sid) or {}
+            dst = end_map.get(sid) or {}
+            if not isinstance(src, dict) or not isinstance(dst, dict):
+                continue
+            sids.append(sid)
+            templates.append(src if src else dst)
+            for key in ("pos", "rotation"):
+                starts[key].append(vector_math.read(src.get(key)))
+                ends[key].append(vector_math.read(dst.get(key)))
+
         new_frames: list[dict[str, Any]] = []
         for step in range(1, insert_count + 1):
+            self._report_progress(step - 1, insert_count)
             t = step / (insert_count + 1)
+            positions = vector_math.lerp_many(starts["pos"], ends["pos"], t)
+            rotations = vector_math.lerp_many(starts["rotation"], ends["rotation"], t)
             comps: list[dict[str, Any]] = []
-            for sid in union_ids:
-                src = start_map.get(sid) or {}
-                dst = end_map.get(sid) or {}
-                if not isinstance(src, dict) or not isinstance(dst, dict):
-                    continue
-                comp = copy.deepcopy(src if src else dst)
+            for sid, template, pos, rotation in zip(sids, templates, positions, rotations):
+                comp = copy.deepcopy(template)
                 comp["storeID"] = sid
-                comp["pos"] = self._lerp_vectors(src.get("pos"), dst.get("pos"), t)
-                comp["rotation"] = self._lerp_vectors(src.get("rotation"), dst.get("rotation"), t)
+                comp["pos"] = vector_math.write(pos, template.get("pos"))
+                comp["rotation"] = vector_math.write(rotation, template.get("rotation"))
                 comps.append(comp)
             new_frames.append({"components": comps})
 
@@ -538,16 +1143,9 @@ class JSONMergerLogic:
                 frames_with_interp.extend(new_frames)
 
         anim["frames"] = frames_with_interp
-
-        target_archive = self.project1_archive if project == 1 else self.project2_archive
-        target_path = path
-        if new_name:
-            filename = new_name if new_name.lower().endswith(".json") else f"{new_name}.json"
-            if not filename.startswith("animations/"):
-                filename = f"animations/{filename}"
-            target_path = filename
-            anim["name"] = filename.split("/")[-1].replace(".json", "")
-        target_archive[target_path] = json.dumps(anim, indent=2, ensure_ascii=False).encode("utf-8")
+        self._store_animation(
+            project, path, anim, new_name, frame_op="inserted", index=start_idx + 1, count=insert_count
+        )
 
     def apply_frame_to_model(self, project: int, path: str, frame_index: int) -> None:
         if not self.project2_archive:
@@ -562,62 +1160,78 @@ class JSONMergerLogic:
             raise ValueError("Frame sem componentes")
 
         store_map = self._storeid_node_map(self.json2)
-        base_transforms: dict[int, dict[str, Any]] = {}
+        node_paths = self._node_paths(self.json2) if self._listeners else {}
+        base_transforms: dict[int, tuple[vector_math.Vec3, vector_math.Vec3]] = {}
+        # Deltas acumulados por nó (um storeID repetido no frame soma duas vezes, como antes)
+        pending: dict[str, dict[int, tuple[dict[str, Any], vector_math.Vec3]]] = {"pos": {}, "rotation": {}}
         for comp in components:
             if not isinstance(comp, dict):
                 continue
             sid = comp.get("storeID")
             if not isinstance(sid, int):
                 continue
-            base_transforms[sid] = {
-                "pos": comp.get("pos"),
-                "rotation": comp.get("rotation"),
-            }
-            if sid not in store_map:
-                continue
-            for target in store_map[sid]:
-                self._apply_transform_to_node(target, comp)
+            base_transforms[sid] = (vector_math.read(comp.get("pos")), vector_math.read(comp.get("rotation")))
+            for target in store_map.get(sid, []):
+                for key, delta in zip(("pos", "rotation"), base_transforms[sid]):
+                    if not isinstance(comp.get(key), (dict, list)):
+                        continue
+                    previous = pending[key].get(id(target))
+                    if previous is not None:
+                        delta = vector_math.add(previous[1], delta)
+                    pending[key][id(target)] = (target, delta)
+
+        for key, entries in pending.items():
+            nodes = [node for node, _ in entries.values()]
+            summed = vector_math.add_many(
+                vector_math.read_many([node.get(key) for node in nodes]), [delta for _, delta in entries.values()]
+            )
+            for node, vec in zip(nodes, summed):
+                node[key] = vector_math.write(vec, node.get(key))
+                if id(node) in node_paths:
+                    self._emit("attribute_changed", project=2, path=node_paths[id(node)], key=key)
 
         # Normaliza os frames subtraindo o frame aplicado
         if isinstance(frames, list):
-            for frm in frames:
+            for idx, frm in enumerate(frames):
+                self._report_progress(idx, len(frames))
                 comps = frm.get("components") if isinstance(frm, dict) else None
                 if not isinstance(comps, list):
                     continue
-                for comp in comps:
-                    if not isinstance(comp, dict):
-                        continue
-                    sid = comp.get("storeID")
-                    base = base_transforms.get(sid or -1)
-                    if not base:
-                        continue
-                    if "pos" in base:
-                        comp["pos"] = self._subtract_vectors(comp.get("pos"), base["pos"])
-                    if "rotation" in base:
-                        comp["rotation"] = self._subtract_vectors(
-                            comp.get("rotation"), base["rotation"]
-                        )
+                targets = [
+                    comp
+                    for comp in comps
+                    if isinstance(comp, dict)
+                    and isinstance(comp.get("storeID"), int)
+                    and comp["storeID"] in base_transforms
+                ]
+                if not targets:
+                    continue
+                for index, key in enumerate(("pos", "rotation")):
+                    current = vector_math.read_many([comp.get(key) for comp in targets])
+                    bases = [base_transforms[comp["storeID"]][index] for comp in targets]
+                    for comp, vec in zip(targets, vector_math.sub_many(current, bases)):
+                        comp[key] = vector_math.write(vec, comp.get(key))
 
-        target_archive = self.project1_archive if project == 1 else self.project2_archive
-        target_archive[path] = json.dumps(anim, indent=2, ensure_ascii=False).encode("utf-8")
+        self._store_animation(project, path, anim, frame_op="changed", index=None)
 
     def apply_name_colors(self) -> None:
         colors = [0x24FFFF, 0x00FF00, 0xFFFF00, 0x00FF89]
 
-        def walk(node: Any, depth: int) -> None:
+        def walk(node: Any, depth: int, path: List[int | str]) -> None:
             if isinstance(node, dict):
                 if any(k in node for k in ("name", "id", "storeID")):
                     node["nameColor"] = colors[depth % len(colors)]
+                    self._emit("attribute_changed", project=2, path=path, key="nameColor")
                 for key in ("children", "elements"):
                     val = node.get(key)
                     if isinstance(val, list):
-                        for child in val:
-                            walk(child, depth + 1)
+                        for idx, child in enumerate(val):
+                            walk(child, depth + 1, path + [key, idx])
             elif isinstance(node, list):
-                for item in node:
-                    walk(item, depth)
+                for idx, item in enumerate(node):
+                    walk(item, depth, path + [idx])
 
-        walk(self.json2, 0)
+        walk(self.json2, 0, [])
 
     def extract_store_ids(self, animation_json: dict[str, Any]) -> list[int]:
         ids: set[int] = set()
@@ -666,6 +1280,210 @@ class JSONMergerLogic:
         walk(data)
         return mapping
 
+    def suggest_storeid_mapping(
+        self, source_ids: list[int] | None = None, min_score: float = 0.45, candidates_per_id: int = 8
+    ) -> dict[int, tuple[int, float]]:
+        if self.animation_clipboard is None:
+            raise ValueError("Nenhuma animação copiada")
+        source_project = self.animation_clipboard_project or 1
+        if source_ids is None:
+            source_ids = self.extract_store_ids(self.animation_clipboard)
+        source = self._mapping_features(source_project)
+        target = self._mapping_features(2)
+
+        # Índice invertido de bigramas: só pares que compartilham algum trecho do nome são pontuados
+        by_bigram: dict[str, list[int]] = {}
+        for tid, feature in target.items():
+            for gram in feature["bigrams"]:
+                by_bigram.setdefault(gram, []).append(tid)
+        scores: dict[tuple[int, int], float] = {}
+        for sid in source_ids:
+            feature = source.get(sid)
+            if feature is None:
+                continue
+            shared: dict[int, int] = {}
+            for gram in feature["bigrams"]:
+                for tid in by_bigram.get(gram, ()):
+                    shared[tid] = shared.get(tid, 0) + 1
+            # Só os melhores por bigramas recebem a pontuação completa, o que mantém o grafo esparso
+            size = len(feature["bigrams"])
+            ranked = sorted(shared, key=lambda tid: shared[tid] / (size + len(target[tid]["bigrams"])), reverse=True)
+            for tid in ranked[:candidates_per_id]:
+                score = self._mapping_score(feature, target[tid])
+                if score >= min_score:
+                    scores[(sid, tid)] = score
+        return self._assign_mapping(scores)
+
+    def _mapping_features(self, project: int) -> dict[int, dict[str, Any]]:
+        model = self.json1 if project == 1 else self.json2
+        names = self.storeid_name_map(project)
+        parents: dict[int, int] = {}
+        for parent_id, child_ids in self._storeid_children_map(model).items():
+            for child_id in child_ids:
+                parents.setdefault(child_id, parent_id)
+        depths: dict[int, int] = {}
+        for entry in self.model_hierarchy(project):
+            depths.setdefault(entry["storeID"], entry["depth"])
+
+        tokenized = {sid: self._name_tokens(name) for sid, name in names.items()}
+        # Tokens presentes na maioria dos nomes são prefixo/sufixo aplicados ao projeto inteiro
+        counts: dict[str, int] = {}
+        for _, tokens in tokenized.values():
+            for token in set(tokens):
+                counts[token] = counts.get(token, 0) + 1
+        affixes = {token for token, count in counts.items() if len(names) >= 4 and count > len(names) / 2}
+
+        features: dict[int, dict[str, Any]] = {}
+        for sid, (anti, tokens) in tokenized.items():
+            kept = [token for token in tokens if token not in affixes] or tokens
+            key = " ".join(kept)
+            features[sid] = {
+                "key": key,
+                "anti": anti,
+                "side": self._name_side(kept),
+                "bigrams": {key[i : i + 2] for i in range(len(key) - 1)} or {key},
+                "depth": depths.get(sid, 0),
+                "parent": parents.get(sid),
+            }
+        for feature in features.values():
+            parent = features.get(feature["parent"]) if feature["parent"] is not None else None
+            feature["parent_key"] = parent["key"] if parent else ""
+        return features
+
+    @staticmethod
+    def _name_tokens(name: str) -> tuple[bool, list[str]]:
+        text = re.sub(r"\s*\(\d+\)", "", name).strip()
+        anti = text.lower().startswith("anti_")
+        if anti:
+            text = text[len("anti_") :]
+        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text).lower()
+        return anti, [token for token in re.split(r"[\s_\-.]+", text) if token]
+
+    @staticmethod
+    def _name_side(tokens: list[str]) -> str | None:
+        for token in tokens:
+            if token in {"left", "l", "esquerda", "esquerdo", "esq"}:
+                return "left"
+            if token in {"right", "r", "direita", "direito", "dir"}:
+                return "right"
+        return None
+
+    @staticmethod
+    def _mapping_score(source: dict[str, Any], target: dict[str, Any]) -> float:
+        if source["key"] == target["key"]:
+            name_score = 1.0
+        else:
+            shared = len(source["bigrams"] & target["bigrams"])
+            name_score = 2 * shared / (len(source["bigrams"]) + len(target["bigrams"]))
+        depth_score = 1 / (1 + abs(source["depth"] - target["depth"]))
+        if source["parent_key"] == target["parent_key"]:
+            parent_score = 1.0
+        elif source["parent_key"] and target["parent_key"]:
+            parent_score = 0.5 if source["parent_key"].split()[-1] == target["parent_key"].split()[-1] else 0.0
+        else:
+            parent_score = 0.0
+        score = 0.6 * name_score + 0.15 * depth_score + 0.15 * parent_score
+        score += 0.1 if source["anti"] == target["anti"] else 0.0
+        if source["side"] != target["side"]:
+            score *= 0.3
+        return score
+
+    @staticmethod
+    def _assign_mapping(scores: dict[tuple[int, int], float]) -> dict[int, tuple[int, float]]:
+        result: dict[int, tuple[int, float]] = {}
+        best_source: dict[int, tuple[float, int]] = {}
+        best_target: dict[int, tuple[float, int]] = {}
+        for (sid, tid), score in scores.items():
+            if score > best_source.get(sid, (-1.0, 0))[0]:
+                best_source[sid] = (score, tid)
+            if score > best_target.get(tid, (-1.0, 0))[0]:
+                best_target[tid] = (score, sid)
+        # Pares que se escolhem mutuamente com nota quase máxima não precisam passar pela otimização
+        for sid, (score, tid) in best_source.items():
+            if score >= 0.95 and best_target[tid][1] == sid:
+                result[sid] = (tid, score)
+        taken = {tid for tid, _ in result.values()}
+        scores = {pair: score for pair, score in scores.items() if pair[0] not in result and pair[1] not in taken}
+
+        # Componentes conexos do grafo de candidatos resolvidos separadamente pelo algoritmo húngaro
+        parent: dict[Any, Any] = {}
+
+        def find(item: Any) -> Any:
+            parent.setdefault(item, item)
+            while parent[item] != item:
+                parent[item] = parent[parent[item]]
+                item = parent[item]
+            return item
+
+        for sid, tid in scores:
+            parent[find(("s", sid))] = find(("t", tid))
+        components: dict[Any, list[tuple[int, int]]] = {}
+        for pair in scores:
+            components.setdefault(find(("s", pair[0])), []).append(pair)
+
+        for pairs in components.values():
+            rows = sorted({sid for sid, _ in pairs})
+            cols = sorted({tid for _, tid in pairs})
+            transpose = len(rows) > len(cols)
+            if transpose:
+                rows, cols = cols, rows
+            cost = [
+                [1.0 - scores.get((col, row) if transpose else (row, col), 0.0) for col in cols]
+                for row in rows
+            ]
+            for row_idx, col_idx in JSONMergerLogic._hungarian(cost):
+                sid, tid = (cols[col_idx], rows[row_idx]) if transpose else (rows[row_idx], cols[col_idx])
+                score = scores.get((sid, tid))
+                if score is not None:
+                    result[sid] = (tid, score)
+        return result
+
+    @staticmethod
+    def _hungarian(cost: list[list[float]]) -> list[tuple[int, int]]:
+        # Atribuição de custo mínimo para n linhas <= m colunas, O(n²·m) com potenciais
+        n = len(cost)
+        m = len(cost[0]) if n else 0
+        inf = float("inf")
+        u = [0.0] * (n + 1)
+        v = [0.0] * (m + 1)
+        match = [0] * (m + 1)
+        way = [0] * (m + 1)
+        for i in range(1, n + 1):
+            match[0] = i
+            j0 = 0
+            minv = [inf] * (m + 1)
+            used = [False] * (m + 1)
+            while True:
+                used[j0] = True
+                i0 = match[j0]
+                row = cost[i0 - 1]
+                delta = inf
+                j1 = 0
+                for j in range(1, m + 1):
+                    if used[j]:
+                        continue
+                    current = row[j - 1] - u[i0] - v[j]
+                    if current < minv[j]:
+                        minv[j] = current
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+                for j in range(m + 1):
+                    if used[j]:
+                        u[match[j]] += delta
+                        v[j] -= delta
+                    else:
+                        minv[j] -= delta
+                j0 = j1
+                if match[j0] == 0:
+                    break
+            while j0:
+                j1 = way[j0]
+                match[j0] = match[j1]
+                j0 = j1
+        return [(match[j] - 1, j - 1) for j in range(1, m + 1) if match[j]]
+
     def _read_config_from_archive(self, path: str) -> str:
         with zipfile.ZipFile(path, "r") as archive:
             names = [n for n in archive.namelist() if n.lower().endswith("config.json")]
@@ -674,6 +1492,15 @@ class JSONMergerLogic:
             raw = archive.read(names[0])
             return self._decode_bytes(raw)
 
+    def _parse_json(self, raw: bytes) -> Any:
+        self.io_counters["bytes_parsed"] += len(raw)
+        return json.loads(self._decode_bytes(raw))
+
+    def _encode_json(self, data: Any) -> bytes:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        self.io_counters["bytes_serialized"] += len(encoded)
+        return encoded
+
     @staticmethod
     def _decode_bytes(raw: bytes) -> str:
         try:
@@ -746,14 +1573,17 @@ class JSONMergerLogic:
     ) -> None:
         parent_obj = parent_ref["obj"]
         parent_children = self._ensure_children(parent_obj)
+        self._emit_node_event("attribute_changed", parent_obj, key="children")
         for child in child_refs:
             self._move_to_children(parent_children, child)
         anti_parent_children = self._ensure_children(child_refs[0]["obj"])
+        self._emit_node_event("attribute_changed", child_refs[0]["obj"], key="children")
         self._move_to_children(anti_parent_children, anti_child_ref)
 
     def _move_to_children(self, target_children: list, child_ref: dict[str, Any]) -> None:
         child_obj = child_ref["obj"]
         parent_list = child_ref["parent_list"]
+        from_path = self._path_of(self.json2, child_obj) if self._listeners else None
         try:
             if parent_list is not target_children and child_obj in parent_list:
                 parent_list.remove(child_obj)
@@ -762,6 +1592,10 @@ class JSONMergerLogic:
         if child_obj not in target_children:
             target_children.append(child_obj)
         child_ref["parent_list"] = target_children
+        if from_path is not None:
+            to_path = self._path_of(self.json2, child_obj)
+            if to_path is not None and to_path != from_path:
+                self._emit("node_moved", project=2, from_path=from_path, to_path=to_path)
 
     @staticmethod
     def _set_y_size(element: Any, value: int | float) -> None:
@@ -959,9 +1793,35 @@ class JSONMergerLogic:
             raise ValueError("Animação sem frames")
         return anim, frames
 
-    def _write_animation(self, project: int, path: str, anim: dict[str, Any]) -> None:
+    @staticmethod
+    def _animation_member(name: str) -> str:
+        filename = name if name.lower().endswith(".json") else f"{name}.json"
+        return filename if filename.startswith("animations/") else f"animations/{filename}"
+
+    def _store_animation(
+        self,
+        project: int,
+        path: str,
+        anim: dict[str, Any],
+        new_name: str | None = None,
+        encoded: bytes | None = None,
+        **frame_change: Any,
+    ) -> str:
+        # Grava no lugar (com a mudança de frames para a timeline, se houver) ou num membro novo, que
+        # também leva o nome novo dentro do JSON; devolve o caminho gravado. `encoded` reaproveita os
+        # bytes de `anim` já serializados por quem chamou (só valem para a gravação no lugar)
         archive = self.project1_archive if project == 1 else self.project2_archive
-        archive[path] = json.dumps(anim, indent=2, ensure_ascii=False).encode("utf-8")
+        target_path = self._animation_member(new_name) if new_name else path
+        if target_path != path:
+            anim["name"] = target_path.split("/")[-1].replace(".json", "")
+            frame_change = {}
+            encoded = None
+        change = "updated" if target_path in archive else "added"
+        archive[target_path] = encoded if encoded is not None else self._encode_json(anim)
+        if frame_change and isinstance(anim.get("frames"), list):
+            frame_change["frames"] = anim["frames"]
+        self._emit("animation_changed", project=project, path=target_path, change=change, **frame_change)
+        return target_path
 
     def _component_with_defaults(
         self, project: int, store_id: int, source_component: dict[str, Any] | None = None
@@ -1024,82 +1884,6 @@ class JSONMergerLogic:
         collect(store_id)
         return result
 
-    @staticmethod
-    def _apply_transform_to_node(node: dict[str, Any], comp: dict[str, Any]) -> None:
-        if not isinstance(node, dict):
-            return
-        if "pos" in comp and isinstance(comp["pos"], (dict, list)):
-            node["pos"] = JSONMergerLogic._sum_vectors(node.get("pos"), comp["pos"])
-        if "rotation" in comp and isinstance(comp["rotation"], (dict, list)):
-            node["rotation"] = JSONMergerLogic._sum_vectors(
-                node.get("rotation"), comp["rotation"]
-            )
-
-    @staticmethod
-    def _sum_vectors(base: Any, delta: Any) -> Any:
-        def _as_dict(vec: Any) -> dict[str, float] | None:
-            if isinstance(vec, dict):
-                return {
-                    k: float(v)
-                    for k, v in vec.items()
-                    if k in {"x", "y", "z", "X", "Y", "Z"} and isinstance(v, (int, float))
-                }
-            if isinstance(vec, list) and len(vec) >= 3:
-                return {"x": float(vec[0]), "y": float(vec[1]), "z": float(vec[2])}
-            return None
-
-        base_dict = _as_dict(base) or {"x": 0.0, "y": 0.0, "z": 0.0}
-        delta_dict = _as_dict(delta) or {"x": 0.0, "y": 0.0, "z": 0.0}
-        result = {
-            "x": base_dict.get("x", 0.0) + delta_dict.get("x", 0.0),
-            "y": base_dict.get("y", 0.0) + delta_dict.get("y", 0.0),
-            "z": base_dict.get("z", 0.0) + delta_dict.get("z", 0.0),
-        }
-        return result
-
-    @staticmethod
-    def _subtract_vectors(base: Any, delta: Any) -> Any:
-        def _as_dict(vec: Any) -> dict[str, float] | None:
-            if isinstance(vec, dict):
-                return {
-                    k: float(v)
-                    for k, v in vec.items()
-                    if k in {"x", "y", "z", "X", "Y", "Z"} and isinstance(v, (int, float))
-                }
-            if isinstance(vec, list) and len(vec) >= 3:
-                return {"x": float(vec[0]), "y": float(vec[1]), "z": float(vec[2])}
-            return None
-
-        base_dict = _as_dict(base) or {"x": 0.0, "y": 0.0, "z": 0.0}
-        delta_dict = _as_dict(delta) or {"x": 0.0, "y": 0.0, "z": 0.0}
-        result = {
-            "x": base_dict.get("x", 0.0) - delta_dict.get("x", 0.0),
-            "y": base_dict.get("y", 0.0) - delta_dict.get("y", 0.0),
-            "z": base_dict.get("z", 0.0) - delta_dict.get("z", 0.0),
-        }
-        return result
-
-    @staticmethod
-    def _lerp_vectors(start: Any, end: Any, t: float) -> dict[str, float]:
-        def _as_dict(vec: Any) -> dict[str, float]:
-            if isinstance(vec, dict):
-                return {
-                    key.lower(): float(val)
-                    for key, val in vec.items()
-                    if key.lower() in {"x", "y", "z"} and isinstance(val, (int, float))
-                }
-            if isinstance(vec, list) and len(vec) >= 3:
-                return {"x": float(vec[0]), "y": float(vec[1]), "z": float(vec[2])}
-            return {"x": 0.0, "y": 0.0, "z": 0.0}
-
-        s = _as_dict(start)
-        e = _as_dict(end)
-        return {
-            "x": s.get("x", 0.0) + (e.get("x", 0.0) - s.get("x", 0.0)) * t,
-            "y": s.get("y", 0.0) + (e.get("y", 0.0) - s.get("y", 0.0)) * t,
-            "z": s.get("z", 0.0) + (e.get("z", 0.0) - s.get("z", 0.0)) * t,
-        }
-
     @staticmethod
     def _extract_uv(element: dict[str, Any]) -> tuple[float, float] | None:
         if "uv" in element:
@@ -1126,6 +1910,104 @@ class JSONMergerLogic:
                 return float(x), float(y), float(z)
         return None
 
+    def _emit(self, event: str, **payload: Any) -> None:
+        if event != "animation_changed":
+            self._invalidate_model_cache(payload.get("project", 2))
+            if event != "project_replaced":
+                self._model_dirty.add(payload.get("project", 2))
+        for listener in list(self._listeners):
+            try:
+                listener(event, payload)
+            except Exception as exc:  # noqa: BLE001
+                # Um ouvinte quebrado não impede os outros, mas a falha precisa aparecer: a árvore ou a
+                # timeline daquele ouvinte ficou fora de sincronia
+                print(f"Erro no ouvinte do evento {event}:", file=sys.stderr)
+                traceback.print_exc()
+                if self.listener_error is not None:
+                    self.listener_error(event, exc)
+
+    def _emit_node_event(self, event: str, node: Any, **payload: Any) -> None:
+        if not self._listeners:
+            self._invalidate_model_cache(2)
+            self._model_dirty.add(2)
+            return
+        path = self._path_of(self.json2, node)
+        if path is not None:
+            self._emit(event, project=2, path=path, **payload)
+
+    @staticmethod
+    def _path_of(data: Any, target: Any) -> List[int | str] | None:
+        def walk(node: Any, path: List[int | str]) -> List[int | str] | None:
+            if node is target:
+                return path
+            if isinstance(node, dict):
+                items: Any = node.items()
+            elif isinstance(node, list):
+                items = enumerate(node)
+            else:
+                return None
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    found = walk(value, path + [key])
+                    if found is not None:
+                        return found
+            return None
+
+        return walk(data, [])
+
+    @staticmethod
+    def _node_paths(data: Any) -> dict[int, List[int | str]]:
+        result: dict[int, List[int | str]] = {}
+
+        def walk(node: Any, path: List[int | str]) -> None:
+            if isinstance(node, dict):
+                result[id(node)] = path
+                for key, value in node.items():
+                    walk(value, path + [key])
+            elif isinstance(node, list):
+                for idx, item in enumerate(node):
+                    walk(item, path + [idx])
+
+        walk(data, [])
+        return result
+
+    def _report_progress(self, done: int, total: int) -> None:
+        # Sem try: o gancho pode levantar uma exceção para cancelar a operação em andamento
+        if self.progress_hook is not None:
+            self.progress_hook(done, total)
+
+    def _read_archive(self, path: str) -> dict[str, bytes]:
+        with zipfile.ZipFile(path, "r") as archive:
+            names = archive.namelist()
+            members: dict[str, bytes] = {}
+            for index, name in enumerate(names):
+                self._report_progress(index, len(names))
+                members[name] = archive.read(name)
+        return members
+
+    def _write_archive(self, path: str) -> None:
+        # Grava num arquivo temporário e troca no fim, para um erro ou cancelamento não corromper o projeto
+        temp_path = f"{path}.tmp"
+        items = list(self.project2_archive.items())
+        written: dict[str, bytes] = {}
+        try:
+            with zipfile.ZipFile(temp_path, "w") as archive:
+                for index, (name, data) in enumerate(items):
+                    self._report_progress(index, len(items))
+                    if name.lower().endswith("config.json"):
+                        data = self._encode_json(self.json2)
+                    archive.writestr(name, data)
+                    written[name] = data
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        # O que acabou de ir para o disco vira a nova base da sincronização
+        self.project2_archive.update(written)
+        self._disk_members[2] = written
+        self._model_dirty.discard(2)
+
     @staticmethod
     def _call_debug(debug_hook: Optional[Callable[[str], None]], step: str) -> None:
         if debug_hook is None:
@@ -1134,3 +2016,9 @@ class JSONMergerLogic:
             debug_hook(step)
         except Exception:
             pass
+
+
+if __name__ == "__main__":
+    from cli import main
+
+    sys.exit(main())
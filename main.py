@@ -1,5 +1,9 @@
-from main_window import run_app
+import time
+
+_STARTED_AT = time.perf_counter()
+
+from main_window import run_app  # noqa: E402
 
 
 if __name__ == "__main__":
-    run_app()
+    run_app(_STARTED_AT)
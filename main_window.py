@@ -1,9 +1,20 @@
+import argparse
+import os
 import sys
-from typing import Callable, List
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Callable, List
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from json_merger import JSONMergerLogic
+from profiler import Profiler
+from project_tree import ProjectTreeView
+from tasks import TaskRunner
+
+if TYPE_CHECKING:
+    from project_watch import ProjectWatcher
+    from uv_atlas import TextureCache, UVAtlasView
 
 
 class StatusMixin:
@@ -27,13 +38,21 @@ class StatusMixin:
 
 class OptionsDialog(QtWidgets.QDialog):
     def __init__(
-        self, parent: QtWidgets.QWidget, elements_only: bool, dark_mode: bool, show_colors: bool
+        self,
+        parent: QtWidgets.QWidget,
+        elements_only: bool,
+        dark_mode: bool,
+        show_colors: bool,
+        profiling: bool = False,
+        watching: bool = False,
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Opções")
         self.elements_only = elements_only
         self.dark_mode = dark_mode
         self.show_colors = show_colors
+        self.profiling = profiling
+        self.watching = watching
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -50,6 +69,31 @@ class OptionsDialog(QtWidgets.QDialog):
         self.chk_colors.setChecked(self.show_colors)
         layout.addWidget(self.chk_colors)
 
+        self.chk_watch = QtWidgets.QCheckBox("Sincronizar com alterações feitas fora do editor")
+        self.chk_watch.setToolTip("Recarrega só os membros do .cpmproject que o modelador regravou")
+        self.chk_watch.setChecked(self.watching)
+        layout.addWidget(self.chk_watch)
+
+        profile_row = QtWidgets.QHBoxLayout()
+        self.chk_profile = QtWidgets.QCheckBox("Medir tempo das operações")
+        self.chk_profile.setChecked(self.profiling)
+        profile_row.addWidget(self.chk_profile)
+        btn_trace = QtWidgets.QPushButton("Exportar trace...")
+        btn_trace.setToolTip("Salvar as medições em JSON (chrome://tracing ou ui.perfetto.dev)")
+        btn_trace.clicked.connect(self._export_trace)
+        profile_row.addWidget(btn_trace)
+        layout.addLayout(profile_row)
+
+        memory_row = QtWidgets.QHBoxLayout()
+        self.chk_tracemalloc = QtWidgets.QCheckBox("Rastrear alocações (tracemalloc)")
+        self.chk_tracemalloc.setToolTip("Deixa as operações mais lentas enquanto ativo")
+        self.chk_tracemalloc.setChecked(tracemalloc.is_tracing())
+        memory_row.addWidget(self.chk_tracemalloc)
+        btn_memory = QtWidgets.QPushButton("Relatório de memória...")
+        btn_memory.clicked.connect(self._open_memory_report)
+        memory_row.addWidget(btn_memory)
+        layout.addLayout(memory_row)
+
         buttons = QtWidgets.QHBoxLayout()
         ok_btn = QtWidgets.QPushButton("OK")
         ok_btn.clicked.connect(self.accept)
@@ -64,8 +108,21 @@ class OptionsDialog(QtWidgets.QDialog):
             "elements_only": self.chk_elements.isChecked(),
             "dark_mode": self.chk_dark.isChecked(),
             "show_colors": self.chk_colors.isChecked(),
+            "profiling": self.chk_profile.isChecked(),
+            "tracemalloc": self.chk_tracemalloc.isChecked(),
+            "watch": self.chk_watch.isChecked(),
         }
 
+    def _export_trace(self) -> None:
+        parent = self.parent()
+        if isinstance(parent, JSONMergerWindow):
+            parent.export_profile_trace()
+
+    def _open_memory_report(self) -> None:
+        parent = self.parent()
+        if isinstance(parent, JSONMergerWindow):
+            parent.open_memory_report()
+
 
 class CopyTransformDialog(QtWidgets.QDialog):
     def __init__(self, parent: QtWidgets.QWidget, frame_count: int, current_frame: int) -> None:
@@ -108,17 +165,47 @@ class CopyTransformDialog(QtWidgets.QDialog):
 
 
 class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
+    # Métodos auxiliares chamados em laços ficariam só ruído no trace
+    PROFILE_SKIP = {
+        "subscribe",
+        "unsubscribe",
+        "snapshot",
+        "adopt",
+        "get_by_path",
+        "remove_by_path",
+        "compute_uv_bbox",
+        "face_uv_rects",
+        "extract_store_ids",
+    }
+
+    profile_recorded = QtCore.pyqtSignal(str, float, object)
+
     def __init__(self) -> None:
         super().__init__()
         self.logic = JSONMergerLogic()
-        self.search_results: list[QtWidgets.QTreeWidgetItem] = []
+        self.search_results: list[tuple[List[int | str], bool]] = []
         self.search_index = 0
         self.last_search_scope: str | None = None
         self.show_only_elements = True
         self.dark_mode_enabled = False
         self.show_element_colors = False
         self.current_animation: tuple[int, str, str] | None = None
+        self._animation_tab_ready = False
+        self._texture_cache: "TextureCache | None" = None
+        self._project_watcher: "ProjectWatcher | None" = None
+        self._pending_sync: set[int] = set()
+        self._frame_modified_sets: list[frozenset[int] | None] | None = None
+        self.profiler = Profiler()
+        # Pode ser chamado da thread das tarefas: o sinal entrega na thread da UI
+        self.profiler.on_record = self.profile_recorded.emit
+        self.profile_recorded.connect(self._show_profile)
         self._setup_ui()
+        self.logic.subscribe(self._on_logic_event)
+        self.logic.listener_error = lambda event, exc: self._notify(
+            f"Falha ao atualizar a interface ({event}): {exc}; recarregue o projeto se algo parecer errado", "error"
+        )
+        self.tasks = TaskRunner(self.logic, self)
+        self._setup_task_status()
         self.statusBar().showMessage("Pronto")
 
     def _setup_ui(self) -> None:
@@ -182,6 +269,7 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
 
         tools_row.addWidget(self._create_tool_button("🔍", "Pesquisar", self.open_search_dialog))
         tools_row.addWidget(self._create_tool_button("✥", "Mover textura / Ajustar UV", self.open_uv_dialog))
+        tools_row.addWidget(self._create_tool_button("🧩", "Analisar UV", self.open_uv_analysis_dialog))
         tools_row.addWidget(self._create_tool_button("📄", "Copiar", self.copy_element))
         tools_row.addWidget(self._create_tool_button("📋", "Colar", self.paste_element))
         tools_row.addWidget(self._create_tool_button("+Movment", "Gerar hierarquia +Movment", self.open_movement_dialog))
@@ -196,8 +284,7 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         left_panel = QtWidgets.QWidget()
         left_layout = QtWidgets.QVBoxLayout(left_panel)
         left_layout.addWidget(QtWidgets.QLabel("JSON 1"))
-        self.tree1 = QtWidgets.QTreeWidget()
-        self.tree1.setHeaderHidden(True)
+        self.tree1 = ProjectTreeView()
         self.tree1.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree1.customContextMenuRequested.connect(
             lambda pos: self._show_context_menu(self.tree1, pos)
@@ -208,8 +295,7 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         right_panel = QtWidgets.QWidget()
         right_layout = QtWidgets.QVBoxLayout(right_panel)
         right_layout.addWidget(QtWidgets.QLabel("JSON 2"))
-        self.tree2 = QtWidgets.QTreeWidget()
-        self.tree2.setHeaderHidden(True)
+        self.tree2 = ProjectTreeView()
         self.tree2.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree2.customContextMenuRequested.connect(
             lambda pos: self._show_context_menu(self.tree2, pos)
@@ -222,9 +308,25 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
 
         self.tabs.addTab(models_tab, "Modelos")
 
-        # ----- Aba de Animações
-        animations_tab = QtWidgets.QWidget()
-        anim_layout = QtWidgets.QVBoxLayout(animations_tab)
+        # ----- Aba de Animações (montada sob demanda)
+        self.animations_tab = QtWidgets.QWidget()
+        self.tabs.addTab(self.animations_tab, "Animações")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        self.setCentralWidget(central)
+
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self.animations_tab:
+            self._ensure_animation_tab()
+
+    def _ensure_animation_tab(self) -> None:
+        # A aba de animações só é montada na primeira vez que é aberta
+        if self._animation_tab_ready:
+            return
+        self._animation_tab_ready = True
+        from timeline import FrameElementsTree, TimelineView
+
+        anim_layout = QtWidgets.QVBoxLayout(self.animations_tab)
 
         anim_buttons = QtWidgets.QHBoxLayout()
         anim_buttons.setSpacing(4)
@@ -241,6 +343,18 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         anim_buttons.addWidget(
             self._create_tool_button("📈", "Interpolar frames", self.interpolate_animation_frames)
         )
+        anim_buttons.addWidget(
+            self._create_tool_button("🗜", "Reduzir keyframes", self.reduce_animation_keyframes)
+        )
+        anim_buttons.addWidget(
+            self._create_tool_button("⏱", "Reamostrar animações", self.resample_animations)
+        )
+        anim_buttons.addWidget(
+            self._create_tool_button("🪞", "Espelhar animação (esquerda/direita)", self.mirror_animation)
+        )
+        anim_buttons.addWidget(
+            self._create_tool_button("🥞", "Misturar animações em camadas", self.blend_animations)
+        )
         anim_buttons.addStretch(1)
 
         anim_layout.addLayout(anim_buttons)
@@ -308,23 +422,15 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         controls.addStretch(1)
         left_timeline_layout.addLayout(controls)
 
-        self.timeline_list = QtWidgets.QListWidget()
-        self.timeline_list.setFlow(QtWidgets.QListView.Flow.LeftToRight)
-        self.timeline_list.setWrapping(True)
-        self.timeline_list.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
-        self.timeline_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.timeline_list.currentItemChanged.connect(self._update_frame_details)
+        self.timeline_list = TimelineView()
+        self.timeline_list.selectionModel().currentChanged.connect(self._update_frame_details)
         left_timeline_layout.addWidget(self.timeline_list)
 
         details_box = QtWidgets.QGroupBox("Elementos modificados no frame")
         details_layout = QtWidgets.QVBoxLayout(details_box)
         self.frame_elements_label = QtWidgets.QLabel("Selecione um frame para ver os elementos")
         details_layout.addWidget(self.frame_elements_label)
-        self.frame_elements_tree = QtWidgets.QTreeWidget()
-        self.frame_elements_tree.setHeaderHidden(True)
-        self.frame_elements_tree.setSelectionMode(
-            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
-        )
+        self.frame_elements_tree = FrameElementsTree()
         details_layout.addWidget(self.frame_elements_tree)
 
         timeline_split.addWidget(left_timeline_panel)
@@ -335,10 +441,185 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         timeline_layout.addWidget(timeline_split)
 
         anim_layout.addWidget(timeline_box)
+        self._refresh_animation_lists()
+
+    @property
+    def texture_cache(self) -> "TextureCache":
+        # Ferramentas de textura só são importadas quando algum diálogo de UV é aberto
+        if self._texture_cache is None:
+            from uv_atlas import TextureCache
+
+            self._texture_cache = TextureCache()
+        return self._texture_cache
+
+    def _setup_task_status(self) -> None:
+        self.task_progress = QtWidgets.QProgressBar()
+        self.task_progress.setMaximumWidth(160)
+        self.task_progress.setTextVisible(False)
+        self.task_progress.hide()
+        self.statusBar().addPermanentWidget(self.task_progress)
+        self.btn_cancel_task = QtWidgets.QToolButton()
+        self.btn_cancel_task.setText("✖")
+        self.btn_cancel_task.setToolTip("Cancelar operação")
+        self.btn_cancel_task.clicked.connect(self.tasks.cancel)
+        self.btn_cancel_task.hide()
+        self.statusBar().addPermanentWidget(self.btn_cancel_task)
+        self.tasks.started.connect(self._on_task_started)
+        self.tasks.progress.connect(self._on_task_progress)
+        self.tasks.finished.connect(self._on_task_finished)
+        self.profile_label = QtWidgets.QLabel()
+        self.profile_label.hide()
+        self.statusBar().addPermanentWidget(self.profile_label)
+
+    def set_profiling(self, enabled: bool) -> None:
+        self.profiler.enabled = enabled
+        self.profiler.uninstrument()
+        if enabled:
+            self._instrument_logic(self.logic)
+        self.profile_label.setVisible(enabled)
+        self.profile_label.clear()
+
+    def _instrument_logic(self, logic: JSONMergerLogic, remember: bool = True) -> None:
+        names = [
+            name
+            for name in dir(JSONMergerLogic)
+            if not name.startswith("_") and name not in self.PROFILE_SKIP
+        ]
+        self.profiler.instrument(
+            logic,
+            names,
+            "logic",
+            sizer=self._profile_result_size,
+            counters=lambda: dict(logic.io_counters),
+            remember=remember,
+        )
 
-        self.tabs.addTab(animations_tab, "Animações")
+    @staticmethod
+    def _profile_result_size(result: object, info: dict[str, object]) -> None:
+        if isinstance(result, (list, dict)):
+            info["items"] = len(result)
 
-        self.setCentralWidget(central)
+    def _show_profile(self, name: str, duration: float, args: object) -> None:
+        details = ""
+        if isinstance(args, dict) and args:
+            details = " (" + ", ".join(f"{key}={value}" for key, value in args.items()) + ")"
+        self.profile_label.setText(f"⏱ {name}: {duration * 1000:.1f} ms{details}")
+
+    def export_profile_trace(self) -> None:
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Exportar trace", "cpm_trace.json", filter="Chrome trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            count = self.profiler.export_chrome_trace(path)
+        except OSError as exc:
+            self._notify(f"Falha ao exportar trace: {exc}", "error")
+            return
+        self._notify(f"Trace exportado com {count} evento(s)", "success")
+
+    def _run_task(
+        self,
+        label: str,
+        operation: Callable[[JSONMergerLogic], object],
+        success_message: str,
+        error_prefix: str,
+        on_success: Callable[[object], None] | None = None,
+        copy_model: bool = True,
+    ) -> None:
+        def succeeded(result: object) -> None:
+            if on_success:
+                on_success(result)
+            self._notify(success_message, "success")
+
+        def failed(exc: Exception) -> None:
+            self._notify(f"{error_prefix}: {exc}", "error")
+
+        def timed(logic: JSONMergerLogic) -> object:
+            # A tarefa roda numa cópia da lógica, que precisa ser instrumentada à parte
+            if not self.profiler.enabled:
+                return operation(logic)
+            self._instrument_logic(logic, remember=False)
+            timed_operation = self.profiler.wrap(
+                operation, f"task.{label}", counters=lambda: dict(logic.io_counters)
+            )
+            return timed_operation(logic)
+
+        if not self.tasks.run(label, timed, succeeded, failed, copy_model=copy_model):
+            self._notify("Aguarde a operação em andamento terminar", "warning")
+
+    def _on_task_started(self, label: str) -> None:
+        # A edição fica travada enquanto a cópia da lógica trabalha em segundo plano
+        self.centralWidget().setEnabled(False)
+        self.task_progress.setRange(0, 0)
+        self.task_progress.show()
+        self.btn_cancel_task.show()
+        self.statusBar().setStyleSheet("")
+        self.statusBar().showMessage(f"{label}...")
+
+    def _on_task_progress(self, label: str, done: int, total: int) -> None:
+        self.task_progress.setRange(0, max(total, 1))
+        self.task_progress.setValue(done)
+        self.statusBar().showMessage(f"{label}... {done}/{total}")
+
+    def _on_task_finished(self, label: str) -> None:
+        self.centralWidget().setEnabled(True)
+        self.task_progress.hide()
+        self.btn_cancel_task.hide()
+        if self.tasks.was_cancelled():
+            self._notify(f"{label} cancelado, nada foi alterado", "warning")
+        if self._project_watcher is not None:
+            # Carregar ou "Salvar como" pode ter trocado os arquivos observados
+            QtCore.QTimer.singleShot(0, self._update_watch_paths)
+
+    def set_watching(self, enabled: bool) -> None:
+        if not enabled:
+            if self._project_watcher is not None:
+                self._project_watcher.stop()
+                self._project_watcher.deleteLater()
+            self._project_watcher = None
+            self._pending_sync.clear()
+            return
+        if self._project_watcher is None:
+            from project_watch import ProjectWatcher
+
+            self._project_watcher = ProjectWatcher(self)
+            self._project_watcher.changed.connect(self._on_external_change)
+        self._update_watch_paths()
+
+    def _update_watch_paths(self) -> None:
+        watcher = self._project_watcher
+        if watcher is None:
+            return
+        paths = {1: self.logic.project1_path, 2: self.logic.project2_path}
+        wanted = {project: os.path.abspath(path) for project, path in paths.items() if path}
+        if watcher.paths() != wanted:
+            watcher.set_paths(paths)
+        for project in sorted(self._pending_sync):
+            self._on_external_change(project)
+
+    def _on_external_change(self, project: int) -> None:
+        # Com uma tarefa rodando, a cópia da lógica seria adotada por cima: sincroniza depois
+        if self.tasks.is_busy():
+            self._pending_sync.add(project)
+            return
+        self._pending_sync.discard(project)
+        try:
+            result = self.logic.sync_from_disk(project, resolve="local")
+        except Exception as exc:  # noqa: BLE001
+            self._notify(f"Projeto {project} mudou no disco, mas não deu para ler: {exc}", "warning")
+            return
+        if result["kept"]:
+            self._notify(
+                f"Projeto {project} alterado fora do editor em {', '.join(result['kept'])}, que também tem "
+                "alterações aqui: mantidas as locais (⟳ recarrega tudo do disco)",
+                "warning",
+            )
+        elif result["reloaded"]:
+            self._notify(
+                f"Projeto {project} alterado fora do editor: {len(result['reloaded'])} membro(s) recarregado(s)",
+                "info",
+            )
 
     def load_project1(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -346,15 +627,14 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         )
         if not path:
             return
-        try:
-            self.logic.load_project1(path)
-            self._build_tree(self.tree1, self.logic.json1)
-            self._refresh_animation_lists()
-            self.clear_search()
-            self.logic.clear_clipboard()
-            self._notify("Projeto 1 carregado", "info")
-        except Exception as exc:  # noqa: BLE001
-            self._notify(f"Falha ao carregar Projeto 1: {exc}", "error")
+        self._run_task(
+            "Carregando Projeto 1",
+            lambda logic: logic.load_project1(path),
+            "Projeto 1 carregado",
+            "Falha ao carregar Projeto 1",
+            on_success=lambda _: self._after_project_load(),
+            copy_model=False,
+        )
 
     def load_project2(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -362,52 +642,77 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         )
         if not path:
             return
-        try:
-            self.logic.load_project2(path)
-            self._build_tree(self.tree2, self.logic.json2)
-            self._refresh_animation_lists()
-            self.clear_search()
-            self.logic.clear_clipboard()
-            self._notify("Projeto 2 carregado", "info")
-        except Exception as exc:  # noqa: BLE001
-            self._notify(f"Falha ao carregar Projeto 2: {exc}", "error")
+        self._run_task(
+            "Carregando Projeto 2",
+            lambda logic: logic.load_project2(path),
+            "Projeto 2 carregado",
+            "Falha ao carregar Projeto 2",
+            on_success=lambda _: self._after_project_load(),
+            copy_model=False,
+        )
 
-    def refresh_projects(self) -> None:
-        refreshed_any = False
-        try:
-            if self.logic.project1_path:
-                self.logic.load_project1(self.logic.project1_path)
-                self._build_tree(self.tree1, self.logic.json1)
-                refreshed_any = True
-        except Exception as exc:  # noqa: BLE001
-            self._notify(f"Falha ao recarregar Projeto 1: {exc}", "error")
+    def open_projects(self, project1: str | None, project2: str | None) -> None:
+        if not (project1 or project2):
             return
 
-        try:
-            if self.logic.project2_path:
-                self.logic.load_project2(self.logic.project2_path)
-                self._build_tree(self.tree2, self.logic.json2)
-                refreshed_any = True
-        except Exception as exc:  # noqa: BLE001
-            self._notify(f"Falha ao recarregar Projeto 2: {exc}", "error")
-            return
+        def load(logic: JSONMergerLogic) -> None:
+            for project, path, loader in ((1, project1, logic.load_project1), (2, project2, logic.load_project2)):
+                if not path:
+                    continue
+                try:
+                    loader(path)
+                except Exception as exc:  # noqa: BLE001
+                    raise ValueError(f"Projeto {project}: {exc}") from exc
+
+        self._run_task(
+            "Carregando projetos",
+            load,
+            "Projetos carregados",
+            "Falha ao carregar",
+            on_success=lambda _: self._after_project_load(),
+            copy_model=False,
+        )
 
-        if refreshed_any:
-            self._refresh_animation_lists()
-            self.clear_search()
-            self.logic.clear_clipboard()
-            self._notify("Projetos recarregados", "success")
-        else:
+    def _after_project_load(self) -> None:
+        self.clear_search()
+        self.logic.clear_clipboard()
+
+    def refresh_projects(self) -> None:
+        if not (self.logic.project1_path or self.logic.project2_path):
             self._notify("Carregue os projetos pelo menos uma vez antes de dar refresh", "warning")
+            return
+
+        def reload(logic: JSONMergerLogic) -> None:
+            for project, path, loader in (
+                (1, logic.project1_path, logic.load_project1),
+                (2, logic.project2_path, logic.load_project2),
+            ):
+                if not path:
+                    continue
+                try:
+                    loader(path)
+                except Exception as exc:  # noqa: BLE001
+                    raise ValueError(f"Projeto {project}: {exc}") from exc
+
+        self._run_task(
+            "Recarregando projetos",
+            reload,
+            "Projetos recarregados",
+            "Falha ao recarregar",
+            on_success=lambda _: self._after_project_load(),
+            copy_model=False,
+        )
 
     def save_project2(self) -> None:
-        try:
-            self.logic.save_project2()
-            self._notify("Projeto 2 atualizado com sucesso!", "success")
-        except Exception as exc:  # noqa: BLE001
-            self._notify(f"Falha ao salvar Projeto 2: {exc}", "error")
+        self._run_task(
+            "Salvando Projeto 2",
+            lambda logic: logic.save_project2(),
+            "Projeto 2 atualizado com sucesso!",
+            "Falha ao salvar Projeto 2",
+            copy_model=False,
+        )
 
-    def save_project2_as(self) -> None:
+    def save_project2_as(self, background: bool = True) -> None:
         default_dir = None
         if self.logic.project2_path:
             default_dir = str(QtCore.QFileInfo(self.logic.project2_path).absolutePath())
@@ -421,6 +726,15 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             return
         if not path.lower().endswith(".cpmproject"):
             path = f"{path}.cpmproject"
+        if background:
+            self._run_task(
+                "Salvando Projeto 2",
+                lambda logic: logic.save_project2_as(path),
+                "Projeto 2 salvo no novo local!",
+                "Falha ao salvar Projeto 2",
+                copy_model=False,
+            )
+            return
         try:
             self.logic.save_project2_as(path)
             self._notify("Projeto 2 salvo no novo local!", "success")
@@ -428,20 +742,18 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             self._notify(f"Falha ao salvar Projeto 2: {exc}", "error")
 
     def copy_element(self) -> None:
-        selected = self.tree1.currentItem()
-        if not selected:
+        path = self.tree1.current_path()
+        if path is None:
             self._notify("Selecione algo em JSON 1", "warning")
             return
-        path = self._item_path(selected)
         self.logic.copy_from_json1(path)
         self._notify("Elemento copiado do JSON 1", "info")
 
     def move_element(self) -> None:
-        selected = self.tree2.currentItem()
-        if not selected:
+        path = self.tree2.current_path()
+        if path is None:
             self._notify("Selecione algo em JSON 2 para mover", "warning")
             return
-        path = self._item_path(selected)
         self.logic.move_from_json2(path)
         self._notify("Elemento marcado para mover. Agora selecione destino e clique Colar", "info")
 
@@ -449,26 +761,22 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         if self.logic.clipboard is None:
             self._notify("Clipboard vazio", "warning")
             return
-        selected = self.tree2.currentItem()
-        if not selected:
+        dest_path = self.tree2.current_path()
+        if dest_path is None:
             self._notify("Selecione destino em JSON 2", "warning")
             return
-        dest_path = self._item_path(selected)
         try:
             self.logic.paste_to_json2(dest_path)
-            self._build_tree(self.tree2, self.logic.json2)
             self._notify("Elemento colado", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(f"Falha ao colar elemento: {exc}", "error")
 
     def shift_uv(self, du: int, dv: int) -> bool:
-        selected = self.tree2.currentItem()
-        if not selected:
+        path = self.tree2.current_path()
+        if path is None:
             self._notify("Selecione elemento em JSON 2 para ajustar UV", "warning")
             return False
-        element = self.logic.get_by_path(self.logic.json2, self._item_path(selected))
-        self.logic.adjust_uv(element, du, dv)
-        self._build_tree(self.tree2, self.logic.json2)
+        self.logic.adjust_uv_by_path(path, du, dv)
         self._notify(f"UV ajustado em dU={du}, dV={dv}", "success")
         return True
 
@@ -479,7 +787,9 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             return
         tree = self.tree1 if scope == "JSON 1" else self.tree2
         self.search_results = [
-            item for item in self._walk_items(tree) if query in item.text(0).lower()
+            (path, leaf)
+            for label, path, leaf in tree.source_model.iter_nodes(tree.elements_only)
+            if query in label.lower()
         ]
         if not self.search_results:
             self._notify("Nada encontrado", "info")
@@ -503,10 +813,8 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
 
     def _toggle_elements_only(self, state: bool) -> None:
         self.show_only_elements = state
-        if self.logic.json1:
-            self._build_tree(self.tree1, self.logic.json1)
-        if self.logic.json2:
-            self._build_tree(self.tree2, self.logic.json2)
+        self.tree1.set_elements_only(state)
+        self.tree2.set_elements_only(state)
 
     def _toggle_dark_mode(self, enabled: bool) -> None:
         self.dark_mode_enabled = enabled
@@ -547,7 +855,12 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
 
     def open_options_dialog(self) -> None:
         dialog = OptionsDialog(
-            self, self.show_only_elements, self.dark_mode_enabled, self.show_element_colors
+            self,
+            self.show_only_elements,
+            self.dark_mode_enabled,
+            self.show_element_colors,
+            self.profiler.enabled,
+            self._project_watcher is not None,
         )
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             opts = dialog.values()
@@ -557,137 +870,32 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
                 self._toggle_elements_only(opts["elements_only"])
             if opts["show_colors"] != self.show_element_colors:
                 self.show_element_colors = opts["show_colors"]
-                self._build_tree(self.tree1, self.logic.json1)
-                self._build_tree(self.tree2, self.logic.json2)
+                self.tree1.set_show_colors(self.show_element_colors)
+                self.tree2.set_show_colors(self.show_element_colors)
+            if opts["profiling"] != self.profiler.enabled:
+                self.set_profiling(opts["profiling"])
+            self.set_memory_tracing(opts["tracemalloc"])
+            if opts["watch"] != (self._project_watcher is not None):
+                self.set_watching(opts["watch"])
 
     def open_repo(self) -> None:
         QtGui.QDesktopServices.openUrl(QtCore.QUrl("https://github.com/eulertorres/CPM_editor"))
 
-    def _build_tree(self, tree: QtWidgets.QTreeWidget, data: object) -> None:
-        tree.clear()
-        root = QtWidgets.QTreeWidgetItem(["root"])
-        root.setData(0, QtCore.Qt.ItemDataRole.UserRole, [])
-        root.setForeground(0, QtGui.QBrush(QtGui.QColor("#5c5c5c")))
-        tree.addTopLevelItem(root)
-        if self.show_only_elements:
-            self._insert_elements_only(tree, root, data, [])
-        else:
-            self._insert_items(tree, root, data, [])
-        tree.expandItem(root)
-
-    def _color_from_namecolor(self, element: dict[str, object]) -> QtGui.QColor:
-        value = element.get("nameColor") if isinstance(element, dict) else None
-        color_val: int | None = None
-        if isinstance(value, int):
-            color_val = value
-        elif isinstance(value, str):
-            try:
-                color_val = int(value)
-            except ValueError:
-                color_val = None
-        if color_val is not None:
-            return QtGui.QColor(f"#{color_val:06x}")
-        return QtGui.QColor("#1b7fb3")
-
-    def _label_color(self, element: dict[str, object]) -> QtGui.QColor:
-        if self.show_element_colors:
-            return self._color_from_namecolor(element)
-        return QtGui.QColor("#7a7a7a")
-
-    def _insert_items(
-        self,
-        tree: QtWidgets.QTreeWidget,
-        parent: QtWidgets.QTreeWidgetItem,
-        value: object,
-        path: List[int | str],
-    ) -> None:
-        if isinstance(value, dict):
-            for key, val in value.items():
-                item = QtWidgets.QTreeWidgetItem([str(key)])
-                item.setData(0, QtCore.Qt.ItemDataRole.UserRole, path + [key])
-                color = self._label_color(val) if isinstance(val, dict) else QtGui.QColor("#7a7a7a")
-                item.setForeground(0, QtGui.QBrush(color))
-                parent.addChild(item)
-                self._insert_items(tree, item, val, path + [key])
-        elif isinstance(value, list):
-            for idx, element in enumerate(value):
-                if isinstance(element, dict):
-                    label = element.get("id") or element.get("name") or f"[{idx}]"
-                else:
-                    label = f"[{idx}]"
-                item = QtWidgets.QTreeWidgetItem([label])
-                item.setData(0, QtCore.Qt.ItemDataRole.UserRole, path + [idx])
-                if isinstance(element, dict):
-                    item.setForeground(0, QtGui.QBrush(self._label_color(element)))
-                    font = item.font(0)
-                    font.setBold(True)
-                    item.setFont(0, font)
-                else:
-                    item.setForeground(0, QtGui.QBrush(QtGui.QColor("#5c5c5c")))
-                parent.addChild(item)
-                self._insert_items(tree, item, element, path + [idx])
-        else:
-            item = QtWidgets.QTreeWidgetItem([repr(value)])
-            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, path)
-            item.setForeground(0, QtGui.QBrush(QtGui.QColor("#5c5c5c")))
-            parent.addChild(item)
+    def _build_tree(self, tree: ProjectTreeView, data: object) -> None:
+        with self.profiler.span("ui._build_tree") as info:
+            tree.set_project_data(data)
+            info["rows"] = tree.model().rowCount()
 
-    def _insert_elements_only(
-        self,
-        tree: QtWidgets.QTreeWidget,
-        parent: QtWidgets.QTreeWidgetItem,
-        value: object,
-        path: List[int | str],
-    ) -> None:
-        if isinstance(value, dict):
-            for key in ("children", "elements"):
-                val = value.get(key)
-                if isinstance(val, list):
-                    for idx, element in enumerate(val):
-                        if not isinstance(element, dict):
-                            continue
-                        label = element.get("id") or element.get("name") or f"[{idx}]"
-                        item = QtWidgets.QTreeWidgetItem([label])
-                        item.setData(0, QtCore.Qt.ItemDataRole.UserRole, path + [key, idx])
-                        item.setForeground(0, QtGui.QBrush(self._label_color(element)))
-                        font = item.font(0)
-                        font.setBold(True)
-                        item.setFont(0, font)
-                        parent.addChild(item)
-                        self._insert_elements_only(tree, item, element, path + [key, idx])
-        elif isinstance(value, list):
-            for idx, element in enumerate(value):
-                self._insert_elements_only(tree, parent, element, path + [idx])
-
-    def _highlight(self, tree: QtWidgets.QTreeWidget, item: QtWidgets.QTreeWidgetItem) -> None:
-        ancestor = item.parent()
-        while ancestor:
-            tree.expandItem(ancestor)
-            ancestor = ancestor.parent()
-        tree.setCurrentItem(item)
-        tree.scrollToItem(item)
+    def _highlight(self, tree: ProjectTreeView, result: tuple[List[int | str], bool]) -> None:
+        path, leaf = result
+        index = tree.index_for_path(path, leaf)
+        if index.isValid():
+            tree.reveal(index)
         self._notify(f"Resultado {self.search_index + 1} de {len(self.search_results)}", "info")
 
-    def _walk_items(self, tree: QtWidgets.QTreeWidget) -> List[QtWidgets.QTreeWidgetItem]:
-        def walk(parent: QtWidgets.QTreeWidgetItem) -> List[QtWidgets.QTreeWidgetItem]:
-            items: List[QtWidgets.QTreeWidgetItem] = []
-            for index in range(parent.childCount()):
-                child = parent.child(index)
-                items.append(child)
-                items.extend(walk(child))
-            return items
-
-        result: List[QtWidgets.QTreeWidgetItem] = []
-        for idx in range(tree.topLevelItemCount()):
-            top = tree.topLevelItem(idx)
-            result.append(top)
-            result.extend(walk(top))
-        return result
-
     def colorize_hierarchy(self) -> None:
         try:
             self.logic.apply_name_colors()
-            self._build_tree(self.tree2, self.logic.json2)
             self._notify("Cores aplicadas por hierarquia no config.json", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(f"Falha ao colorir: {exc}", "error")
@@ -717,7 +925,6 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             try:
                 self.logic.paste_animation_to_project2(mapping)
                 self._notify("Animação colada no Projeto 2", "success")
-                self._refresh_animation_lists()
             except Exception as exc:  # noqa: BLE001
                 self._notify(f"Falha ao colar animação: {exc}", "error")
 
@@ -729,11 +936,15 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             try:
                 project, path, frame_idx = dialog.selection()
-                self.logic.apply_frame_to_model(project, path, frame_idx)
-                self._build_tree(self.tree2, self.logic.json2)
-                self._notify("Frame aplicado ao modelo", "success")
             except Exception as exc:  # noqa: BLE001
                 self._notify(f"Falha ao aplicar frame: {exc}", "error")
+                return
+            self._run_task(
+                "Aplicando frame",
+                lambda logic: logic.apply_frame_to_model(project, path, frame_idx),
+                "Frame aplicado ao modelo",
+                "Falha ao aplicar frame",
+            )
 
     def interpolate_animation_frames(self) -> None:
         if not (self.logic.project1_archive or self.logic.project2_archive):
@@ -743,23 +954,201 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             try:
                 selection = dialog.selection()
-                self.logic.interpolate_frames(**selection)
-                self._refresh_animation_lists()
-                self._notify("Frames interpolados com sucesso", "success")
             except Exception as exc:  # noqa: BLE001
                 self._notify(f"Falha ao interpolar frames: {exc}", "error")
+                return
+            self._run_task(
+                "Interpolando frames",
+                lambda logic: logic.interpolate_frames(**selection),
+                "Frames interpolados com sucesso",
+                "Falha ao interpolar frames",
+                copy_model=False,
+            )
+
+    def reduce_animation_keyframes(self) -> None:
+        if not (self.logic.project1_archive or self.logic.project2_archive):
+            self._notify("Carregue algum projeto antes", "warning")
+            return
+        self._ensure_animation_tab()
+        previous = self.current_animation
+        dialog = KeyframeReductionDialog(self, self.logic)
+        accepted = dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted
+        if dialog.previewed:
+            # Volta a timeline para a animação real que estava aberta antes da prévia
+            self.current_animation = previous
+            self._load_timeline()
+        if not accepted:
+            return
+        project, path, tolerances = dialog.selection()
+        self._run_task(
+            "Reduzindo keyframes",
+            lambda logic: logic.reduce_keyframes(project, path, **tolerances),
+            "Keyframes reduzidos",
+            "Falha ao reduzir keyframes",
+            copy_model=False,
+        )
+
+    def resample_animations(self) -> None:
+        if not (self.logic.project1_archive or self.logic.project2_archive):
+            self._notify("Carregue algum projeto antes", "warning")
+            return
+        dialog = ResampleDialog(self, self.logic)
+        if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
+        try:
+            selected, targets, mode, variants = dialog.selection()
+        except Exception as exc:  # noqa: BLE001
+            self._notify(f"Falha ao reamostrar: {exc}", "error")
+            return
+
+        def operation(logic: JSONMergerLogic) -> object:
+            return [
+                logic.resample_animations(project, paths, targets, mode, variants)
+                for project, paths in selected.items()
+            ]
+
+        self._run_task(
+            "Reamostrando animações",
+            operation,
+            "Animações reamostradas",
+            "Falha ao reamostrar",
+            copy_model=False,
+        )
+
+    def mirror_animation(self) -> None:
+        if not (self.logic.project1_archive or self.logic.project2_archive):
+            self._notify("Carregue algum projeto antes", "warning")
+            return
+        dialog = MirrorDialog(self, self.logic)
+        if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
+        try:
+            selection = dialog.selection()
+        except Exception as exc:  # noqa: BLE001
+            self._notify(f"Falha ao espelhar: {exc}", "error")
+            return
+        self._run_task(
+            "Espelhando animação",
+            lambda logic: logic.mirror_animation(**selection),
+            "Animação espelhada",
+            "Falha ao espelhar",
+            copy_model=False,
+        )
+
+    def blend_animations(self) -> None:
+        if not (self.logic.project1_archive or self.logic.project2_archive):
+            self._notify("Carregue algum projeto antes", "warning")
+            return
+        dialog = BlendDialog(self, self.logic)
+        if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
+        try:
+            selection = dialog.selection()
+        except Exception as exc:  # noqa: BLE001
+            self._notify(f"Falha ao misturar: {exc}", "error")
+            return
+        self._run_task(
+            "Misturando animações",
+            lambda logic: logic.blend_animations(**selection),
+            "Animações misturadas",
+            "Falha ao misturar",
+            copy_model=False,
+        )
+
+    def preview_timeline(self, project: int, path: str, frames: list[dict[str, object]]) -> None:
+        label = self.logic.animation_entry(path)["label"]
+        self.current_animation = (project, path, f"{label} (prévia)")
+        self.timeline_list.timeline_model.set_frames(frames)
+        self._update_timeline_header()
+        if self.timeline_list.frame_count() > 0:
+            self.timeline_list.set_current_row(0)
+
+    def _on_logic_event(self, event: str, payload: dict[str, object]) -> None:
+        if event == "animation_changed":
+            self._on_animation_changed(payload)
+            return
+        tree = self.tree1 if payload.get("project") == 1 else self.tree2
+        if event == "project_replaced":
+            if payload.get("project") == 2 and self._texture_cache is not None:
+                self._texture_cache.invalidate()
+            data = self.logic.json1 if payload.get("project") == 1 else self.logic.json2
+            if payload.get("reloaded"):
+                self._build_tree(tree, data)
+                self._refresh_animation_lists()
+            else:
+                tree.replace_project_data(data)
+            return
+        model = tree.source_model
+        if event in ("node_inserted", "node_removed"):
+            model.sync_path(list(payload["path"])[:-1], recursive=False)
+        elif event == "node_moved":
+            model.sync_path(list(payload["from_path"])[:-1], recursive=False)
+            model.sync_path(list(payload["to_path"])[:-1], recursive=False)
+        elif event == "attribute_changed":
+            path = list(payload["path"])
+            key = payload.get("key")
+            model.sync_path(path, recursive=key is None)
+            if key is not None:
+                model.sync_path(path + [key])
+
+    def _on_animation_changed(self, payload: dict[str, object]) -> None:
+        if not self._animation_tab_ready:
+            return
+        project = payload.get("project")
+        path = payload.get("path")
+        change = payload.get("change")
+        anim_list = self.anim_list1 if project == 1 else self.anim_list2
+        if change == "added" and isinstance(path, str):
+            entry = self.logic.animation_entry(path)
+            list_item = QtWidgets.QListWidgetItem(entry["label"])
+            list_item.setData(QtCore.Qt.ItemDataRole.UserRole, path)
+            anim_list.addItem(list_item)
+        elif change == "removed":
+            for row in range(anim_list.count() - 1, -1, -1):
+                if anim_list.item(row).data(QtCore.Qt.ItemDataRole.UserRole) == path:
+                    anim_list.takeItem(row)
+        if not self.current_animation or self.current_animation[:2] != (project, path):
+            return
+        if change == "removed":
+            self._clear_timeline()
+            return
+        frames = payload.get("frames")
+        frame_op = payload.get("frame_op")
+        if not isinstance(frames, list) or not isinstance(frame_op, str):
+            row = self._current_frame_index()
+            self._load_timeline()
+            if row is not None:
+                self.timeline_list.set_current_row(min(row, self.timeline_list.frame_count() - 1))
+            return
+        index = payload.get("index")
+        to_index = payload.get("to_index")
+        count = payload.get("count")
+        self.timeline_list.timeline_model.apply_change(
+            frame_op,
+            frames,
+            index if isinstance(index, int) else None,
+            count if isinstance(count, int) else 1,
+            to_index if isinstance(to_index, int) else None,
+        )
+        self._update_timeline_header()
+        if frame_op in ("changed", "moved"):
+            self._update_frame_details()
 
     def _refresh_animation_lists(self) -> None:
-        self.anim_list1.clear()
-        self.anim_list2.clear()
-        for item in self.logic.list_animations(1):
-            list_item = QtWidgets.QListWidgetItem(item["label"])
-            list_item.setData(QtCore.Qt.ItemDataRole.UserRole, item["path"])
-            self.anim_list1.addItem(list_item)
-        for item in self.logic.list_animations(2):
-            list_item = QtWidgets.QListWidgetItem(item["label"])
-            list_item.setData(QtCore.Qt.ItemDataRole.UserRole, item["path"])
-            self.anim_list2.addItem(list_item)
+        if not self._animation_tab_ready:
+            return
+        with self.profiler.span("ui._refresh_animation_lists") as info:
+            self.anim_list1.clear()
+            self.anim_list2.clear()
+            for item in self.logic.list_animations(1):
+                list_item = QtWidgets.QListWidgetItem(item["label"])
+                list_item.setData(QtCore.Qt.ItemDataRole.UserRole, item["path"])
+                self.anim_list1.addItem(list_item)
+            for item in self.logic.list_animations(2):
+                list_item = QtWidgets.QListWidgetItem(item["label"])
+                list_item.setData(QtCore.Qt.ItemDataRole.UserRole, item["path"])
+                self.anim_list2.addItem(list_item)
+            info["animations"] = self.anim_list1.count() + self.anim_list2.count()
 
         self._clear_timeline()
 
@@ -792,45 +1181,51 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         if not self.current_animation:
             self.timeline_header.setText("Nenhuma animação selecionada")
             return
-        project, path, label = self.current_animation
+        project, path, _ = self.current_animation
         try:
-            anim = self.logic.load_animation(project, path)
-            frames = anim.get("frames", [])
-            if not isinstance(frames, list):
-                raise ValueError("Animação sem frames")
-            for idx, frame in enumerate(frames):
-                components = frame.get("components", []) if isinstance(frame, dict) else []
-                comp_count = len(components) if isinstance(components, list) else 0
-                item = QtWidgets.QListWidgetItem(f"Frame {idx + 1}\n{comp_count} comps")
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, idx)
-                self.timeline_list.addItem(item)
-            self.timeline_header.setText(
-                f"{label} — {len(frames)} frame(s) (Projeto {project})"
-            )
-            if self.timeline_list.count() > 0:
-                self.timeline_list.setCurrentRow(0)
-            else:
-                self._clear_frame_elements()
+            with self.profiler.span("ui._load_timeline") as info:
+                anim = self.logic.load_animation(project, path)
+                frames = anim.get("frames", [])
+                if not isinstance(frames, list):
+                    raise ValueError("Animação sem frames")
+                info["frames"] = len(frames)
+                self.timeline_list.timeline_model.set_frames(frames)
+                self._update_timeline_header()
+                if self.timeline_list.frame_count() > 0:
+                    self.timeline_list.set_current_row(0)
+                else:
+                    self._clear_frame_elements()
         except Exception as exc:  # noqa: BLE001
             self._notify(f"Falha ao carregar timeline: {exc}", "error")
             self._clear_timeline()
-        self._update_frame_details()
+
+    def _update_timeline_header(self) -> None:
+        if not self.current_animation:
+            self.timeline_header.setText("Nenhuma animação selecionada")
+            return
+        project, _, label = self.current_animation
+        self.timeline_header.setText(
+            f"{label} — {self.timeline_list.frame_count()} frame(s) (Projeto {project})"
+        )
 
     def _current_frame_index(self) -> int | None:
-        row = self.timeline_list.currentRow()
+        row = self.timeline_list.current_row()
         if row < 0:
             return None
         return row
 
     def _clear_frame_elements(self) -> None:
-        self.frame_elements_tree.clear()
+        self.frame_elements_tree.clear_elements()
+        self._frame_modified_sets = None
         self.frame_elements_label.setText("Selecione um frame para ver os elementos")
 
     def _update_frame_details(
-        self, current: QtWidgets.QListWidgetItem | None = None, previous: QtWidgets.QListWidgetItem | None = None
+        self, current: QtCore.QModelIndex | None = None, previous: QtCore.QModelIndex | None = None
     ) -> None:
         del previous
-        if current is None or not self.current_animation:
+        if current is None:
+            current = self.timeline_list.currentIndex()
+        if not current.isValid() or not self.current_animation:
             self._clear_frame_elements()
             return
         project, path, _ = self.current_animation
@@ -839,35 +1234,40 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             if index is None:
                 self._clear_frame_elements()
                 return
-            elements = self.logic.frame_component_hierarchy(project, path, index)
-            self.frame_elements_tree.clear()
-            modified_count = 0
-            depth_parents: dict[int, QtWidgets.QTreeWidgetItem] = {}
-            for element in elements:
-                item = QtWidgets.QTreeWidgetItem([element.get("name", "")])
-                item.setData(0, QtCore.Qt.ItemDataRole.UserRole, element.get("storeID"))
-                if element.get("modified"):
-                    item.setForeground(0, QtGui.QBrush(QtGui.QColor("#006400")))
-                    modified_count += 1
-                depth = int(element.get("depth", 0))
-                parent = depth_parents.get(depth - 1)
-                if parent:
-                    parent.addChild(item)
-                else:
-                    self.frame_elements_tree.addTopLevelItem(item)
-                depth_parents[depth] = item
-                for level in list(depth_parents):
-                    if level > depth:
-                        depth_parents.pop(level)
-            self.frame_elements_tree.collapseAll()
-            count = len(elements)
-            self.frame_elements_label.setText(
-                f"{modified_count} elemento(s) modificados de {count} no frame {index + 1}"
-            )
+            with self.profiler.span("ui._update_frame_details") as info:
+                modified_sets = self.logic.frame_modified_ids(project, path)
+                if index >= len(modified_sets):
+                    raise ValueError("Frame inválido")
+                store_ids = modified_sets[index]
+                if store_ids is None:
+                    raise ValueError("Frame sem componentes")
+                rebuilt = self.frame_elements_tree.set_skeleton(self.logic.model_hierarchy(project))
+                if rebuilt or modified_sets is not self._frame_modified_sets:
+                    # Só recalcula os storeIDs fora do modelo quando a animação muda ou é regravada
+                    self._frame_modified_sets = modified_sets
+                    self.frame_elements_tree.set_extras(
+                        self._animation_extra_labels(project, modified_sets)
+                    )
+                modified_count, count = self.frame_elements_tree.highlight(store_ids)
+                info["elements"] = count
+                self.frame_elements_label.setText(
+                    f"{modified_count} elemento(s) modificados de {count} no frame {index + 1}"
+                )
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
             self._clear_frame_elements()
 
+    def _animation_extra_labels(
+        self, project: int, modified_sets: list[frozenset[int] | None]
+    ) -> dict[int, str]:
+        known = {element["storeID"] for element in self.logic.model_hierarchy(project)}
+        animated = frozenset().union(*(ids for ids in modified_sets if ids))
+        extra_ids = sorted(animated - known)
+        if not extra_ids:
+            return {}
+        name_map = self.logic.storeid_name_map(project)
+        return {sid: str(name_map.get(sid, f"storeID {sid}")) for sid in extra_ids}
+
     def _copy_element_transform(self) -> None:
         try:
             project, path, _ = self._require_animation()
@@ -880,19 +1280,23 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             store_id = selected_element.data(0, QtCore.Qt.ItemDataRole.UserRole)
             if not isinstance(store_id, int):
                 raise ValueError("Elemento sem storeID válido")
-            dialog = CopyTransformDialog(self, self.timeline_list.count(), src_frame)
+            dialog = CopyTransformDialog(self, self.timeline_list.frame_count(), src_frame)
             if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
                 return
             values = dialog.values()
             if values.get("all_frames"):
-                self.logic.copy_element_transform_all_frames(project, path, src_frame, store_id)
-                self._notify("Transformações coladas em todos os frames", "success")
-                self._update_frame_details()
+                self._run_task(
+                    "Colando transformações",
+                    lambda logic: logic.copy_element_transform_all_frames(project, path, src_frame, store_id),
+                    "Transformações coladas em todos os frames",
+                    "Falha ao colar transformações",
+                    copy_model=False,
+                )
             else:
                 target_frame = int(values.get("target_frame", src_frame))
                 self.logic.copy_element_transform(project, path, src_frame, target_frame, store_id)
                 self._notify("Transformações copiadas para o frame de destino", "success")
-                self.timeline_list.setCurrentRow(target_frame)
+                self.timeline_list.set_current_row(target_frame)
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
 
@@ -908,11 +1312,10 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             if index is None:
                 raise ValueError("Selecione um frame para mover")
             target = index + delta
-            if target < 0 or target >= self.timeline_list.count():
+            if target < 0 or target >= self.timeline_list.frame_count():
                 raise ValueError("Não é possível mover além dos limites")
             self.logic.move_frame(project, path, index, target)
-            self._load_timeline()
-            self.timeline_list.setCurrentRow(target)
+            self.timeline_list.set_current_row(target)
             self._notify("Frame movido", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
@@ -924,10 +1327,9 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             if index is None:
                 raise ValueError("Selecione um frame para excluir")
             self.logic.delete_frame(project, path, index)
-            self._load_timeline()
-            new_index = min(index, self.timeline_list.count() - 1)
+            new_index = min(index, self.timeline_list.frame_count() - 1)
             if new_index >= 0:
-                self.timeline_list.setCurrentRow(new_index)
+                self.timeline_list.set_current_row(new_index)
             self._notify("Frame excluído", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
@@ -939,8 +1341,7 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             if index is None:
                 raise ValueError("Selecione um frame para duplicar")
             self.logic.duplicate_frame(project, path, index)
-            self._load_timeline()
-            self.timeline_list.setCurrentRow(index + 1)
+            self.timeline_list.set_current_row(index + 1)
             self._notify("Frame duplicado", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
@@ -951,18 +1352,12 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             index = self._current_frame_index()
             insert_at = (index + 1) if index is not None else 0
             self.logic.insert_clean_frame(project, path, insert_at)
-            self._load_timeline()
-            self.timeline_list.setCurrentRow(insert_at)
+            self.timeline_list.set_current_row(insert_at)
             self._notify("Frame limpo inserido", "success")
         except Exception as exc:  # noqa: BLE001
             self._notify(str(exc), "error")
 
-    @staticmethod
-    def _item_path(item: QtWidgets.QTreeWidgetItem) -> List[int | str]:
-        data = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-        return list(data) if data is not None else []
-
-    def _show_context_menu(self, tree: QtWidgets.QTreeWidget, pos: QtCore.QPoint) -> None:
+    def _show_context_menu(self, tree: ProjectTreeView, pos: QtCore.QPoint) -> None:
         menu = QtWidgets.QMenu(self)
         global_pos = tree.viewport().mapToGlobal(pos)
 
@@ -1004,15 +1399,35 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
         dialog = UVShiftDialog(self)
         dialog.exec()
 
+    def open_uv_analysis_dialog(self) -> None:
+        if not self.logic.json2:
+            self._notify("Carregue o Projeto 2 primeiro", "warning")
+            return
+        dialog = UVAnalysisDialog(self)
+        dialog.exec()
+
+    def set_memory_tracing(self, enabled: bool) -> None:
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def memory_extras(self) -> dict[str, int]:
+        extras: dict[str, int] = {}
+        if self._texture_cache is not None:
+            extras["texturas decodificadas"] = self._texture_cache.estimated_bytes()
+        return extras
+
+    def open_memory_report(self) -> None:
+        dialog = MemoryReportDialog(self)
+        dialog.exec()
+
     def open_movement_dialog(self) -> None:
         if not self.logic.json2:
             self._notify("Carrega o Projeto 2 ai antes, por favorzinho :)", "warning")
             return
         dialog = MovementDialog(self, self.logic)
-        if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-            self._build_tree(self.tree2, self.logic.json2)
-            if self.show_only_elements:
-                self._toggle_elements_only(True)
+        dialog.exec()
 
     def open_affix_dialog(self) -> None:
         if not self.logic.json2:
@@ -1023,7 +1438,6 @@ class JSONMergerWindow(QtWidgets.QMainWindow, StatusMixin):
             try:
                 path, prefix, suffix, include_children = dialog.values()
                 self.logic.apply_affixes(path, prefix, suffix, include_children)
-                self._build_tree(self.tree2, self.logic.json2)
                 self._notify("Prefixo/Sufixo aplicados", "success")
             except Exception as exc:  # noqa: BLE001
                 self._notify(f"Falha ao aplicar prefixo/sufixo: {exc}", "error")
@@ -1121,18 +1535,16 @@ class UVShiftDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.parent_window = parent
         self.setWindowTitle("Mover textura (Shift UV)")
-        current = self.parent_window.tree2.currentItem()
-        if not current:
+        current = self.parent_window.tree2.current_path()
+        if current is None:
             self.parent_window._notify("Selecione elemento em JSON 2 para ajustar UV", "warning")
             self.reject()
             return
-        self.element_path = self.parent_window._item_path(current)
-        self.element = self.parent_window.logic.get_by_path(self.parent_window.logic.json2, self.element_path)
-        self.texture_pixmap = self._load_texture_pixmap()
-        self.current_bbox = self.parent_window.logic.compute_uv_bbox(self.element)
-        self.scene: QtWidgets.QGraphicsScene | None = None
-        self.current_rect: QtWidgets.QGraphicsRectItem | None = None
-        self.shift_rect: QtWidgets.QGraphicsRectItem | None = None
+        self.element_path = current
+        logic = self.parent_window.logic
+        self.texture_pixmap = self.parent_window.texture_cache.pixmap(logic.project2_archive)
+        self.uv_entries = logic.uv_faces()
+        self.atlas: "UVAtlasView | None" = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -1151,16 +1563,18 @@ class UVShiftDialog(QtWidgets.QDialog):
 
         layout.addLayout(form)
 
-        if self.texture_pixmap and self.current_bbox:
-            self.scene = QtWidgets.QGraphicsScene(self)
-            self.scene.addPixmap(self.texture_pixmap)
-            self.view = QtWidgets.QGraphicsView(self.scene)
-            self.view.setRenderHints(
-                QtGui.QPainter.RenderHint.Antialiasing
-                | QtGui.QPainter.RenderHint.SmoothPixmapTransform
+        if self.texture_pixmap or self.uv_entries:
+            from uv_atlas import UVAtlasView
+
+            self.atlas = UVAtlasView()
+            self.atlas.setMinimumSize(420, 420)
+            self.atlas.set_atlas(self.texture_pixmap, self.uv_entries)
+            # O ajuste vale para o elemento e tudo abaixo dele, então destaca a subárvore inteira
+            depth = len(self.element_path)
+            self.atlas.highlight(
+                [entry["path"] for entry in self.uv_entries if entry["path"][:depth] == self.element_path]
             )
-            layout.addWidget(self.view)
-            self._draw_bboxes()
+            layout.addWidget(self.atlas)
             self.du_input.valueChanged.connect(self._draw_bboxes)
             self.dv_input.valueChanged.connect(self._draw_bboxes)
         else:
@@ -1183,36 +1597,167 @@ class UVShiftDialog(QtWidgets.QDialog):
         if self.parent_window.shift_uv(du, dv):
             self.accept()
 
-    def _load_texture_pixmap(self) -> QtGui.QPixmap | None:
-        if not self.parent_window.logic.project2_archive:
-            return None
-        for name, data in self.parent_window.logic.project2_archive.items():
-            if name.lower().endswith("skin.png"):
-                pixmap = QtGui.QPixmap()
-                if pixmap.loadFromData(data):
-                    return pixmap
-        return None
-
     def _draw_bboxes(self) -> None:
-        if not self.scene or not self.current_bbox:
-            return
-        du = int(self.du_input.value())
-        dv = int(self.dv_input.value())
-        x1, y1, x2, y2 = self.current_bbox
-        shifted = (x1 + du, y1 + dv, x2 + du, y2 + dv)
-        for item in (self.current_rect, self.shift_rect):
-            if item:
-                self.scene.removeItem(item)
-        pen_current = QtGui.QPen(QtGui.QColor("red"))
-        pen_current.setWidth(2)
-        pen_shift = QtGui.QPen(QtGui.QColor("green"))
-        pen_shift.setWidth(2)
-        self.current_rect = self.scene.addRect(QtCore.QRectF(x1, y1, x2 - x1, y2 - y1), pen_current)
-        self.shift_rect = self.scene.addRect(
-            QtCore.QRectF(shifted[0], shifted[1], shifted[2] - shifted[0], shifted[3] - shifted[1]),
-            pen_shift,
+        if self.atlas is not None:
+            self.atlas.set_shift(int(self.du_input.value()), int(self.dv_input.value()))
+
+
+class MemoryReportDialog(QtWidgets.QDialog):
+    def __init__(self, parent: JSONMergerWindow) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Relatório de memória")
+        self.resize(560, 520)
+        self.parent_window = parent
+        self._build_ui()
+        self.refresh()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+        self.summary = QtWidgets.QLabel()
+        layout.addWidget(self.summary)
+        self.tree = QtWidgets.QTreeWidget()
+        self.tree.setHeaderLabels(["Estrutura", "Tamanho"])
+        self.tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.tree.header().setStretchLastSection(False)
+        layout.addWidget(self.tree, 1)
+
+        buttons = QtWidgets.QHBoxLayout()
+        refresh_btn = QtWidgets.QPushButton("Atualizar")
+        refresh_btn.clicked.connect(self.refresh)
+        close_btn = QtWidgets.QPushButton("Fechar")
+        close_btn.clicked.connect(self.accept)
+        buttons.addStretch(1)
+        buttons.addWidget(refresh_btn)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def refresh(self) -> None:
+        from memory_report import format_size, memory_report
+
+        report = memory_report(self.parent_window.logic, self.parent_window.memory_extras())
+        self.tree.clear()
+        for group in report["groups"]:
+            title = group["name"] + (f" — {group['path']}" if group.get("path") else "")
+            group_item = QtWidgets.QTreeWidgetItem([title, format_size(group["bytes"])])
+            for entry in group["items"]:
+                group_item.addChild(QtWidgets.QTreeWidgetItem([entry["name"], format_size(entry["bytes"])]))
+            self.tree.addTopLevelItem(group_item)
+            group_item.setExpanded(group["bytes"] > 0 and group_item.childCount() <= 20)
+        summary = f"Estimado nas estruturas: {format_size(report['estimated'])}"
+        traced = report.get("traced")
+        if traced:
+            summary += (
+                f" — tracemalloc: atual {format_size(traced['current'])}, "
+                f"pico {format_size(traced['peak'])}"
+            )
+            top_item = QtWidgets.QTreeWidgetItem(["Maiores alocações (tracemalloc)", ""])
+            for entry in traced["top"]:
+                top_item.addChild(QtWidgets.QTreeWidgetItem([entry["where"], format_size(entry["bytes"])]))
+            self.tree.addTopLevelItem(top_item)
+            top_item.setExpanded(True)
+        else:
+            summary += " — ative o tracemalloc em Opções para medir as alocações"
+        self.summary.setText(summary)
+        self.tree.resizeColumnToContents(1)
+
+
+class UVAnalysisDialog(QtWidgets.QDialog):
+    MAX_ROWS_PER_GROUP = 500
+
+    def __init__(self, parent: JSONMergerWindow) -> None:
+        super().__init__(parent)
+        self.parent_window = parent
+        self.setWindowTitle("Análise de UV")
+        self.resize(900, 560)
+        logic = self.parent_window.logic
+        self.report = logic.analyze_uv()
+        self.texture_pixmap = self.parent_window.texture_cache.pixmap(logic.project2_archive)
+        self.uv_entries = logic.uv_faces()
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+        report = self.report
+        size = report["texture_size"]
+        size_text = f"{size[0]}x{size[1]}" if size else "desconhecida"
+        summary = QtWidgets.QLabel(
+            f"{report['faces']} face(s), textura {size_text}: "
+            f"{len(report['overlaps'])} sobreposição(ões), "
+            f"{len(report['out_of_bounds'])} fora da textura, "
+            f"{int(report['unused_area'])} px livres"
         )
-        self.view.fitInView(self.scene.itemsBoundingRect(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        layout.addWidget(summary)
+
+        splitter = QtWidgets.QSplitter()
+        layout.addWidget(splitter, 1)
+
+        self.findings = QtWidgets.QTreeWidget()
+        self.findings.setHeaderLabels(["Achado", "Detalhe"])
+        self.findings.currentItemChanged.connect(self._show_finding)
+        self.findings.itemDoubleClicked.connect(self._reveal_finding)
+        splitter.addWidget(self.findings)
+
+        from uv_atlas import UVAtlasView
+
+        self.atlas = UVAtlasView()
+        self.atlas.set_atlas(self.texture_pixmap, self.uv_entries)
+        splitter.addWidget(self.atlas)
+        splitter.setStretchFactor(1, 1)
+
+        overlaps = self._group("Sobreposições", len(report["overlaps"]))
+        for overlap in report["overlaps"][: self.MAX_ROWS_PER_GROUP]:
+            a, b = overlap["a"], overlap["b"]
+            self._add_finding(
+                overlaps,
+                f"{a['name']} ({a['face']}) × {b['name']} ({b['face']})",
+                f"{overlap['area']:g} px²",
+                [a["path"], b["path"]],
+            )
+        outside = self._group("Fora da textura", len(report["out_of_bounds"]))
+        for face in report["out_of_bounds"][: self.MAX_ROWS_PER_GROUP]:
+            self._add_finding(outside, f"{face['name']} ({face['face']})", self._rect_text(face["rect"]), [face["path"]])
+        unused = self._group("Regiões livres", len(report["unused"]))
+        for rect in report["unused"][: self.MAX_ROWS_PER_GROUP]:
+            self._add_finding(unused, self._rect_text(rect), f"{(rect[2] - rect[0]) * (rect[3] - rect[1]):g} px²", [])
+
+        close_btn = QtWidgets.QPushButton("Fechar")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn)
+
+    def _group(self, title: str, count: int) -> QtWidgets.QTreeWidgetItem:
+        group = QtWidgets.QTreeWidgetItem([f"{title} ({count})"])
+        if count > self.MAX_ROWS_PER_GROUP:
+            group.setText(1, f"mostrando {self.MAX_ROWS_PER_GROUP}")
+        self.findings.addTopLevelItem(group)
+        return group
+
+    @staticmethod
+    def _add_finding(
+        group: QtWidgets.QTreeWidgetItem, text: str, detail: str, paths: list[List[int | str]]
+    ) -> None:
+        item = QtWidgets.QTreeWidgetItem([text, detail])
+        item.setData(0, QtCore.Qt.ItemDataRole.UserRole, paths)
+        group.addChild(item)
+
+    @staticmethod
+    def _rect_text(rect: tuple[float, float, float, float]) -> str:
+        x1, y1, x2, y2 = rect
+        return f"({x1:g}, {y1:g}) → ({x2:g}, {y2:g})"
+
+    def _show_finding(self, current: QtWidgets.QTreeWidgetItem | None, previous: object = None) -> None:
+        del previous
+        paths = current.data(0, QtCore.Qt.ItemDataRole.UserRole) if current else None
+        self.atlas.highlight(list(paths or []))
+
+    def _reveal_finding(self, item: QtWidgets.QTreeWidgetItem, column: int = 0) -> None:
+        del column
+        paths = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if not paths:
+            return
+        tree = self.parent_window.tree2
+        index = tree.index_for_path(list(paths[0]))
+        if index.isValid():
+            tree.reveal(index)
 
 
 class MovementDialog(QtWidgets.QDialog):
@@ -1249,7 +1794,7 @@ class MovementDialog(QtWidgets.QDialog):
             form.addRow(label, combo)
             self.combos[key] = combo
         layout.addLayout(form)
-        self._prefill_defaults(labels)
+        self._prefill_defaults()
 
         self.debug_checkbox = QtWidgets.QCheckBox("DEBUG (salvar cada etapa)")
         layout.addWidget(self.debug_checkbox)
@@ -1257,6 +1802,12 @@ class MovementDialog(QtWidgets.QDialog):
         self.skin_checkbox = QtWidgets.QCheckBox("skin x128")
         layout.addWidget(self.skin_checkbox)
 
+        self.rebake_checkbox = QtWidgets.QCheckBox("Recalcular animações para a nova hierarquia")
+        self.rebake_checkbox.setToolTip(
+            "Reescreve os frames das partes que mudaram de pai para que o movimento continue o mesmo"
+        )
+        layout.addWidget(self.rebake_checkbox)
+
         buttons = QtWidgets.QHBoxLayout()
         apply_btn = QtWidgets.QPushButton("Aplicar")
         apply_btn.clicked.connect(self._run_tool)
@@ -1278,10 +1829,24 @@ class MovementDialog(QtWidgets.QDialog):
         if len({tuple(path) for path in selection.values()}) != len(selection):
             self._notify_parent("Nao pode selecionar o mesmo elemento em duas opcoes nao :(", "warning")
             return
+        skin_x128 = self.skin_checkbox.isChecked()
+        rebake = self.rebake_checkbox.isChecked()
+        parent_window = self.parent()
+        if not self.debug_checkbox.isChecked() and isinstance(parent_window, JSONMergerWindow):
+            # O modo DEBUG abre diálogos de salvamento no meio da operação, então só ele roda na thread da UI
+            parent_window._run_task(
+                "Gerando hierarquia +Movment",
+                lambda logic: logic.apply_movement_tool(selection, skin_x128=skin_x128, rebake=rebake),
+                "OBaaaaa - Deu bom :)",
+                "Deu esse erro aqui",
+            )
+            self.accept()
+            return
         try:
             debug_hook = self._build_debug_hook() if self.debug_checkbox.isChecked() else None
-            skin_x128 = self.skin_checkbox.isChecked()
-            self.logic.apply_movement_tool(selection, debug_hook=debug_hook, skin_x128=skin_x128)
+            self.logic.apply_movement_tool(
+                selection, debug_hook=debug_hook, skin_x128=skin_x128, rebake=rebake
+            )
             self._notify_parent("OBaaaaa - Deu bom :)", "success")
             self.accept()
         except Exception as exc:  # noqa: BLE001
@@ -1301,29 +1866,17 @@ class MovementDialog(QtWidgets.QDialog):
             self._notify_parent(f"{label} - Chama o Salvar como... ai!", "info")
             if isinstance(parent_window, JSONMergerWindow):
                 try:
-                    parent_window.save_project2_as()
+                    parent_window.save_project2_as(background=False)
                 except Exception as exc:  # noqa: BLE001
                     self._notify_parent(f"Salvar como falhou: {exc}", "warning")
 
         return _hook
 
-    def _prefill_defaults(self, labels: list[tuple[str, str]]) -> None:
-        name_targets = {
-            "left_arm": "Left Arm",
-            "right_arm": "Right Arm",
-            "left_leg": "Left Leg",
-            "right_leg": "Right Leg",
-            "left_sleeve": "Left Sleeve",
-            "right_sleeve": "Right Sleeve",
-            "left_pants": "Left Pants Leg",
-            "right_pants": "Right Pants Leg",
-        }
-        for key, _ in labels:
-            target = name_targets.get(key, "").lower()
+    def _prefill_defaults(self) -> None:
+        for key, path in self.logic.detect_movement_limbs().items():
             combo = self.combos[key]
             for index in range(combo.count()):
-                text = combo.itemText(index).lower()
-                if text == target:
+                if combo.itemData(index) == path:
                     combo.setCurrentIndex(index)
                     break
 
@@ -1351,31 +1904,51 @@ class AnimationMappingDialog(QtWidgets.QDialog):
             return
         source_ids = self.logic.extract_store_ids(self.logic.animation_clipboard)
         target_ids = self.logic.extract_store_ids_from_model()
-        source_names = self.logic.storeid_name_map(project=1)
+        source_names = self.logic.storeid_name_map(project=self.logic.animation_clipboard_project or 1)
         target_names = self.logic.storeid_name_map(project=2)
 
+        try:
+            self.suggestions = self.logic.suggest_storeid_mapping(source_ids)
+        except Exception:  # noqa: BLE001
+            self.suggestions = {}
+
+        self.chk_suggest = QtWidgets.QCheckBox("Usar sugestões automáticas (nome e hierarquia)")
+        self.chk_suggest.setChecked(True)
+        self.chk_suggest.toggled.connect(self._apply_suggestions)
+        layout.addWidget(self.chk_suggest)
+
+        short = lambda val: str(val)[-6:] if isinstance(val, int) and len(str(val)) > 6 else str(val)
+        # Um único modelo de alvos para todos os combos; a linha 0 ("Manter") mantém o próprio storeID
+        self.target_model = QtGui.QStandardItemModel(self)
+        self.target_model.appendRow(QtGui.QStandardItem("Manter"))
+        self.target_rows: dict[int, int] = {}
+        for tid in target_ids:
+            item = QtGui.QStandardItem(f"{target_names.get(tid, str(tid))} ({short(tid)})")
+            item.setData(tid, QtCore.Qt.ItemDataRole.UserRole)
+            self.target_rows[tid] = self.target_model.rowCount()
+            self.target_model.appendRow(item)
+
         grid = QtWidgets.QGridLayout()
         self.combos: dict[int, QtWidgets.QComboBox] = {}
+        self.confidence_labels: dict[int, QtWidgets.QLabel] = {}
         rows_per_col = 8
-        short = lambda val: str(val)[-6:] if isinstance(val, int) and len(str(val)) > 6 else str(val)
         for idx, sid in enumerate(source_ids):
-            combo = QtWidgets.QComboBox()
-            combo.setMinimumWidth(120)
-            combo.setMaximumWidth(150)
-            combo.view().setMinimumWidth(150)
-            combo.addItem(f"Manter ({short(sid)})", userData=sid)
-            for tid in target_ids:
-                text = target_names.get(tid, str(tid))
-                combo.addItem(f"{text} ({short(tid)})", userData=tid)
+            combo = self._target_combo()
+            combo.setToolTip(f"Manter = {sid}")
             row = idx % rows_per_col
             col = idx // rows_per_col
             label_text = source_names.get(sid, f"storeID {short(sid)}")
             label_widget = QtWidgets.QLabel(label_text)
             label_widget.setToolTip(str(sid))
-            grid.addWidget(label_widget, row, col * 2)
-            grid.addWidget(combo, row, col * 2 + 1)
+            confidence = QtWidgets.QLabel()
+            confidence.setMinimumWidth(34)
+            grid.addWidget(label_widget, row, col * 3)
+            grid.addWidget(combo, row, col * 3 + 1)
+            grid.addWidget(confidence, row, col * 3 + 2)
             self.combos[sid] = combo
+            self.confidence_labels[sid] = confidence
         layout.addLayout(grid)
+        self._apply_suggestions(self.chk_suggest.isChecked())
 
         buttons = QtWidgets.QHBoxLayout()
         btn_ok = QtWidgets.QPushButton("OK")
@@ -1387,10 +1960,47 @@ class AnimationMappingDialog(QtWidgets.QDialog):
         buttons.addWidget(btn_cancel)
         layout.addLayout(buttons)
 
+    def _target_combo(self) -> QtWidgets.QComboBox:
+        combo = QtWidgets.QComboBox()
+        combo.setModel(self.target_model)
+        combo.setMinimumWidth(120)
+        combo.setMaximumWidth(150)
+        # Sem isso o QComboBox mede todas as linhas do modelo para calcular o tamanho de cada combo
+        combo.setSizeAdjustPolicy(QtWidgets.QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        combo.setMinimumContentsLength(12)
+        view = combo.view()
+        view.setMinimumWidth(150)
+        if isinstance(view, QtWidgets.QListView):
+            view.setUniformItemSizes(True)
+        combo.setEditable(True)
+        combo.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
+        completer = QtWidgets.QCompleter(self.target_model, combo)
+        completer.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(QtCore.Qt.MatchFlag.MatchContains)
+        completer.setCompletionMode(QtWidgets.QCompleter.CompletionMode.PopupCompletion)
+        combo.setCompleter(completer)
+        return combo
+
+    def _apply_suggestions(self, enabled: bool) -> None:
+        for sid, combo in self.combos.items():
+            label = self.confidence_labels[sid]
+            suggestion = self.suggestions.get(sid) if enabled else None
+            if suggestion is None:
+                combo.setCurrentIndex(0)
+                label.clear()
+                label.setToolTip("")
+                continue
+            target, score = suggestion
+            combo.setCurrentIndex(self.target_rows.get(target, 0))
+            color = "#2e8b57" if score >= 0.8 else ("#cc8800" if score >= 0.6 else "#c0392b")
+            label.setText(f"{score:.0%}")
+            label.setStyleSheet(f"color:{color};")
+            label.setToolTip("Confiança da sugestão automática")
+
     def get_mapping(self) -> dict[int, int]:
         mapping: dict[int, int] = {}
         for sid, combo in self.combos.items():
-            val = combo.currentData()
+            val = combo.currentData(QtCore.Qt.ItemDataRole.UserRole)
             if isinstance(val, int) and val != sid:
                 mapping[sid] = val
         return mapping
@@ -1577,10 +2187,410 @@ class FrameInterpolationDialog(QtWidgets.QDialog):
         }
 
 
-def run_app() -> None:
+class KeyframeReductionDialog(QtWidgets.QDialog):
+    def __init__(self, parent: JSONMergerWindow, logic: JSONMergerLogic) -> None:
+        super().__init__(parent)
+        self.logic = logic
+        self.previewed = False
+        self.setWindowTitle("Reduzir keyframes")
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.combo_anim = QtWidgets.QComboBox()
+        for project in (1, 2):
+            for item in self.logic.list_animations(project):
+                label_prefix = "P1" if project == 1 else "P2"
+                self.combo_anim.addItem(f"{label_prefix}: {item['label']}", userData=(project, item["path"]))
+        self.combo_anim.currentIndexChanged.connect(lambda _: self.report_label.setText(""))
+        layout.addWidget(self.combo_anim)
+
+        form = QtWidgets.QFormLayout()
+        self.spin_pos = self._tolerance_spin(0.01, 3)
+        form.addRow("Tolerância de posição", self.spin_pos)
+        self.spin_rot = self._tolerance_spin(0.1, 2)
+        form.addRow("Tolerância de rotação (°)", self.spin_rot)
+        self.spin_scale = self._tolerance_spin(0.001, 4)
+        form.addRow("Tolerância de escala", self.spin_scale)
+        layout.addLayout(form)
+
+        self.report_label = QtWidgets.QLabel("")
+        self.report_label.setWordWrap(True)
+        layout.addWidget(self.report_label)
+
+        buttons = QtWidgets.QHBoxLayout()
+        preview_btn = QtWidgets.QPushButton("Pré-visualizar")
+        preview_btn.clicked.connect(self._preview)
+        buttons.addWidget(preview_btn)
+        ok_btn = QtWidgets.QPushButton("Reduzir")
+        ok_btn.clicked.connect(self._validate_and_accept)
+        buttons.addWidget(ok_btn)
+        cancel_btn = QtWidgets.QPushButton("Cancelar")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+    @staticmethod
+    def _tolerance_spin(value: float, decimals: int) -> QtWidgets.QDoubleSpinBox:
+        spin = QtWidgets.QDoubleSpinBox()
+        spin.setDecimals(decimals)
+        spin.setRange(0.0, 1000.0)
+        spin.setSingleStep(10 ** -decimals)
+        spin.setValue(value)
+        return spin
+
+    def _preview(self) -> None:
+        try:
+            project, path, tolerances = self.selection()
+            report = self.logic.reduce_keyframes(project, path, preview=True, **tolerances)
+        except Exception as exc:  # noqa: BLE001
+            self.report_label.setText(f"Falha na prévia: {exc}")
+            return
+        self.report_label.setText(
+            f"{report['frames_before']} → {report['frames_after']} frame(s), "
+            f"{report['removed_components']} componente(s) removido(s), "
+            f"{report['bytes_before']} → {report['bytes_after']} bytes"
+        )
+        parent_window = self.parent()
+        if isinstance(parent_window, JSONMergerWindow):
+            parent_window.preview_timeline(project, path, report["frames"])
+            self.previewed = True
+
+    def _validate_and_accept(self) -> None:
+        if self.combo_anim.currentData() is None:
+            QtWidgets.QMessageBox.warning(self, "Aviso", "Nenhuma animação selecionada")
+            return
+        self.accept()
+
+    def selection(self) -> tuple[int, str, dict[str, float]]:
+        data = self.combo_anim.currentData()
+        if not data:
+            raise ValueError("Nenhuma animação selecionada")
+        project, path = data
+        tolerances = {
+            "pos_tolerance": self.spin_pos.value(),
+            "rotation_tolerance": self.spin_rot.value(),
+            "scale_tolerance": self.spin_scale.value(),
+        }
+        return project, path, tolerances
+
+
+class ResampleDialog(QtWidgets.QDialog):
+    def __init__(self, parent: JSONMergerWindow, logic: JSONMergerLogic) -> None:
+        super().__init__(parent)
+        self.logic = logic
+        self.setWindowTitle("Reamostrar animações")
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+
+        layout.addWidget(QtWidgets.QLabel("Animações (várias com Ctrl/Shift)"))
+        self.anim_list = QtWidgets.QListWidget()
+        self.anim_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        for project in (1, 2):
+            for item in self.logic.list_animations(project):
+                label_prefix = "P1" if project == 1 else "P2"
+                list_item = QtWidgets.QListWidgetItem(f"{label_prefix}: {item['label']}")
+                list_item.setData(QtCore.Qt.ItemDataRole.UserRole, (project, item["path"]))
+                self.anim_list.addItem(list_item)
+        layout.addWidget(self.anim_list)
+
+        form = QtWidgets.QGridLayout()
+        self.radio_frames = QtWidgets.QRadioButton("Quantidade de frames")
+        self.spin_frames = QtWidgets.QSpinBox()
+        self.spin_frames.setRange(1, 100000)
+        self.spin_frames.setValue(30)
+        self.radio_speed = QtWidgets.QRadioButton("Fator de velocidade")
+        self.spin_speed = QtWidgets.QDoubleSpinBox()
+        self.spin_speed.setRange(0.01, 100.0)
+        self.spin_speed.setValue(1.0)
+        self.radio_fps = QtWidgets.QRadioButton("FPS (sobre a duration)")
+        self.fps_edit = QtWidgets.QLineEdit("20 30 60")
+        self.fps_edit.setToolTip("Uma ou mais taxas separadas por espaço; várias geram uma animação por taxa")
+        self.radio_fps.setChecked(True)
+        options = (
+            (self.radio_frames, self.spin_frames),
+            (self.radio_speed, self.spin_speed),
+            (self.radio_fps, self.fps_edit),
+        )
+        for row, (radio, editor) in enumerate(options):
+            form.addWidget(radio, row, 0)
+            form.addWidget(editor, row, 1)
+        layout.addLayout(form)
+
+        mode_row = QtWidgets.QHBoxLayout()
+        mode_row.addWidget(QtWidgets.QLabel("Interpolação"))
+        self.combo_mode = QtWidgets.QComboBox()
+        for mode, label in (("linear", "Linear"), ("cubica", "Cúbica (Catmull-Rom)"), ("degrau", "Degrau")):
+            self.combo_mode.addItem(label, userData=mode)
+        mode_row.addWidget(self.combo_mode, 1)
+        layout.addLayout(mode_row)
+
+        self.variant_checkbox = QtWidgets.QCheckBox("Salvar como nova animação (ex.: nome-30fps)")
+        layout.addWidget(self.variant_checkbox)
+
+        buttons = QtWidgets.QHBoxLayout()
+        ok_btn = QtWidgets.QPushButton("Reamostrar")
+        ok_btn.clicked.connect(self._validate_and_accept)
+        cancel_btn = QtWidgets.QPushButton("Cancelar")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(ok_btn)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+    def _validate_and_accept(self) -> None:
+        try:
+            self.selection()
+        except ValueError as exc:
+            QtWidgets.QMessageBox.warning(self, "Aviso", str(exc))
+            return
+        self.accept()
+
+    def selection(self) -> tuple[dict[int, list[str]], list[dict[str, float]], str, bool]:
+        selected: dict[int, list[str]] = {}
+        for item in self.anim_list.selectedItems():
+            project, path = item.data(QtCore.Qt.ItemDataRole.UserRole)
+            selected.setdefault(project, []).append(path)
+        if not selected:
+            raise ValueError("Selecione ao menos uma animação")
+        if self.radio_frames.isChecked():
+            targets: list[dict[str, float]] = [{"frame_count": self.spin_frames.value()}]
+        elif self.radio_speed.isChecked():
+            targets = [{"speed": self.spin_speed.value()}]
+        else:
+            try:
+                targets = [{"fps": float(value)} for value in self.fps_edit.text().replace(",", " ").split()]
+            except ValueError as exc:
+                raise ValueError("FPS inválido, use números separados por espaço") from exc
+            if not targets:
+                raise ValueError("Informe ao menos um fps")
+        return selected, targets, self.combo_mode.currentData(), self.variant_checkbox.isChecked()
+
+
+class MirrorDialog(QtWidgets.QDialog):
+    def __init__(self, parent: JSONMergerWindow, logic: JSONMergerLogic) -> None:
+        super().__init__(parent)
+        self.logic = logic
+        self.setWindowTitle("Espelhar animação")
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.combo_anim = QtWidgets.QComboBox()
+        for project in (1, 2):
+            for item in self.logic.list_animations(project):
+                label_prefix = "P1" if project == 1 else "P2"
+                self.combo_anim.addItem(f"{label_prefix}: {item['label']}", userData=(project, item["path"]))
+        self.combo_anim.currentIndexChanged.connect(self._on_anim_changed)
+        layout.addWidget(self.combo_anim)
+
+        self.pairs_label = QtWidgets.QLabel("")
+        self.pairs_label.setWordWrap(True)
+        layout.addWidget(self.pairs_label)
+
+        self.radio_same = QtWidgets.QRadioButton("Salvar na mesma animação")
+        self.radio_new = QtWidgets.QRadioButton("Salvar como nova")
+        self.radio_new.setChecked(True)
+        radios = QtWidgets.QHBoxLayout()
+        radios.addWidget(self.radio_same)
+        radios.addWidget(self.radio_new)
+        layout.addLayout(radios)
+
+        self.new_name_edit = QtWidgets.QLineEdit()
+        self.new_name_edit.setPlaceholderText("Novo nome do arquivo")
+        layout.addWidget(self.new_name_edit)
+        self.radio_new.toggled.connect(self.new_name_edit.setEnabled)
+
+        buttons = QtWidgets.QHBoxLayout()
+        ok_btn = QtWidgets.QPushButton("Espelhar")
+        ok_btn.clicked.connect(self._validate_and_accept)
+        cancel_btn = QtWidgets.QPushButton("Cancelar")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(ok_btn)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+        self._on_anim_changed(0)
+
+    def _on_anim_changed(self, index: int) -> None:
+        data = self.combo_anim.itemData(index)
+        if not data:
+            self.pairs_label.setText("")
+            return
+        project, path = data
+        pairs = self.logic.mirror_pairs(project)
+        names = self.logic.storeid_name_map(project)
+        shown = [f"{names[sid]} ↔ {names[other]}" for sid, other in pairs.items() if sid < other]
+        self.pairs_label.setText(
+            f"{len(shown)} par(es) esquerda/direita: {', '.join(shown[:6])}{'…' if len(shown) > 6 else ''}"
+            if shown
+            else "Nenhum par esquerda/direita encontrado; só os eixos serão espelhados"
+        )
+        self.new_name_edit.setText(self.logic.animation_variant_name(path, "espelhada").split("/")[-1])
+
+    def _validate_and_accept(self) -> None:
+        if self.combo_anim.currentData() is None:
+            QtWidgets.QMessageBox.warning(self, "Aviso", "Nenhuma animação selecionada")
+            return
+        if self.radio_new.isChecked() and not self.new_name_edit.text().strip():
+            QtWidgets.QMessageBox.warning(self, "Aviso", "Informe o novo nome do arquivo")
+            return
+        self.accept()
+
+    def selection(self) -> dict[str, object]:
+        data = self.combo_anim.currentData()
+        if not data:
+            raise ValueError("Nenhuma animação selecionada")
+        project, path = data
+        new_name = self.new_name_edit.text().strip() if self.radio_new.isChecked() else None
+        return {"project": project, "path": path, "new_name": new_name}
+
+
+class BlendDialog(QtWidgets.QDialog):
+    def __init__(self, parent: JSONMergerWindow, logic: JSONMergerLogic) -> None:
+        super().__init__(parent)
+        self.logic = logic
+        self.setWindowTitle("Misturar animações")
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.combo_project = QtWidgets.QComboBox()
+        for project in (1, 2):
+            if self.logic.list_animations(project):
+                self.combo_project.addItem(f"Projeto {project}", userData=project)
+        self.combo_project.currentIndexChanged.connect(self._reset_layers)
+        layout.addWidget(self.combo_project)
+
+        layout.addWidget(QtWidgets.QLabel("Camadas, de baixo para cima (storeIDs vazios = todos, filhos incluídos)"))
+        self.layer_table = QtWidgets.QTableWidget(0, 4)
+        self.layer_table.setHorizontalHeaderLabels(["Animação", "Peso", "Modo", "storeIDs"])
+        self.layer_table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.layer_table)
+
+        layer_buttons = QtWidgets.QHBoxLayout()
+        add_btn = QtWidgets.QPushButton("+ Camada")
+        add_btn.clicked.connect(self._add_layer)
+        remove_btn = QtWidgets.QPushButton("− Camada")
+        remove_btn.clicked.connect(self._remove_layer)
+        layer_buttons.addWidget(add_btn)
+        layer_buttons.addWidget(remove_btn)
+        layer_buttons.addStretch(1)
+        layout.addLayout(layer_buttons)
+
+        form = QtWidgets.QFormLayout()
+        self.spin_frames = QtWidgets.QSpinBox()
+        self.spin_frames.setRange(0, 100000)
+        self.spin_frames.setSpecialValueText("Maior entre as camadas")
+        form.addRow("Frames", self.spin_frames)
+        self.combo_mode = QtWidgets.QComboBox()
+        for mode, label in (("linear", "Linear"), ("cubica", "Cúbica (Catmull-Rom)"), ("degrau", "Degrau")):
+            self.combo_mode.addItem(label, userData=mode)
+        form.addRow("Interpolação", self.combo_mode)
+        self.new_name_edit = QtWidgets.QLineEdit()
+        self.new_name_edit.setPlaceholderText("Padrão: primeira camada com o sufixo -mistura")
+        form.addRow("Nova animação", self.new_name_edit)
+        layout.addLayout(form)
+
+        buttons = QtWidgets.QHBoxLayout()
+        ok_btn = QtWidgets.QPushButton("Misturar")
+        ok_btn.clicked.connect(self._validate_and_accept)
+        cancel_btn = QtWidgets.QPushButton("Cancelar")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(ok_btn)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+        self._reset_layers()
+
+    def _reset_layers(self) -> None:
+        self.layer_table.setRowCount(0)
+        self._add_layer()
+        self._add_layer()
+
+    def _add_layer(self) -> None:
+        project = self.combo_project.currentData()
+        row = self.layer_table.rowCount()
+        self.layer_table.insertRow(row)
+        combo_anim = QtWidgets.QComboBox()
+        for item in self.logic.list_animations(project) if project else []:
+            combo_anim.addItem(item["label"], userData=item["path"])
+        combo_anim.setCurrentIndex(min(row, combo_anim.count() - 1))
+        spin_weight = QtWidgets.QDoubleSpinBox()
+        spin_weight.setRange(-10.0, 10.0)
+        spin_weight.setSingleStep(0.1)
+        spin_weight.setValue(1.0)
+        combo_blend = QtWidgets.QComboBox()
+        combo_blend.addItem("Automático (g_ soma)", userData=None)
+        combo_blend.addItem("Mistura", userData="mistura")
+        combo_blend.addItem("Aditiva", userData="aditiva")
+        mask_edit = QtWidgets.QLineEdit()
+        mask_edit.setPlaceholderText("ex.: 3, 4")
+        for column, widget in enumerate((combo_anim, spin_weight, combo_blend, mask_edit)):
+            self.layer_table.setCellWidget(row, column, widget)
+
+    def _remove_layer(self) -> None:
+        # Sem linha selecionada sai a última; a mistura precisa de ao menos duas camadas
+        rows = self.layer_table.rowCount()
+        if rows > 2:
+            current = self.layer_table.currentRow()
+            self.layer_table.removeRow(current if current >= 0 else rows - 1)
+
+    def _validate_and_accept(self) -> None:
+        try:
+            self.selection()
+        except ValueError as exc:
+            QtWidgets.QMessageBox.warning(self, "Aviso", str(exc))
+            return
+        self.accept()
+
+    def selection(self) -> dict[str, object]:
+        project = self.combo_project.currentData()
+        if project is None:
+            raise ValueError("Nenhuma animação carregada")
+        layers: list[dict[str, object]] = []
+        for row in range(self.layer_table.rowCount()):
+            combo_anim, spin_weight, combo_blend, mask_edit = (
+                self.layer_table.cellWidget(row, column) for column in range(4)
+            )
+            if combo_anim.currentData() is None:
+                raise ValueError(f"Camada {row + 1} sem animação")
+            layer: dict[str, object] = {"path": combo_anim.currentData(), "weight": spin_weight.value()}
+            if combo_blend.currentData():
+                layer["blend"] = combo_blend.currentData()
+            text = mask_edit.text().replace(",", " ").split()
+            if text:
+                try:
+                    layer["mask"] = [int(sid) for sid in text]
+                except ValueError as exc:
+                    raise ValueError(f"storeIDs inválidos na camada {row + 1}") from exc
+            layers.append(layer)
+        return {
+            "project": project,
+            "layers": layers,
+            "new_name": self.new_name_edit.text().strip() or None,
+            "frame_count": self.spin_frames.value() or None,
+            "mode": self.combo_mode.currentData(),
+        }
+
+
+def run_app(started_at: float | None = None) -> None:
     app = QtWidgets.QApplication(sys.argv)
+    parser = argparse.ArgumentParser(prog="CPM_Editor")
+    parser.add_argument("projeto2", nargs="?", help="Projeto 2 (.cpmproject) para abrir ao iniciar")
+    parser.add_argument("--projeto1", help="Projeto 1 (.cpmproject) para abrir ao iniciar")
+    args, _ = parser.parse_known_args(app.arguments()[1:])
     window = JSONMergerWindow()
+    # O carregamento roda na thread de tarefas enquanto a janela aparece
+    window.open_projects(args.projeto1, args.projeto2)
     window.show()
+    if started_at is not None:
+        elapsed = (time.perf_counter() - started_at) * 1000
+        window.statusBar().showMessage(f"Pronto em {elapsed:.0f} ms", 6000)
     sys.exit(app.exec())
 
 
@@ -0,0 +1,142 @@
+import argparse
+import sys
+import tracemalloc
+from typing import Any
+
+from json_merger import JSONMergerLogic
+
+
+# Estimativa do tamanho de estruturas Python. Objetos já contados (ex.: os bytes de um membro que
+# também estão no cache de frames modificados) entram só uma vez, na primeira categoria que os vê.
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        ident = id(current)
+        if ident in seen:
+            continue
+        seen.add(ident)
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return total
+
+
+def memory_report(logic: JSONMergerLogic, extras: dict[str, int] | None = None) -> dict[str, Any]:
+    # A foto do tracemalloc vem antes da estimativa, que aloca o próprio conjunto de vistos
+    traced: dict[str, Any] | None = None
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        traced = {
+            "current": current,
+            "peak": peak,
+            "top": [
+                {"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "bytes": stat.size}
+                for stat in snapshot.statistics("lineno")[:10]
+            ],
+        }
+    seen: set[int] = set()
+    groups: list[dict[str, Any]] = []
+    for project in (1, 2):
+        archive: dict[str, bytes] = getattr(logic, f"project{project}_archive")
+        members = sorted(
+            ((name, deep_sizeof(data, seen)) for name, data in archive.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        model = {"name": "config.json (modelo)", "bytes": deep_sizeof(getattr(logic, f"json{project}"), seen)}
+        groups.append(
+            {
+                "name": f"Projeto {project}",
+                "path": getattr(logic, f"project{project}_path"),
+                "items": [model, *({"name": name, "bytes": size} for name, size in members)],
+            }
+        )
+    groups.append(
+        {
+            "name": "Caches",
+            "items": [
+                {"name": "hierarquia do modelo", "bytes": deep_sizeof(logic._model_cache, seen)},
+                {"name": "elementos modificados por frame", "bytes": deep_sizeof(logic._modified_cache, seen)},
+            ],
+        }
+    )
+    groups.append(
+        {
+            "name": "Área de transferência",
+            "items": [
+                {"name": "elemento", "bytes": deep_sizeof(logic.clipboard, seen)},
+                {"name": "animação", "bytes": deep_sizeof(logic.animation_clipboard, seen)},
+            ],
+        }
+    )
+    if extras:
+        groups.append(
+            {"name": "Interface", "items": [{"name": name, "bytes": size} for name, size in extras.items()]}
+        )
+    for group in groups:
+        group["bytes"] = sum(item["bytes"] for item in group["items"])
+    report: dict[str, Any] = {"groups": groups, "estimated": sum(group["bytes"] for group in groups)}
+    if traced is not None:
+        report["traced"] = traced
+    return report
+
+
+def format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def format_report(report: dict[str, Any], members: int = 10) -> str:
+    lines = [f"Estimado: {format_size(report['estimated'])}"]
+    for group in report["groups"]:
+        title = group["name"] + (f" ({group['path']})" if group.get("path") else "")
+        lines.append(f"{title}: {format_size(group['bytes'])}")
+        items = group["items"]
+        for item in items[:members]:
+            lines.append(f"  {item['name']}: {format_size(item['bytes'])}")
+        if len(items) > members:
+            rest = sum(item["bytes"] for item in items[members:])
+            lines.append(f"  ... mais {len(items) - members} membro(s): {format_size(rest)}")
+    traced = report.get("traced")
+    if traced:
+        lines.append(
+            f"tracemalloc: atual {format_size(traced['current'])}, pico {format_size(traced['peak'])}"
+        )
+        for entry in traced["top"]:
+            lines.append(f"  {entry['where']}: {format_size(entry['bytes'])}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Relatório de memória dos projetos abertos")
+    parser.add_argument("projeto2", nargs="?", help="Projeto 2 (.cpmproject)")
+    parser.add_argument("--projeto1", help="Projeto 1 (.cpmproject)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Rastrear alocações durante o carregamento")
+    parser.add_argument("--membros", type=int, default=10, help="Membros do arquivo listados por projeto")
+    args = parser.parse_args(argv)
+    if args.tracemalloc:
+        tracemalloc.start()
+    logic = JSONMergerLogic()
+    if args.projeto1:
+        logic.load_project1(args.projeto1)
+    if args.projeto2:
+        logic.load_project2(args.projeto2)
+    print(format_report(memory_report(logic), args.membros))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+import math
+from typing import Any, Iterable, Sequence
+
+import vector_math
+from vector_math import ONE, Vec3
+
+# Matriz afim 3x4 por linhas: (r00, r01, r02, tx, r10, r11, r12, ty, r20, r21, r22, tz)
+Matrix = tuple[float, ...]
+
+IDENTITY: Matrix = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+# Pivôs das partes vanilla do jogador; o "pos" das raízes do config é relativo a eles
+VANILLA_PIVOTS: dict[str, Vec3] = {
+    "head": (0.0, 0.0, 0.0),
+    "body": (0.0, 0.0, 0.0),
+    "right_arm": (-5.0, 2.0, 0.0),
+    "left_arm": (5.0, 2.0, 0.0),
+    "right_leg": (-1.9, 12.0, 0.0),
+    "left_leg": (1.9, 12.0, 0.0),
+}
+
+
+def local_many(positions: Sequence[Vec3], rotations: Sequence[Vec3], scales: Sequence[Vec3]) -> list[Matrix]:
+    # Mesma ordem do ModelPart: translada até o pivô, gira Z, Y, X (graus) e escala
+    result: list[Matrix] = []
+    for (px, py, pz), (rx, ry, rz), (sx, sy, sz) in zip(positions, rotations, scales):
+        ax, ay, az = math.radians(rx), math.radians(ry), math.radians(rz)
+        ca, sa = math.cos(ax), math.sin(ax)
+        cb, sb = math.cos(ay), math.sin(ay)
+        cc, sc = math.cos(az), math.sin(az)
+        result.append(
+            (
+                cc * cb * sx, (cc * sb * sa - sc * ca) * sy, (cc * sb * ca + sc * sa) * sz, px,
+                sc * cb * sx, (sc * sb * sa + cc * ca) * sy, (sc * sb * ca - cc * sa) * sz, py,
+                -sb * sx, cb * sa * sy, cb * ca * sz, pz,
+            )
+        )
+    return result
+
+
+def compose_many(parents: Sequence[Matrix], children: Sequence[Matrix]) -> list[Matrix]:
+    result: list[Matrix] = []
+    for p, c in zip(parents, children):
+        result.append(
+            (
+                p[0] * c[0] + p[1] * c[4] + p[2] * c[8],
+                p[0] * c[1] + p[1] * c[5] + p[2] * c[9],
+                p[0] * c[2] + p[1] * c[6] + p[2] * c[10],
+                p[0] * c[3] + p[1] * c[7] + p[2] * c[11] + p[3],
+                p[4] * c[0] + p[5] * c[4] + p[6] * c[8],
+                p[4] * c[1] + p[5] * c[5] + p[6] * c[9],
+                p[4] * c[2] + p[5] * c[6] + p[6] * c[10],
+                p[4] * c[3] + p[5] * c[7] + p[6] * c[11] + p[7],
+                p[8] * c[0] + p[9] * c[4] + p[10] * c[8],
+                p[8] * c[1] + p[9] * c[5] + p[10] * c[9],
+                p[8] * c[2] + p[9] * c[6] + p[10] * c[10],
+                p[8] * c[3] + p[9] * c[7] + p[10] * c[11] + p[11],
+            )
+        )
+    return result
+
+
+def invert_many(matrices: Sequence[Matrix]) -> list[Matrix]:
+    result: list[Matrix] = []
+    for m in matrices:
+        a, b, c, tx, d, e, f, ty, g, h, i, tz = m
+        co0, co1, co2 = e * i - f * h, f * g - d * i, d * h - e * g
+        det = a * co0 + b * co1 + c * co2
+        if abs(det) < 1e-12:
+            raise ValueError("Matriz sem inversa (escala zero)")
+        inv = 1.0 / det
+        r = (
+            co0 * inv, (c * h - b * i) * inv, (b * f - c * e) * inv,
+            co1 * inv, (a * i - c * g) * inv, (c * d - a * f) * inv,
+            co2 * inv, (b * g - a * h) * inv, (a * e - b * d) * inv,
+        )
+        result.append(
+            (
+                r[0], r[1], r[2], -(r[0] * tx + r[1] * ty + r[2] * tz),
+                r[3], r[4], r[5], -(r[3] * tx + r[4] * ty + r[5] * tz),
+                r[6], r[7], r[8], -(r[6] * tx + r[7] * ty + r[8] * tz),
+            )
+        )
+    return result
+
+
+def decompose_many(matrices: Sequence[Matrix]) -> list[tuple[Vec3, Vec3, Vec3]]:
+    # Inverso de local_many: (pos, rotation em graus, scale); sem cisalhamento
+    result: list[tuple[Vec3, Vec3, Vec3]] = []
+    for m in matrices:
+        sx = math.sqrt(m[0] * m[0] + m[4] * m[4] + m[8] * m[8]) or 1.0
+        sy = math.sqrt(m[1] * m[1] + m[5] * m[5] + m[9] * m[9]) or 1.0
+        sz = math.sqrt(m[2] * m[2] + m[6] * m[6] + m[10] * m[10]) or 1.0
+        r00, r10, r20 = m[0] / sx, m[4] / sx, m[8] / sx
+        r11, r21 = m[5] / sy, m[9] / sy
+        r12, r22 = m[6] / sz, m[10] / sz
+        ry = math.asin(max(-1.0, min(1.0, -r20)))
+        if abs(r20) < 0.999999:
+            rx = math.atan2(r21, r22)
+            rz = math.atan2(r10, r00)
+        else:
+            # Trava de cardã: Z fica zero e o giro todo vai para X
+            rx = math.atan2(-r12, r11)
+            rz = 0.0
+        result.append(
+            (
+                (m[3], m[7], m[11]),
+                (math.degrees(rx), math.degrees(ry), math.degrees(rz)),
+                (sx, sy, sz),
+            )
+        )
+    return result
+
+
+def transform_point(matrix: Matrix, point: Vec3) -> Vec3:
+    x, y, z = point
+    return (
+        matrix[0] * x + matrix[1] * y + matrix[2] * z + matrix[3],
+        matrix[4] * x + matrix[5] * y + matrix[6] * z + matrix[7],
+        matrix[8] * x + matrix[9] * y + matrix[10] * z + matrix[11],
+    )
+
+
+# Hierarquia achatada em pré-ordem: a subárvore do nó i ocupa os índices i..end[i]-1, então
+# reavaliar um frame só percorre os nós animados e seus descendentes, nível por nível.
+class PoseEvaluator:
+    def __init__(self, model: Any) -> None:
+        self.parents: list[int] = []
+        self.depths: list[int] = []
+        self.ends: list[int] = []
+        self.store_ids: list[int | None] = []
+        # storeID ou id/nome de cada nó, guardados na construção (o modelo pode mudar depois)
+        self.keys: list[Any] = []
+        self.nodes: list[dict[str, Any]] = []
+        self.rest_pos: list[Vec3] = []
+        self.rest_rotation: list[Vec3] = []
+        self.rest_scale: list[Vec3] = []
+        # Todos os nós de cada storeID (o +Movment deixa clones Anti_ com o mesmo ID)
+        self.by_store: dict[int, list[int]] = {}
+
+        def walk(items: list, parent: int, depth: int) -> None:
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                index = len(self.nodes)
+                self.nodes.append(item)
+                self.parents.append(parent)
+                self.depths.append(depth)
+                self.ends.append(index + 1)
+                sid = item.get("storeID")
+                self.store_ids.append(sid if isinstance(sid, int) else None)
+                self.keys.append(sid if isinstance(sid, int) else item.get("id") or item.get("name"))
+                if isinstance(sid, int):
+                    self.by_store.setdefault(sid, []).append(index)
+                pos = vector_math.read(item.get("pos"))
+                pivot = VANILLA_PIVOTS.get(item.get("id")) if parent < 0 else None
+                if pivot is not None:
+                    pos = vector_math.add(pos, pivot)
+                self.rest_pos.append(pos)
+                self.rest_rotation.append(vector_math.read(item.get("rotation")))
+                self.rest_scale.append(vector_math.read(item.get("scale"), ONE))
+                for key in ("children", "elements"):
+                    value = item.get(key)
+                    if isinstance(value, list):
+                        walk(value, index, depth + 1)
+                self.ends[index] = len(self.nodes)
+
+        if isinstance(model, dict):
+            walk(model.get("elements") or [], -1, 0)
+        elif isinstance(model, list):
+            walk(model, -1, 0)
+        self.rest_local = local_many(self.rest_pos, self.rest_rotation, self.rest_scale)
+        self.rest_world = self._propagate(self.rest_local, range(len(self.nodes)), list(self.rest_local))
+
+    def _propagate(self, local: list[Matrix], indices: Iterable[int], world: list[Matrix]) -> list[Matrix]:
+        # Compõe com o pai um nível de cada vez; os pais de um nível já estão prontos
+        levels: dict[int, list[int]] = {}
+        for index in indices:
+            levels.setdefault(self.depths[index], []).append(index)
+        for depth in sorted(levels):
+            batch = levels[depth]
+            parents = [world[self.parents[i]] if self.parents[i] >= 0 else IDENTITY for i in batch]
+            for index, matrix in zip(batch, compose_many(parents, [local[i] for i in batch])):
+                world[index] = matrix
+        return world
+
+    def chain(self, index: int) -> tuple[Any, ...]:
+        keys: list[Any] = []
+        parent = self.parents[index]
+        while parent >= 0:
+            keys.append(self.keys[parent])
+            parent = self.parents[parent]
+        return tuple(keys)
+
+    def _output(self, world: list[Matrix], store_ids: Iterable[int] | None) -> dict[int, Matrix]:
+        wanted = self.by_store if store_ids is None else store_ids
+        return {sid: world[self.by_store[sid][0]] for sid in wanted if sid in self.by_store}
+
+    def rest(self, store_ids: Iterable[int] | None = None) -> dict[int, Matrix]:
+        return self._output(self.rest_world, store_ids)
+
+    def local_world(self, components: Any) -> tuple[list[Matrix], list[Matrix]]:
+        # Componentes somam pos/rotation ao modelo (como o aplicar-frame) e multiplicam scale
+        touched: dict[int, dict[str, Any]] = {}
+        for comp in components if isinstance(components, list) else []:
+            if not isinstance(comp, dict) or not isinstance(comp.get("storeID"), int):
+                continue
+            for index in self.by_store.get(comp["storeID"], []):
+                touched[index] = comp
+        if not touched:
+            return self.rest_local, self.rest_world
+        indices = sorted(touched)
+        comps = [touched[i] for i in indices]
+        positions = vector_math.add_many(
+            [self.rest_pos[i] for i in indices], vector_math.read_many([c.get("pos") for c in comps])
+        )
+        rotations = vector_math.add_many(
+            [self.rest_rotation[i] for i in indices], vector_math.read_many([c.get("rotation") for c in comps])
+        )
+        scales = [
+            (s[0] * f[0], s[1] * f[1], s[2] * f[2])
+            for s, f in zip(
+                [self.rest_scale[i] for i in indices], vector_math.read_many([c.get("scale") for c in comps], ONE)
+            )
+        ]
+        local = list(self.rest_local)
+        for index, matrix in zip(indices, local_many(positions, rotations, scales)):
+            local[index] = matrix
+        affected: set[int] = set()
+        for index in indices:
+            if index not in affected:
+                affected.update(range(index, self.ends[index]))
+        return local, self._propagate(local, affected, list(self.rest_world))
+
+    def evaluate(self, components: Any = None, store_ids: Iterable[int] | None = None) -> dict[int, Matrix]:
+        return self._output(self.local_world(components)[1], store_ids)
+
+    def evaluate_frames(
+        self, frames: Sequence[Any], store_ids: Iterable[int] | None = None
+    ) -> list[dict[int, Matrix]]:
+        wanted = list(self.by_store if store_ids is None else store_ids)
+        return [
+            self.evaluate(frame.get("components") if isinstance(frame, dict) else None, wanted)
+            for frame in frames
+        ]
+
+
+def _close(a: Sequence[float], b: Sequence[float], tolerance: float) -> bool:
+    return all(abs(x - y) <= tolerance for x, y in zip(a, b))
+
+
+def changed_store_ids(before: PoseEvaluator, after: PoseEvaluator, tolerance: float = 1e-6) -> list[int]:
+    # storeIDs cujo pai mudou ou cuja pose de repouso mudou, ordenados do mais raso ao mais fundo
+    changed: list[int] = []
+    for sid, indices in after.by_store.items():
+        previous = before.by_store.get(sid)
+        if not previous:
+            continue
+        old, new = previous[0], indices[0]
+        if (
+            before.chain(old) != after.chain(new)
+            or not _close(before.rest_local[old], after.rest_local[new], tolerance)
+            or not _close(before.rest_world[old], after.rest_world[new], tolerance)
+        ):
+            changed.append(sid)
+    return sorted(changed, key=lambda sid: (after.depths[after.by_store[sid][0]], sid))
+
+
+def _nearest_angle(angle: float, reference: float) -> float:
+    return angle + 360.0 * round((reference - angle) / 360.0)
+
+
+def rebake_frame(
+    before: PoseEvaluator,
+    after: PoseEvaluator,
+    frame: Any,
+    targets: Sequence[int],
+    tolerance: float = 1e-4,
+) -> int:
+    # Reescreve os componentes de `targets` para que a pose no mundo do frame, avaliada na hierarquia
+    # nova, seja a mesma da antiga. Resolve um nível por vez: o pai já corrigido entra no filho.
+    components = frame.get("components") if isinstance(frame, dict) else None
+    if not isinstance(components, list) or not targets:
+        return 0
+    wanted = before.evaluate(components, targets)
+    by_sid = {
+        comp["storeID"]: position
+        for position, comp in enumerate(components)
+        if isinstance(comp, dict) and isinstance(comp.get("storeID"), int)
+    }
+    levels: dict[int, list[int]] = {}
+    for sid in targets:
+        if sid in wanted and sid in after.by_store:
+            levels.setdefault(after.depths[after.by_store[sid][0]], []).append(sid)
+    result = list(components)
+    changed = 0
+    for depth in sorted(levels):
+        batch = levels[depth]
+        world = after.local_world(result)[1]
+        indices = [after.by_store[sid][0] for sid in batch]
+        parents = [world[after.parents[i]] if after.parents[i] >= 0 else IDENTITY for i in indices]
+        poses = decompose_many(compose_many(invert_many(parents), [wanted[sid] for sid in batch]))
+        # O nível inteiro passa junto pelo kernel: componentes atuais e deltas em relação ao repouso novo
+        existing_comps = [result[by_sid[sid]] if sid in by_sid else {} for sid in batch]
+        old_positions = vector_math.read_many([comp.get("pos") for comp in existing_comps])
+        old_rotations = vector_math.read_many([comp.get("rotation") for comp in existing_comps])
+        old_scales = vector_math.read_many([comp.get("scale") for comp in existing_comps], ONE)
+        new_positions = vector_math.sub_many([pos for pos, _, _ in poses], [after.rest_pos[i] for i in indices])
+        deltas = vector_math.sub_many([rot for _, rot, _ in poses], [after.rest_rotation[i] for i in indices])
+        for position, (sid, index) in enumerate(zip(batch, indices)):
+            existing = existing_comps[position] or None
+            old_pos, old_rotation, old_scale = old_positions[position], old_rotations[position], old_scales[position]
+            new_pos, delta, scale = new_positions[position], deltas[position], poses[position][2]
+            rest_scale = after.rest_scale[index]
+            # Mantém o ângulo perto do valor antigo para não gerar saltos de 360° entre frames
+            new_rotation = tuple(_nearest_angle(value, reference) for value, reference in zip(delta, old_rotation))
+            new_scale = tuple(value / (base or 1.0) for value, base in zip(scale, rest_scale))
+            if (
+                _close(new_pos, old_pos, tolerance)
+                and _close(new_rotation, old_rotation, tolerance)
+                and _close(new_scale, old_scale, tolerance)
+            ):
+                continue
+            comp = dict(existing) if existing else {"storeID": sid}
+            comp["pos"] = vector_math.write(tuple(round(v, 6) for v in new_pos), comp.get("pos"))
+            comp["rotation"] = vector_math.write(tuple(round(v, 6) for v in new_rotation), comp.get("rotation"))
+            if "scale" in comp or not _close(new_scale, ONE, tolerance):
+                comp["scale"] = vector_math.write(tuple(round(v, 6) for v in new_scale), comp.get("scale"))
+            if sid in by_sid:
+                result[by_sid[sid]] = comp
+            else:
+                by_sid[sid] = len(result)
+                result.append(comp)
+            changed += 1
+    if changed:
+        frame["components"] = result
+    return changed
@@ -0,0 +1,129 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+# Registro de tempos no formato de eventos completos ("X") do Chrome trace / Perfetto
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: list[dict[str, Any]] = []
+        self._stats: dict[str, dict[str, float]] = {}
+        self._wrapped: list[tuple[Any, str]] = []
+        self._origin = time.perf_counter()
+        self.on_record: Callable[[str, float, dict[str, Any]], None] | None = None
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[dict[str, Any]]:
+        if not self.enabled:
+            yield args
+            return
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            duration = time.perf_counter() - start
+            self._local.depth = depth
+            self._record(name, start, duration, depth, args)
+
+    def wrap(
+        self,
+        func: Callable[..., Any],
+        name: str,
+        sizer: Callable[[Any, dict[str, Any]], None] | None = None,
+        counters: Callable[[], dict[str, int]] | None = None,
+    ) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with self.span(name) as info:
+                before = counters() if counters is not None else None
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    # Contadores cumulativos viram a diferença durante a chamada (inclui as aninhadas)
+                    if before is not None:
+                        for key, value in counters().items():
+                            delta = value - before.get(key, 0)
+                            if delta:
+                                info[key] = delta
+                if sizer is not None:
+                    sizer(result, info)
+                return result
+
+        return wrapper
+
+    def instrument(
+        self,
+        target: Any,
+        names: list[str],
+        prefix: str,
+        sizer: Callable[[Any, dict[str, Any]], None] | None = None,
+        counters: Callable[[], dict[str, int]] | None = None,
+        remember: bool = True,
+    ) -> None:
+        # Envolve métodos da instância (não da classe), então outras instâncias seguem sem custo.
+        # Cópias descartáveis (remember=False) não ficam presas na lista de desfazer.
+        for name in names:
+            method = getattr(target, name, None)
+            if not callable(method) or name in vars(target):
+                continue
+            setattr(target, name, self.wrap(method, f"{prefix}.{name}", sizer, counters))
+            if remember:
+                self._wrapped.append((target, name))
+
+    def uninstrument(self) -> None:
+        for target, name in self._wrapped:
+            if name in vars(target):
+                delattr(target, name)
+        self._wrapped = []
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events = []
+            self._stats = {}
+
+    def export_chrome_trace(self, path: str) -> int:
+        with self._lock:
+            events = list(self._events)
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [{"pid": pid, **event} for event in events],
+            "displayTimeUnit": "ms",
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(trace, handle)
+        return len(events)
+
+    def _record(self, name: str, start: float, duration: float, depth: int, args: dict[str, Any]) -> None:
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start - self._origin) * 1_000_000,
+            "dur": duration * 1_000_000,
+            "tid": threading.get_ident(),
+            "args": dict(args),
+        }
+        with self._lock:
+            self._events.append(event)
+            stats = self._stats.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+            stats["calls"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+        # Só as operações de nível mais alto vão para a barra de status
+        if depth == 0 and self.on_record is not None:
+            self.on_record(name, duration, dict(args))
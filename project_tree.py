@@ -0,0 +1,730 @@
+from typing import Any, Iterator, List
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+ELEMENT_KEYS = ("children", "elements")
+PATH_ROLE = QtCore.Qt.ItemDataRole.UserRole
+
+
+def color_from_namecolor(element: Any) -> QtGui.QColor:
+    value = element.get("nameColor") if isinstance(element, dict) else None
+    color_val: int | None = None
+    if isinstance(value, int):
+        color_val = value
+    elif isinstance(value, str):
+        try:
+            color_val = int(value)
+        except ValueError:
+            color_val = None
+    if color_val is not None:
+        return QtGui.QColor(f"#{color_val:06x}")
+    return QtGui.QColor("#1b7fb3")
+
+
+class _TreeNode:
+    __slots__ = ("parent", "kind", "key", "row", "ref", "match", "children")
+
+    def __init__(self, parent: "_TreeNode | None", kind: str, key: Any = None, row: int = 0) -> None:
+        self.parent = parent
+        self.kind = kind
+        self.key = key
+        self.row = row
+        self.ref: Any = None
+        self.match: Any = None
+        self.children: list["_TreeNode"] | None = None
+
+
+# Modelo preguiçoso sobre o config.json: as linhas só existem depois que o ramo é expandido
+class ProjectTreeModel(QtCore.QAbstractItemModel):
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._data: Any = {}
+        self.show_colors = False
+        self._sentinel = self._new_sentinel()
+
+    def _new_sentinel(self) -> _TreeNode:
+        sentinel = _TreeNode(None, "sentinel")
+        root = _TreeNode(sentinel, "root")
+        root.ref = self._data if isinstance(self._data, (dict, list)) else None
+        sentinel.children = [root]
+        return sentinel
+
+    def set_root_data(self, data: Any) -> None:
+        self.beginResetModel()
+        self._data = data
+        self._sentinel = self._new_sentinel()
+        self.endResetModel()
+
+    def root_data(self) -> Any:
+        return self._data
+
+    def root_node(self) -> _TreeNode:
+        assert self._sentinel.children
+        return self._sentinel.children[0]
+
+    def set_show_colors(self, enabled: bool) -> None:
+        if enabled == self.show_colors:
+            return
+        self.show_colors = enabled
+        self._emit_loaded_changed(self._sentinel)
+
+    # ----- Valores e rótulos
+    def value(self, node: _TreeNode) -> Any:
+        if node.kind == "root":
+            return self._data
+        if node.parent is None:
+            return None
+        container = self.value(node.parent)
+        if node.kind == "leaf":
+            return container
+        try:
+            return container[node.key]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    def node_path(self, node: _TreeNode) -> List[int | str]:
+        path: List[int | str] = []
+        current: _TreeNode | None = node
+        while current is not None and current.kind not in ("root", "sentinel"):
+            if current.kind != "leaf":
+                path.append(current.key)
+            current = current.parent
+        path.reverse()
+        return path
+
+    def is_leaf(self, node: _TreeNode) -> bool:
+        return node.kind == "leaf"
+
+    def _label(self, node: _TreeNode, value: Any) -> str:
+        if node.kind == "root":
+            return "root"
+        if node.kind == "entry":
+            return str(node.key)
+        if node.kind == "item":
+            if isinstance(value, dict):
+                return str(value.get("id") or value.get("name") or f"[{node.key}]")
+            return f"[{node.key}]"
+        return repr(value)
+
+    def _label_color(self, element: Any) -> QtGui.QColor:
+        if self.show_colors:
+            return color_from_namecolor(element)
+        return QtGui.QColor("#7a7a7a")
+
+    def _foreground(self, node: _TreeNode, value: Any) -> QtGui.QColor:
+        if node.kind == "entry":
+            return self._label_color(value) if isinstance(value, dict) else QtGui.QColor("#7a7a7a")
+        if node.kind == "item" and isinstance(value, dict):
+            return self._label_color(value)
+        return QtGui.QColor("#5c5c5c")
+
+    # ----- API do QAbstractItemModel
+    def node_from_index(self, index: QtCore.QModelIndex) -> _TreeNode:
+        if not index.isValid():
+            return self._sentinel
+        return index.internalPointer()
+
+    def index_for_node(self, node: _TreeNode) -> QtCore.QModelIndex:
+        if node.kind == "sentinel":
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        node = self.node_from_index(parent)
+        if column != 0 or node.children is None or row < 0 or row >= len(node.children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        node: _TreeNode = index.internalPointer()
+        if node.parent is None or node.parent.kind == "sentinel":
+            return QtCore.QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = self.node_from_index(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        node = self.node_from_index(parent)
+        if node.children is not None:
+            return bool(node.children)
+        return self._has_content(node)
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        node = self.node_from_index(parent)
+        return node.children is None and self._has_content(node)
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        self.load_children(self.node_from_index(parent))
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node: _TreeNode = index.internalPointer()
+        if role == PATH_ROLE:
+            return self.node_path(node)
+        value = self.value(node)
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._label(node, value)
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+            return QtGui.QBrush(self._foreground(node, value))
+        if role == QtCore.Qt.ItemDataRole.FontRole and node.kind == "item" and isinstance(value, dict):
+            font = QtGui.QFont()
+            font.setBold(True)
+            return font
+        return None
+
+    # ----- Carregamento preguiçoso
+    def _has_content(self, node: _TreeNode) -> bool:
+        if node.kind in ("leaf", "sentinel"):
+            return False
+        value = self.value(node)
+        if isinstance(value, (dict, list)):
+            return bool(value)
+        return True
+
+    def _child_specs(self, node: _TreeNode, value: Any) -> list[tuple[str, Any, Any, Any]]:
+        specs: list[tuple[str, Any, Any, Any]] = []
+        if isinstance(value, dict):
+            for key, val in value.items():
+                ref = val if isinstance(val, (dict, list)) else None
+                specs.append(("entry", key, ref, ("k", key)))
+        elif isinstance(value, list):
+            seen: dict[int, int] = {}
+            for idx, val in enumerate(value):
+                if isinstance(val, (dict, list)):
+                    occurrence = seen.get(id(val), 0)
+                    seen[id(val)] = occurrence + 1
+                    specs.append(("item", idx, val, ("c", id(val), occurrence)))
+                else:
+                    specs.append(("item", idx, None, ("s", idx)))
+        elif node.kind not in ("leaf", "sentinel"):
+            specs.append(("leaf", None, None, ("leaf",)))
+        return specs
+
+    @staticmethod
+    def _node_from_spec(parent: _TreeNode, spec: tuple[str, Any, Any, Any], row: int) -> _TreeNode:
+        kind, key, ref, match = spec
+        child = _TreeNode(parent, kind, key, row)
+        child.ref = ref
+        child.match = match
+        return child
+
+    def load_children(self, node: _TreeNode) -> None:
+        if node.children is not None:
+            return
+        specs = self._child_specs(node, self.value(node))
+        if not specs:
+            node.children = []
+            return
+        # A lista vazia já marca o nó como carregado caso alguém reentre pelo sinal
+        node.children = []
+        self.beginInsertRows(self.index_for_node(node), 0, len(specs) - 1)
+        node.children.extend(self._node_from_spec(node, spec, row) for row, spec in enumerate(specs))
+        self.endInsertRows()
+
+    def children_of(self, node: _TreeNode) -> list[_TreeNode]:
+        self.load_children(node)
+        return node.children or []
+
+    def node_for_path(self, path: List[int | str], leaf: bool = False) -> _TreeNode | None:
+        node = self.root_node()
+        for part in path:
+            match = None
+            for child in self.children_of(node):
+                if child.kind != "leaf" and child.key == part:
+                    match = child
+                    break
+            if match is None:
+                return None
+            node = match
+        if leaf:
+            children = self.children_of(node)
+            if children and children[0].kind == "leaf":
+                return children[0]
+        return node
+
+    def loaded_node_for_path(self, path: List[int | str]) -> _TreeNode | None:
+        node = self.root_node()
+        for part in path:
+            if node.children is None:
+                return None
+            match = None
+            for child in node.children:
+                if child.kind != "leaf" and child.key == part:
+                    match = child
+                    break
+            if match is None:
+                return None
+            node = match
+        return node
+
+    def iter_nodes(self, elements_only: bool = False) -> Iterator[tuple[str, List[int | str], bool]]:
+        # Percorre os dados (sem criar linhas) devolvendo (rótulo, caminho, folha)
+        def walk_full(value: Any, path: List[int | str]) -> Iterator[tuple[str, List[int | str], bool]]:
+            if isinstance(value, dict):
+                for key, val in value.items():
+                    yield str(key), path + [key], False
+                    yield from walk_full(val, path + [key])
+            elif isinstance(value, list):
+                for idx, element in enumerate(value):
+                    if isinstance(element, dict):
+                        label = element.get("id") or element.get("name") or f"[{idx}]"
+                    else:
+                        label = f"[{idx}]"
+                    yield str(label), path + [idx], False
+                    yield from walk_full(element, path + [idx])
+            else:
+                yield repr(value), path, True
+
+        def walk_elements(value: Any, path: List[int | str]) -> Iterator[tuple[str, List[int | str], bool]]:
+            if isinstance(value, dict):
+                for key in ELEMENT_KEYS:
+                    val = value.get(key)
+                    if isinstance(val, list):
+                        for idx, element in enumerate(val):
+                            if not isinstance(element, dict):
+                                continue
+                            label = element.get("id") or element.get("name") or f"[{idx}]"
+                            yield str(label), path + [key, idx], False
+                            yield from walk_elements(element, path + [key, idx])
+            elif isinstance(value, list):
+                for idx, element in enumerate(value):
+                    yield from walk_elements(element, path + [idx])
+
+        yield "root", [], False
+        if elements_only:
+            yield from walk_elements(self._data, [])
+        else:
+            yield from walk_full(self._data, [])
+
+    # ----- Sincronização incremental
+    def sync_path(self, path: List[int | str], recursive: bool = True) -> None:
+        node = self.loaded_node_for_path(path)
+        if node is None:
+            return
+        self._sync(node, recursive)
+        index = self.index_for_node(node)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def _sync(self, node: _TreeNode, recursive: bool) -> None:
+        value = self.value(node)
+        if node.kind in ("root", "entry", "item"):
+            node.ref = value if isinstance(value, (dict, list)) else None
+        if node.children is None:
+            return
+        specs = self._child_specs(node, value)
+        positions = {spec[3]: idx for idx, spec in enumerate(specs)}
+        parent_index = self.index_for_node(node)
+
+        keep: set[int] = set()
+        last = -1
+        for child in node.children:
+            pos = positions.get(child.match)
+            if pos is not None and pos > last:
+                keep.add(id(child))
+                last = pos
+        for row in range(len(node.children) - 1, -1, -1):
+            if id(node.children[row]) in keep:
+                continue
+            self.beginRemoveRows(parent_index, row, row)
+            node.children.pop(row)
+            self._renumber(node, row)
+            self.endRemoveRows()
+
+        for row, spec in enumerate(specs):
+            if row < len(node.children) and node.children[row].match == spec[3]:
+                child = node.children[row]
+                child.key = spec[1]
+                replaced = child.ref is not spec[2]
+                child.ref = spec[2]
+                if child.children is not None and (recursive or replaced):
+                    self._sync(child, recursive)
+                continue
+            self.beginInsertRows(parent_index, row, row)
+            node.children.insert(row, self._node_from_spec(node, spec, row))
+            self._renumber(node, row)
+            self.endInsertRows()
+
+        if node.children:
+            self.dataChanged.emit(
+                self.index_for_node(node.children[0]), self.index_for_node(node.children[-1])
+            )
+
+    @staticmethod
+    def _renumber(node: _TreeNode, start: int) -> None:
+        assert node.children is not None
+        for row in range(start, len(node.children)):
+            child = node.children[row]
+            child.row = row
+            if child.kind == "item":
+                child.key = row
+
+    def _emit_loaded_changed(self, node: _TreeNode) -> None:
+        if not node.children:
+            return
+        self.dataChanged.emit(self.index_for_node(node.children[0]), self.index_for_node(node.children[-1]))
+        for child in node.children:
+            self._emit_loaded_changed(child)
+
+
+# Achata o ProjectTreeModel mostrando só root e os elementos de children/elements
+class ElementsOnlyProxyModel(QtCore.QAbstractProxyModel):
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cache: dict[_TreeNode, list[_TreeNode]] = {}
+        self._rows: dict[_TreeNode, int] = {}
+        self._proxy_parent: dict[_TreeNode, _TreeNode] = {}
+        self._loading = False
+        self._pending: list[_TreeNode] = []
+
+    def setSourceModel(self, source: QtCore.QAbstractItemModel | None) -> None:  # type: ignore[override]
+        old = self.sourceModel()
+        if old is not None:
+            old.modelAboutToBeReset.disconnect(self._on_about_to_reset)
+            old.modelReset.disconnect(self._on_reset)
+            old.rowsAboutToBeRemoved.disconnect(self._on_rows_about_to_be_removed)
+            old.rowsInserted.disconnect(self._on_rows_inserted)
+            old.dataChanged.disconnect(self._on_data_changed)
+        self.beginResetModel()
+        super().setSourceModel(source)
+        self._clear()
+        self.endResetModel()
+        if source is not None:
+            source.modelAboutToBeReset.connect(self._on_about_to_reset)
+            source.modelReset.connect(self._on_reset)
+            source.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+            source.rowsInserted.connect(self._on_rows_inserted)
+            source.dataChanged.connect(self._on_data_changed)
+
+    def _source(self) -> ProjectTreeModel:
+        source = self.sourceModel()
+        assert isinstance(source, ProjectTreeModel)
+        return source
+
+    def _clear(self) -> None:
+        self._cache.clear()
+        self._rows.clear()
+        self._proxy_parent.clear()
+        source = self.sourceModel()
+        if isinstance(source, ProjectTreeModel):
+            sentinel = source.node_from_index(QtCore.QModelIndex())
+            root = source.root_node()
+            self._cache[sentinel] = [root]
+            self._rows[root] = 0
+            self._proxy_parent[root] = sentinel
+
+    # ----- Achatamento
+    def _flatten(self, node: _TreeNode, load: bool = True) -> list[_TreeNode] | None:
+        source = self._source()
+        result: list[_TreeNode] = []
+        self._loading = True
+        try:
+            complete = self._collect(source, node, result, load)
+        finally:
+            self._loading = False
+        return result if complete else None
+
+    def _collect(self, source: ProjectTreeModel, node: _TreeNode, result: list[_TreeNode], load: bool) -> bool:
+        value = source.value(node)
+        if isinstance(value, (dict, list)) and node.children is None:
+            if not load:
+                return False
+            source.load_children(node)
+        if isinstance(value, dict):
+            for entry in node.children or []:
+                if entry.key not in ELEMENT_KEYS or not isinstance(source.value(entry), list):
+                    continue
+                if entry.children is None:
+                    if not load:
+                        return False
+                    source.load_children(entry)
+                for item in entry.children or []:
+                    if isinstance(source.value(item), dict):
+                        result.append(item)
+        elif isinstance(value, list):
+            for item in node.children or []:
+                if not self._collect(source, item, result, load):
+                    return False
+        return True
+
+    def _has_elements(self, value: Any) -> bool:
+        if isinstance(value, dict):
+            for key in ELEMENT_KEYS:
+                val = value.get(key)
+                if isinstance(val, list) and any(isinstance(el, dict) for el in val):
+                    return True
+        elif isinstance(value, list):
+            return any(self._has_elements(item) for item in value)
+        return False
+
+    def _set_children(self, node: _TreeNode, children: list[_TreeNode]) -> None:
+        self._cache[node] = children
+        for row, child in enumerate(children):
+            self._rows[child] = row
+            self._proxy_parent[child] = node
+
+    def _purge(self, node: _TreeNode) -> None:
+        self._rows.pop(node, None)
+        self._proxy_parent.pop(node, None)
+        for child in self._cache.pop(node, []):
+            self._purge(child)
+
+    # ----- Mapeamento
+    def _node(self, index: QtCore.QModelIndex) -> _TreeNode:
+        if not index.isValid():
+            return self._source().node_from_index(QtCore.QModelIndex())
+        return index.internalPointer()
+
+    def _proxy_index(self, node: _TreeNode) -> QtCore.QModelIndex:
+        row = self._rows.get(node)
+        if row is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def mapToSource(self, proxy_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QtCore.QModelIndex()
+        return self._source().index_for_node(proxy_index.internalPointer())
+
+    def mapFromSource(self, source_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+        return self._proxy_index(source_index.internalPointer())
+
+    def index_for_node(self, node: _TreeNode) -> QtCore.QModelIndex:
+        # Carrega os ancestrais visíveis de cima para baixo até o nó aparecer no proxy
+        ancestors: list[_TreeNode] = []
+        current: _TreeNode | None = node.parent
+        while current is not None:
+            ancestors.append(current)
+            current = current.parent
+        self._flush_pending()
+        for ancestor in reversed(ancestors):
+            if ancestor in self._rows and ancestor not in self._cache:
+                self.fetchMore(self._proxy_index(ancestor))
+        return self._proxy_index(node)
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if self.sourceModel() is None or column != 0:
+            return QtCore.QModelIndex()
+        children = self._cache.get(self._node(parent))
+        if children is None or row < 0 or row >= len(children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent_node = self._proxy_parent.get(index.internalPointer())
+        if parent_node is None:
+            return QtCore.QModelIndex()
+        return self._proxy_index(parent_node)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if self.sourceModel() is None or parent.column() > 0:
+            return 0
+        return len(self._cache.get(self._node(parent), []))
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if self.sourceModel() is None:
+            return False
+        node = self._node(parent)
+        if node in self._cache:
+            return bool(self._cache[node])
+        return self._has_elements(self._source().value(node))
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if self.sourceModel() is None:
+            return False
+        node = self._node(parent)
+        return node not in self._cache and self._has_elements(self._source().value(node))
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        node = self._node(parent)
+        if node in self._cache:
+            return
+        children = self._flatten(node) or []
+        if not children:
+            self._cache[node] = []
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        self._set_children(node, children)
+        self.endInsertRows()
+
+    # ----- Propagação de mudanças do modelo de origem
+    def _visible_ancestor(self, node: _TreeNode | None) -> _TreeNode | None:
+        while node is not None and node not in self._cache:
+            if node in self._rows:
+                return None
+            node = node.parent
+        return node
+
+    def _on_about_to_reset(self) -> None:
+        self.beginResetModel()
+
+    def _on_reset(self) -> None:
+        self._clear()
+        self.endResetModel()
+
+    def _on_rows_about_to_be_removed(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        if self._loading:
+            return
+        source = self._source()
+        source_parent = source.node_from_index(parent)
+        owner = self._visible_ancestor(source_parent)
+        if owner is None or source_parent.children is None:
+            return
+        removed = {id(node) for node in source_parent.children[first : last + 1]}
+        children = self._cache[owner]
+        owner_index = self._proxy_index(owner)
+        for row in range(len(children) - 1, -1, -1):
+            current: _TreeNode | None = children[row]
+            while current is not None and current is not owner and id(current) not in removed:
+                current = current.parent
+            if current is None or current is owner:
+                continue
+            self.beginRemoveRows(owner_index, row, row)
+            self._purge(children.pop(row))
+            self._set_children(owner, children)
+            self.endRemoveRows()
+
+    def _on_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        del first, last
+        if self._loading:
+            return
+        owner = self._visible_ancestor(self._source().node_from_index(parent))
+        if owner is None:
+            return
+        fresh = self._flatten(owner, load=False)
+        if fresh is None:
+            # Carregar o ramo agora aninharia inserções dentro do sinal da origem
+            if not self._pending:
+                QtCore.QTimer.singleShot(0, self._flush_pending)
+            self._pending.append(owner)
+            return
+        self._resync(owner, fresh)
+
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        for owner in pending:
+            if owner in self._cache:
+                self._resync(owner, self._flatten(owner) or [])
+
+    def _resync(self, owner: _TreeNode, fresh: list[_TreeNode]) -> None:
+        children = self._cache[owner]
+        owner_index = self._proxy_index(owner)
+        alive = {id(node) for node in fresh}
+        for row in range(len(children) - 1, -1, -1):
+            if id(children[row]) in alive:
+                continue
+            self.beginRemoveRows(owner_index, row, row)
+            self._purge(children.pop(row))
+            self._set_children(owner, children)
+            self.endRemoveRows()
+        for row, node in enumerate(fresh):
+            if row < len(children) and children[row] is node:
+                continue
+            self.beginInsertRows(owner_index, row, row)
+            children.insert(row, node)
+            self._set_children(owner, children)
+            self.endInsertRows()
+
+    def _on_data_changed(self, top_left: QtCore.QModelIndex, bottom_right: QtCore.QModelIndex, roles: Any = None) -> None:
+        del roles
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            proxy_index = self.mapFromSource(self._source().index(row, 0, parent))
+            if proxy_index.isValid():
+                self.dataChanged.emit(proxy_index, proxy_index)
+
+
+class ProjectTreeView(QtWidgets.QTreeView):
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.source_model = ProjectTreeModel(self)
+        self.elements_proxy = ElementsOnlyProxyModel(self)
+        self.elements_proxy.setSourceModel(self.source_model)
+        self.elements_only = True
+        self.setModel(self.elements_proxy)
+
+    def set_project_data(self, data: Any) -> None:
+        self.source_model.set_root_data(data)
+        self._expand_root()
+
+    def set_elements_only(self, enabled: bool) -> None:
+        if enabled == self.elements_only:
+            return
+        self.elements_only = enabled
+        self.setModel(self.elements_proxy if enabled else self.source_model)
+        self._expand_root()
+
+    def set_show_colors(self, enabled: bool) -> None:
+        self.source_model.set_show_colors(enabled)
+
+    def _expand_root(self) -> None:
+        model = self.model()
+        if model is not None:
+            self.expand(model.index(0, 0))
+
+    def current_path(self) -> List[int | str] | None:
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        data = index.data(PATH_ROLE)
+        return list(data) if data is not None else []
+
+    def index_for_path(self, path: List[int | str], leaf: bool = False) -> QtCore.QModelIndex:
+        node = self.source_model.node_for_path(path, leaf)
+        if node is None:
+            return QtCore.QModelIndex()
+        if self.elements_only:
+            return self.elements_proxy.index_for_node(node)
+        return self.source_model.index_for_node(node)
+
+    def reveal(self, index: QtCore.QModelIndex) -> None:
+        ancestor = index.parent()
+        while ancestor.isValid():
+            self.expand(ancestor)
+            ancestor = ancestor.parent()
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+
+    def replace_project_data(self, data: Any) -> None:
+        # Troca os dados do mesmo projeto mantendo ramos expandidos e a seleção
+        model = self.model()
+        expanded: list[List[int | str]] = []
+        pending = [QtCore.QModelIndex()]
+        while pending:
+            parent = pending.pop()
+            for row in range(model.rowCount(parent)):
+                index = model.index(row, 0, parent)
+                if self.isExpanded(index):
+                    expanded.append(list(index.data(PATH_ROLE) or []))
+                    pending.append(index)
+        current = self.current_path()
+        self.set_project_data(data)
+        for path in expanded:
+            index = self.index_for_path(path)
+            if index.isValid():
+                self.expand(index)
+        if current is not None:
+            index = self.index_for_path(current)
+            if index.isValid():
+                self.setCurrentIndex(index)
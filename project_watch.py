@@ -0,0 +1,100 @@
+import os
+
+from PyQt6 import QtCore
+
+
+# Observa os .cpmproject abertos. O QFileSystemWatcher usa inotify no Linux; quando não consegue
+# observar um caminho (ex.: pasta de rede) cai para comparar mtime/tamanho num timer.
+class ProjectWatcher(QtCore.QObject):
+    changed = QtCore.pyqtSignal(int)
+
+    DEBOUNCE_MS = 500
+    POLL_MS = 2000
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._paths: dict[int, str] = {}
+        self._stats: dict[int, tuple[int, int] | None] = {}
+        self._polled: set[int] = set()
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        # O modelador grava em etapas (ou troca o arquivo inteiro): espera a escrita assentar
+        self._debounce: dict[int, QtCore.QTimer] = {}
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(self.POLL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def set_paths(self, paths: dict[int, str | None]) -> None:
+        self.stop()
+        for project, path in paths.items():
+            if not path:
+                continue
+            path = os.path.abspath(path)
+            self._paths[project] = path
+            self._stats[project] = self._stat(path)
+            # A pasta também é observada: gravar por troca de arquivo remove o caminho do watcher
+            watched_file = self._watcher.addPath(path)
+            watched_dir = self._watcher.addPath(os.path.dirname(path))
+            if not (watched_file or watched_dir):
+                self._polled.add(project)
+        if self._polled:
+            self._poll_timer.start()
+
+    def stop(self) -> None:
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._poll_timer.stop()
+        for timer in self._debounce.values():
+            timer.stop()
+        self._paths = {}
+        self._stats = {}
+        self._polled = set()
+
+    def paths(self) -> dict[int, str]:
+        return dict(self._paths)
+
+    @staticmethod
+    def _stat(path: str) -> tuple[int, int] | None:
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _on_file_changed(self, path: str) -> None:
+        for project, watched in self._paths.items():
+            if watched == path:
+                self._schedule(project)
+
+    def _on_directory_changed(self, directory: str) -> None:
+        for project, path in self._paths.items():
+            if os.path.dirname(path) == directory:
+                self._schedule(project)
+
+    def _poll(self) -> None:
+        for project in self._polled:
+            self._schedule(project)
+
+    def _schedule(self, project: int) -> None:
+        timer = self._debounce.get(project)
+        if timer is None:
+            timer = QtCore.QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.DEBOUNCE_MS)
+            timer.timeout.connect(lambda project=project: self._settle(project))
+            self._debounce[project] = timer
+        timer.start()
+
+    def _settle(self, project: int) -> None:
+        path = self._paths.get(project)
+        if path is None:
+            return
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        current = self._stat(path)
+        if current is None or current == self._stats.get(project):
+            return
+        self._stats[project] = current
+        self.changed.emit(project)
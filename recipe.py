@@ -0,0 +1,275 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable
+
+from animation_tracks import INTERPOLATIONS
+from cli import OPERATIONS, layer_problems
+from json_merger import JSONMergerLogic
+
+# Receita: lista de passos aplicados ao Projeto 2 em memória, com uma leitura e uma gravação só.
+#   {"projeto2": "alvo.cpmproject", "projeto1": "base.cpmproject", "saida": "novo.cpmproject",
+#    "passos": [{"op": "movment", "skin_x128": true}, {"op": "afixos", "elemento": {"storeID": 12},
+#               "prefixo": "R_", "filhos": true}, {"op": "cores"}]}
+# Elementos podem ser indicados pelo nome ("Left Arm"), pelo storeID (12) ou por {"nome"/"storeID": ...}.
+
+# Campos de cada operação: nome -> (tipos aceitos, obrigatório, padrão)
+STEP_FIELDS: dict[str, dict[str, tuple[tuple[type, ...], bool, Any]]] = {
+    "movment": {
+        "skin_x128": ((bool,), False, False),
+        "recalcular_animacoes": ((bool,), False, False),
+        "membros": ((dict,), False, {}),
+    },
+    "uv": {
+        "elemento": ((str, int, dict), True, None),
+        "du": ((int,), False, 0),
+        "dv": ((int,), False, 0),
+    },
+    "afixos": {
+        "elemento": ((str, int, dict), True, None),
+        "prefixo": ((str,), False, ""),
+        "sufixo": ((str,), False, ""),
+        "filhos": ((bool,), False, False),
+    },
+    "cores": {},
+    "copiar-animacao": {
+        "animacao": ((str,), True, None),
+        "mapa": ((dict,), False, {}),
+        "sugerir": ((bool,), False, False),
+        "confianca": ((int, float), False, 0.45),
+    },
+    "interpolar": {
+        "animacao": ((str,), True, None),
+        "de": ((int,), True, None),
+        "ate": ((int,), True, None),
+        "frames": ((int,), True, None),
+        "nova": ((str, type(None)), False, None),
+    },
+    "aplicar-frame": {
+        "animacao": ((str,), True, None),
+        "frame": ((int,), True, None),
+    },
+    "reduzir": {
+        "animacao": ((str, type(None)), False, None),
+        "tol_pos": ((int, float), False, 0.01),
+        "tol_rot": ((int, float), False, 0.1),
+        "tol_escala": ((int, float), False, 0.001),
+    },
+    "reamostrar": {
+        "animacao": ((str, type(None)), False, None),
+        "frames": ((int, type(None)), False, None),
+        "velocidade": ((int, float, type(None)), False, None),
+        "fps": ((int, float, list, type(None)), False, None),
+        "modo": ((str,), False, "linear"),
+        "variante": ((bool,), False, False),
+    },
+    "espelhar": {
+        "animacao": ((str, type(None)), False, None),
+        "nova": ((str, type(None)), False, None),
+        "variante": ((bool,), False, False),
+    },
+    "misturar": {
+        "camadas": ((list,), True, None),
+        "nova": ((str, type(None)), False, None),
+        "frames": ((int, type(None)), False, None),
+        "modo": ((str,), False, "linear"),
+    },
+}
+
+
+class RecipeError(ValueError):
+    def __init__(self, problems: list[str]) -> None:
+        super().__init__("Receita inválida:\n" + "\n".join(f"  - {problem}" for problem in problems))
+        self.problems = problems
+
+
+def load_recipe(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        text = handle.read()
+    if path.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ValueError("Receitas YAML precisam do PyYAML (pip install pyyaml)") from exc
+        recipe = yaml.safe_load(text)
+    else:
+        recipe = json.loads(text)
+    if not isinstance(recipe, dict):
+        raise RecipeError(["a receita deve ser um objeto com a lista 'passos'"])
+    # Caminhos relativos são resolvidos a partir da pasta da receita
+    base = os.path.dirname(os.path.abspath(path))
+    for key in ("projeto1", "projeto2", "saida"):
+        if isinstance(recipe.get(key), str):
+            recipe[key] = os.path.join(base, recipe[key])
+    return recipe
+
+
+def _valid_selector(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (str, int)):
+        return True
+    return isinstance(value, dict) and len(value) == 1 and (
+        isinstance(value.get("nome"), str) or isinstance(value.get("storeID"), int)
+    )
+
+
+def _step_problems(op: str, step: dict[str, Any]) -> list[str]:
+    # Regras entre campos, conferidas aqui para a receita não parar no meio com passos já aplicados
+    problems: list[str] = []
+    if op == "afixos" and not (step["prefixo"] or step["sufixo"]):
+        problems.append("informe 'prefixo' e/ou 'sufixo'")
+    if op in ("reamostrar", "misturar") and step["modo"] not in INTERPOLATIONS:
+        problems.append(f"'modo' deve ser um de: {', '.join(INTERPOLATIONS)}")
+    if op == "reamostrar":
+        given = [name for name in ("frames", "velocidade", "fps") if step[name] is not None]
+        if len(given) != 1:
+            problems.append("informe exatamente um entre 'frames', 'velocidade' e 'fps'")
+        fps = step["fps"] if isinstance(step["fps"], list) else [step["fps"]] if step["fps"] is not None else []
+        if isinstance(step["fps"], list) and not fps:
+            problems.append("'fps' não pode ser uma lista vazia")
+        if any(isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0 for value in fps):
+            problems.append("'fps' deve ter só números positivos")
+    if op == "espelhar" and step["nova"] and step["variante"]:
+        problems.append("use 'nova' ou 'variante', não os dois")
+    if op == "espelhar" and step["nova"] and step["animacao"] is None:
+        problems.append("'nova' só vale com uma 'animacao'")
+    if op == "misturar" and isinstance(step["camadas"], list):
+        if len(step["camadas"]) < 2:
+            problems.append("'camadas' precisa de ao menos duas animações")
+        for layer in step["camadas"]:
+            problems.extend(layer_problems(layer))
+    return problems
+
+
+def validate_recipe(recipe: dict[str, Any]) -> list[dict[str, Any]]:
+    # Confere a receita inteira antes de abrir o projeto e devolve os passos com os padrões preenchidos
+    problems: list[str] = []
+    for key in ("projeto1", "projeto2", "saida"):
+        if key in recipe and not isinstance(recipe[key], (str, type(None))):
+            problems.append(f"'{key}' deve ser um caminho")
+    unknown = set(recipe) - {"projeto1", "projeto2", "saida", "passos"}
+    if unknown:
+        problems.append("campos desconhecidos: " + ", ".join(sorted(unknown)))
+    steps = recipe.get("passos")
+    if not isinstance(steps, list) or not steps:
+        raise RecipeError(problems + ["'passos' deve ser uma lista com pelo menos um passo"])
+    normalized: list[dict[str, Any]] = []
+    for number, step in enumerate(steps, start=1):
+        where = f"passo {number}"
+        if not isinstance(step, dict) or not isinstance(step.get("op"), str):
+            problems.append(f"{where}: cada passo precisa de 'op'")
+            continue
+        op = step["op"]
+        fields = STEP_FIELDS.get(op)
+        if fields is None:
+            problems.append(f"{where}: operação desconhecida '{op}' (use {', '.join(STEP_FIELDS)})")
+            continue
+        where = f"passo {number} ({op})"
+        result: dict[str, Any] = {"op": op}
+        for name in sorted(set(step) - set(fields) - {"op"}):
+            problems.append(f"{where}: campo desconhecido '{name}'")
+        for name, (types, required, default) in fields.items():
+            if name not in step:
+                if required:
+                    problems.append(f"{where}: falta '{name}'")
+                result[name] = default
+                continue
+            value = step[name]
+            if name == "elemento" and not _valid_selector(value):
+                problems.append(f"{where}: 'elemento' deve ser nome, storeID ou {{\"nome\"|\"storeID\": ...}}")
+            elif not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                problems.append(f"{where}: '{name}' tem tipo inválido ({type(value).__name__})")
+            result[name] = value
+        if op == "movment" and isinstance(result["membros"], dict):
+            for key, selector in result["membros"].items():
+                if key not in JSONMergerLogic.MOVEMENT_LIMB_NAMES:
+                    problems.append(f"{where}: membro desconhecido '{key}'")
+                elif not _valid_selector(selector):
+                    problems.append(f"{where}: seletor inválido para '{key}'")
+        if op == "copiar-animacao" and isinstance(result["mapa"], dict):
+            for source, target in result["mapa"].items():
+                if not str(source).lstrip("-").isdigit() or not isinstance(target, int):
+                    problems.append(f"{where}: 'mapa' deve ligar storeIDs (\"12\": 34)")
+                    break
+        if op == "interpolar" and isinstance(result["de"], int) and isinstance(result["ate"], int):
+            if result["de"] < 1 or result["ate"] <= result["de"]:
+                problems.append(f"{where}: intervalo de frames inválido")
+        problems.extend(f"{where}: {problem}" for problem in _step_problems(op, result))
+        normalized.append(result)
+    if problems:
+        raise RecipeError(problems)
+    return normalized
+
+
+def run_recipe(
+    recipe: dict[str, Any],
+    logic: JSONMergerLogic | None = None,
+    dry_run: bool = False,
+    on_step: Callable[[int, dict[str, Any], str, float], None] | None = None,
+) -> list[dict[str, Any]]:
+    steps = validate_recipe(recipe)
+    if logic is None:
+        logic = JSONMergerLogic()
+        if recipe.get("projeto1"):
+            logic.load_project1(recipe["projeto1"])
+        if not recipe.get("projeto2"):
+            raise RecipeError(["falta 'projeto2'"])
+        logic.load_project2(recipe["projeto2"])
+    timings: list[dict[str, Any]] = []
+    for number, step in enumerate(steps, start=1):
+        started = time.perf_counter()
+        try:
+            message = OPERATIONS[step["op"]](logic, **{name: value for name, value in step.items() if name != "op"})
+        except Exception as exc:
+            # Nada foi gravado ainda: o arquivo em disco continua como estava
+            raise ValueError(f"Passo {number} ({step['op']}): {exc}") from exc
+        elapsed = time.perf_counter() - started
+        timings.append({"passo": number, "op": step["op"], "mensagem": message, "ms": elapsed * 1000})
+        if on_step:
+            on_step(number, step, message, elapsed)
+    if not dry_run:
+        if recipe.get("saida"):
+            logic.save_project2_as(recipe["saida"])
+        else:
+            logic.save_project2()
+    return timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Executa uma receita (JSON/YAML) de operações no Projeto 2")
+    parser.add_argument("receita", help="Arquivo .json, .yaml ou .yml")
+    parser.add_argument("--projeto2", help="Sobrepõe o 'projeto2' da receita")
+    parser.add_argument("--projeto1", help="Sobrepõe o 'projeto1' da receita")
+    parser.add_argument("-o", "--saida", help="Sobrepõe a 'saida' da receita")
+    parser.add_argument("--validar", action="store_true", help="Só confere a receita, sem abrir o projeto")
+    parser.add_argument("--simular", action="store_true", help="Executa todos os passos sem salvar")
+    args = parser.parse_args(argv)
+    try:
+        recipe = load_recipe(args.receita)
+        for key in ("projeto1", "projeto2", "saida"):
+            if getattr(args, key):
+                recipe[key] = getattr(args, key)
+        steps = validate_recipe(recipe)
+        if args.validar:
+            print(f"Receita válida: {len(steps)} passo(s)")
+            return 0
+        started = time.perf_counter()
+
+        def report(number: int, step: dict[str, Any], message: str, elapsed: float) -> None:
+            print(f"{number:>3}. {step['op']:<16} {elapsed * 1000:8.1f} ms  {message}")
+
+        run_recipe(recipe, dry_run=args.simular, on_step=report)
+    except (OSError, ValueError) as exc:
+        print(f"Erro: {exc}", file=sys.stderr)
+        return 1
+    total = (time.perf_counter() - started) * 1000
+    target = "nada salvo (simulação)" if args.simular else (recipe.get("saida") or recipe.get("projeto2"))
+    print(f"Receita concluída em {total:.0f} ms — {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
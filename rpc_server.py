@@ -0,0 +1,319 @@
+import argparse
+import inspect
+import itertools
+import json
+import os
+import socketserver
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from json_merger import JSONMergerLogic
+from recipe import run_recipe
+
+# Métodos da lógica que não fazem sentido remotamente (eventos, cópias de thread, leitura/gravação
+# direta); abrir e salvar passam por open/flush, que cuidam da sessão
+HIDDEN_METHODS = {
+    "subscribe",
+    "unsubscribe",
+    "snapshot",
+    "adopt",
+    "load_project1",
+    "load_project2",
+    "save_project2",
+    "save_project2_as",
+}
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+OPERATION_ERROR = -32000
+
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class Session:
+    def __init__(self, session_id: str, project2: str, project1: str | None) -> None:
+        self.id = session_id
+        self.logic = JSONMergerLogic()
+        if project1:
+            self.logic.load_project1(project1)
+        self.logic.load_project2(project2)
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.calls = 0
+        # Qualquer evento de alteração marca a sessão para o próximo flush
+        self.logic.subscribe(self._mark_dirty)
+
+    def _mark_dirty(self, event: str, payload: dict[str, Any]) -> None:
+        if payload.get("project", 2) == 2:
+            self.dirty = True
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "sessao": self.id,
+            "projeto1": self.logic.project1_path,
+            "projeto2": self.logic.project2_path,
+            "alterado": self.dirty,
+            "chamadas": self.calls,
+        }
+
+
+class ProjectService:
+    def __init__(self) -> None:
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+        self._opening: dict[str, threading.Lock] = {}
+        self._ids = itertools.count(1)
+        self.on_shutdown: Callable[[], None] | None = None
+        self._methods: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "open": self.open,
+            "close": self.close,
+            "flush": self.flush,
+            "sessions": self.sessions,
+            "recipe": self.recipe,
+            "methods": self.methods,
+            "shutdown": self.shutdown,
+        }
+
+    # --- métodos do serviço ---
+
+    def open(self, params: dict[str, Any]) -> dict[str, Any]:
+        project2 = params.get("projeto2")
+        if not isinstance(project2, str):
+            raise RPCError(INVALID_PARAMS, "'projeto2' é obrigatório")
+        project2 = os.path.abspath(project2)
+        project1 = params.get("projeto1")
+        project1 = os.path.abspath(project1) if isinstance(project1, str) else None
+        with self._lock:
+            path_lock = self._opening.setdefault(os.path.normcase(project2), threading.Lock())
+        # Um lock por projeto2 cobre a busca e a criação: duas chamadas simultâneas não criam duas sessões
+        # que gravariam o mesmo arquivo, e a leitura do projeto não trava as outras sessões
+        with path_lock:
+            with self._lock:
+                existing = next(
+                    (session for session in self._sessions.values() if session.logic.project2_path == project2),
+                    None,
+                )
+            if existing is not None:
+                # O mesmo projeto aberto de novo reaproveita a sessão já carregada
+                if project1 is not None and existing.logic.project1_path != project1:
+                    raise RPCError(
+                        OPERATION_ERROR,
+                        f"{project2} já está aberto na sessão {existing.id} com outro projeto1; feche-a antes",
+                    )
+                return existing.info()
+            session = Session(f"s{next(self._ids)}", project2, project1)
+            with self._lock:
+                self._sessions[session.id] = session
+        return session.info()
+
+    def close(self, params: dict[str, Any]) -> dict[str, Any]:
+        session = self._session(params)
+        if session.dirty and not params.get("descartar"):
+            raise RPCError(OPERATION_ERROR, "Sessão com alterações: chame flush ou passe descartar=true")
+        with self._lock:
+            self._sessions.pop(session.id, None)
+        return {"sessao": session.id, "fechada": True}
+
+    def flush(self, params: dict[str, Any]) -> dict[str, Any]:
+        session = self._session(params)
+        target = params.get("saida")
+        with session.lock:
+            if target:
+                session.logic.save_project2_as(os.path.abspath(target))
+            elif session.dirty or params.get("forcar"):
+                session.logic.save_project2()
+            else:
+                return session.info() | {"salvo": False}
+            session.dirty = False
+        return session.info() | {"salvo": True}
+
+    def sessions(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        with self._lock:
+            return [session.info() for session in self._sessions.values()]
+
+    def recipe(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        # Passos de receita aplicados à sessão em memória; gravar continua sendo papel do flush
+        session = self._session(params)
+        steps = params.get("passos")
+        with session.lock:
+            session.calls += 1
+            return run_recipe({"passos": steps}, logic=session.logic, dry_run=True)
+
+    def methods(self, params: dict[str, Any]) -> list[str]:
+        return sorted(self._methods) + self.logic_methods()
+
+    def shutdown(self, params: dict[str, Any]) -> dict[str, Any]:
+        pending = [session.id for session in self._sessions.values() if session.dirty]
+        if pending and not params.get("descartar"):
+            raise RPCError(OPERATION_ERROR, "Sessões com alterações: " + ", ".join(pending))
+        if self.on_shutdown:
+            threading.Thread(target=self.on_shutdown, daemon=True).start()
+        return {"encerrando": True}
+
+    @staticmethod
+    def logic_methods() -> list[str]:
+        return [
+            name
+            for name in dir(JSONMergerLogic)
+            if not name.startswith("_")
+            and name not in HIDDEN_METHODS
+            and callable(getattr(JSONMergerLogic, name))
+        ]
+
+    # --- despacho ---
+
+    def _session(self, params: dict[str, Any]) -> Session:
+        session_id = params.get("sessao")
+        with self._lock:
+            session = self._sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            raise RPCError(INVALID_PARAMS, f"Sessão desconhecida: {session_id}")
+        return session
+
+    def _call_logic(self, name: str, params: dict[str, Any]) -> Any:
+        session = self._session(params)
+        args = params.get("args", [])
+        kwargs = params.get("kwargs", {})
+        if not isinstance(args, list) or not isinstance(kwargs, dict):
+            raise RPCError(INVALID_PARAMS, "'args' deve ser lista e 'kwargs' objeto")
+        method = getattr(session.logic, name)
+        # Só a ligação dos argumentos vira INVALID_PARAMS; um TypeError de dentro do método é erro da operação
+        try:
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as exc:
+            raise RPCError(INVALID_PARAMS, str(exc)) from exc
+        with session.lock:
+            session.calls += 1
+            return method(*args, **kwargs)
+
+    def handle(self, request: Any) -> dict[str, Any] | None:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RPCError(INVALID_REQUEST, "Requisição inválida")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "'params' deve ser um objeto")
+            name = request["method"]
+            if name in self._methods:
+                result = self._methods[name](params)
+            elif name in self.logic_methods():
+                result = self._call_logic(name, params)
+            else:
+                raise RPCError(METHOD_NOT_FOUND, f"Método desconhecido: {name}")
+            response: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except RPCError as exc:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": exc.code, "message": str(exc)}}
+        except Exception as exc:  # noqa: BLE001
+            response = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": OPERATION_ERROR, "message": f"{type(exc).__name__}: {exc}"},
+            }
+        # Notificações (sem id) não têm resposta
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+
+    def handle_payload(self, payload: bytes) -> bytes | None:
+        try:
+            message = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return encode({"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "JSON inválido"}})
+        if isinstance(message, list):
+            if not message:
+                return encode(
+                    {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "Lote vazio"}}
+                )
+            # Lotes rodam em ordem: um passo pode depender do anterior na mesma sessão
+            responses = [response for response in map(self.handle, message) if response is not None]
+            return encode(responses) if responses else None
+        response = self.handle(message)
+        return encode(response) if response is not None else None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, bytes):
+        return {"bytes": len(value)}
+    return str(value)
+
+
+def encode(message: Any) -> bytes:
+    return json.dumps(message, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def make_http_server(service: ProjectService, host: str, port: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            body = service.handle_payload(self.rfile.read(length))
+            self.send_response(200 if body is not None else 204)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body or b"")))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def make_unix_server(service: ProjectService, path: str) -> socketserver.ThreadingUnixStreamServer:
+    # Uma mensagem JSON por linha em cada direção; a conexão pode ser reaproveitada
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                body = service.handle_payload(line)
+                if body is not None:
+                    self.wfile.write(body + b"\n")
+                    self.wfile.flush()
+
+    if os.path.exists(path):
+        os.remove(path)
+    return socketserver.ThreadingUnixStreamServer(path, Handler)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serviço JSON-RPC local que mantém projetos carregados")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--http", default="127.0.0.1:8765", help="host:porta (padrão 127.0.0.1:8765)")
+    where.add_argument("--socket", help="Caminho de um socket Unix (uma mensagem JSON por linha)")
+    args = parser.parse_args(argv)
+    service = ProjectService()
+    server: socketserver.BaseServer
+    if args.socket:
+        server = make_unix_server(service, args.socket)
+        address = args.socket
+    else:
+        host, _, port = args.http.rpartition(":")
+        server = make_http_server(service, host or "127.0.0.1", int(port))
+        address = f"http://{host or '127.0.0.1'}:{port}"
+    service.on_shutdown = server.shutdown
+    print(f"Servindo em {address} (Ctrl+C para sair)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import argparse
+import json
+import random
+import struct
+import sys
+import zipfile
+import zlib
+from typing import Any
+
+from json_merger import JSONMergerLogic
+
+VANILLA_PARTS = ["head", "body", "left_arm", "right_arm", "left_leg", "right_leg"]
+# Membros que o +Movment detecta pelo nome, pendurados na parte vanilla correspondente
+LIMB_PARENTS = {
+    "left_arm": "left_arm",
+    "right_arm": "right_arm",
+    "left_leg": "left_leg",
+    "right_leg": "right_leg",
+    "left_sleeve": "left_arm",
+    "right_sleeve": "right_arm",
+    "left_pants": "left_leg",
+    "right_pants": "right_leg",
+}
+
+
+def _vector(rng: random.Random, spread: float) -> dict[str, float]:
+    return {axis: round(rng.uniform(-spread, spread), 3) for axis in ("x", "y", "z")}
+
+
+def _element(rng: random.Random, name: str, store_id: int, texture: int) -> dict[str, Any]:
+    size = {"x": rng.randint(1, 8), "y": rng.randint(1, 12), "z": rng.randint(1, 8)}
+    limit = max(texture - 2 * (size["x"] + size["z"]), 1)
+    return {
+        "name": name,
+        "storeID": store_id,
+        "show": True,
+        "texture": True,
+        "textureSize": 1,
+        "pos": _vector(rng, 4),
+        "rotation": {"x": 0, "y": 0, "z": 0},
+        "size": size,
+        "offset": {"x": -size["x"] / 2, "y": 0, "z": -size["z"] / 2},
+        "u": rng.randrange(limit),
+        "v": rng.randrange(max(texture - size["y"] - size["z"], 1)),
+        "children": [],
+    }
+
+
+def solid_png(width: int, height: int, rgba: tuple[int, int, int, int] = (128, 128, 128, 255)) -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    row = b"\x00" + bytes(rgba) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(row * height)) + chunk(b"IEND", b"")
+
+
+def build_model(elements: int, depth: int, texture: int, rng: random.Random) -> tuple[dict[str, Any], list[int]]:
+    next_id = 1
+    roots: list[dict[str, Any]] = []
+    by_part: dict[str, dict[str, Any]] = {}
+    for part in VANILLA_PARTS:
+        root = {"id": part, "show": True, "pos": {"x": 0, "y": 0, "z": 0}, "children": []}
+        roots.append(root)
+        by_part[part] = root
+    # (elemento, profundidade) que ainda aceitam filhos
+    parents: list[tuple[dict[str, Any], int]] = [(root, 0) for root in roots]
+    store_ids: list[int] = []
+    for key, part in LIMB_PARENTS.items():
+        if next_id > elements:
+            break
+        element = _element(rng, JSONMergerLogic.MOVEMENT_LIMB_NAMES[key], next_id, texture)
+        by_part[part]["children"].append(element)
+        parents.append((element, 1))
+        store_ids.append(next_id)
+        next_id += 1
+    while next_id <= elements:
+        parent, level = rng.choice(parents)
+        side = rng.choice(("left_", "right_", ""))
+        element = _element(rng, f"{side}part{next_id}", next_id, texture)
+        parent["children"].append(element)
+        if level + 1 < depth:
+            parents.append((element, level + 1))
+        store_ids.append(next_id)
+        next_id += 1
+    model = {"version": 1, "skinSize": {"x": texture, "y": texture}, "elements": roots}
+    return model, store_ids
+
+
+def build_animation(
+    store_ids: list[int], frames: int, components: int, rng: random.Random
+) -> dict[str, Any]:
+    animated = rng.sample(store_ids, min(components, len(store_ids))) if store_ids else []
+    result_frames = []
+    for _ in range(frames):
+        result_frames.append(
+            {
+                "components": [
+                    {"storeID": sid, "pos": _vector(rng, 2), "rotation": _vector(rng, 45)} for sid in animated
+                ]
+            }
+        )
+    return {"frames": result_frames, "duration": frames * 50, "loop": True}
+
+
+def generate_project(
+    path: str,
+    elements: int = 300,
+    depth: int = 4,
+    animations: int = 3,
+    frames: int = 60,
+    texture: int = 64,
+    components: int = 20,
+    seed: int = 0,
+) -> dict[str, int]:
+    # Mesma semente, mesmo arquivo: os benchmarks comparam execuções sobre projetos idênticos
+    rng = random.Random(seed)
+    model, store_ids = build_model(elements, depth, texture, rng)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("config.json", json.dumps(model, indent=2))
+        archive.writestr("skin.png", solid_png(texture, texture))
+        for index in range(animations):
+            animation = build_animation(store_ids, frames, components, rng)
+            archive.writestr(
+                f"animations/v_bench_anim{index}_{seed:04d}{index:04d}.json", json.dumps(animation, indent=2)
+            )
+    return {"elements": len(store_ids), "animations": animations, "frames": frames, "texture": texture}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Gera um .cpmproject sintético para testes e benchmarks")
+    parser.add_argument("saida", help="Arquivo .cpmproject a criar")
+    parser.add_argument("--elementos", type=int, default=300)
+    parser.add_argument("--profundidade", type=int, default=4, help="Profundidade máxima da hierarquia")
+    parser.add_argument("--animacoes", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=60, help="Frames por animação")
+    parser.add_argument("--componentes", type=int, default=20, help="Elementos animados por frame")
+    parser.add_argument("--textura", type=int, default=64, help="Lado do skin.png em pixels")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+    stats = generate_project(
+        args.saida,
+        elements=args.elementos,
+        depth=args.profundidade,
+        animations=args.animacoes,
+        frames=args.frames,
+        texture=args.textura,
+        components=args.componentes,
+        seed=args.semente,
+    )
+    print(
+        f"{args.saida}: {stats['elements']} elemento(s), {stats['animations']} animação(ões) "
+        f"de {stats['frames']} frame(s), textura {stats['texture']}x{stats['texture']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
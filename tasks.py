@@ -0,0 +1,132 @@
+import threading
+from typing import Any, Callable
+
+from PyQt6 import QtCore
+
+from json_merger import JSONMergerLogic
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class _TaskSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int)
+    succeeded = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+    cancelled = QtCore.pyqtSignal()
+
+
+class _TaskRunnable(QtCore.QRunnable):
+    def __init__(
+        self,
+        work: Callable[[Callable[[int, int], None]], Any],
+        signals: _TaskSignals,
+        cancel_event: threading.Event,
+    ) -> None:
+        super().__init__()
+        self._work = work
+        self._signals = signals
+        self._cancel_event = cancel_event
+        self._last_percent = -1
+
+    def run(self) -> None:
+        try:
+            result = self._work(self._report)
+        except TaskCancelled:
+            self._signals.cancelled.emit()
+        except Exception as exc:  # noqa: BLE001
+            self._signals.failed.emit(exc)
+        else:
+            self._signals.succeeded.emit(result)
+
+    def _report(self, done: int, total: int) -> None:
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+        # Só repassa quando a porcentagem muda, para não inundar a fila de eventos da UI
+        percent = done * 100 // total if total > 0 else 0
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self._signals.progress.emit(done, total)
+
+
+# Executa uma operação por vez numa cópia da lógica; a UI só vê o resultado quando ele é adotado
+class TaskRunner(QtCore.QObject):
+    started = QtCore.pyqtSignal(str)
+    progress = QtCore.pyqtSignal(str, int, int)
+    finished = QtCore.pyqtSignal(str)
+
+    def __init__(self, logic: JSONMergerLogic, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self.logic = logic
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._cancel_event = threading.Event()
+        self._signals: _TaskSignals | None = None
+        self._label = ""
+
+    def is_busy(self) -> bool:
+        return self._signals is not None
+
+    def run(
+        self,
+        label: str,
+        operation: Callable[[JSONMergerLogic], Any],
+        on_success: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        copy_model: bool = True,
+    ) -> bool:
+        if self.is_busy():
+            return False
+        snapshot = self.logic.snapshot(copy_model=copy_model)
+        events: list[tuple[str, dict[str, Any]]] = []
+        snapshot.subscribe(lambda event, payload: events.append((event, payload)))
+
+        def work(report: Callable[[int, int], None]) -> Any:
+            snapshot.progress_hook = report
+            try:
+                return operation(snapshot)
+            finally:
+                snapshot.progress_hook = None
+
+        def succeeded(result: Any) -> None:
+            # A operação já terminou (um save pode ter trocado o arquivo em disco): um cancelamento que
+            # chegou tarde é ignorado e o resultado é adotado, senão a UI diria que nada mudou
+            self._cancel_event.clear()
+            self.logic.adopt(snapshot, events)
+            self._finish()
+            if on_success:
+                on_success(result)
+
+        def failed(exc: Exception) -> None:
+            self._finish()
+            if on_error:
+                on_error(exc)
+
+        signals = _TaskSignals()
+        signals.progress.connect(lambda done, total: self.progress.emit(self._label, done, total))
+        signals.succeeded.connect(succeeded)
+        signals.failed.connect(failed)
+        signals.cancelled.connect(self._finish)
+        self._signals = signals
+        self._label = label
+        self._cancel_event.clear()
+        self.started.emit(label)
+        self._pool.start(_TaskRunnable(work, signals, self._cancel_event))
+        return True
+
+    def cancel(self) -> None:
+        # O cancelamento descarta a cópia inteira, então o estado visível nunca fica pela metade; só vale
+        # enquanto a operação ainda relata progresso (depois de retornar, o resultado é sempre adotado)
+        if self.is_busy():
+            self._cancel_event.set()
+
+    def was_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _finish(self) -> None:
+        self._signals = None
+        self.finished.emit(self._label)
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation_tracks import blend_frames, reduce_frames  # noqa: E402
+
+TOLERANCES = {"pos": 0.01, "rotation": 0.1, "scale": 0.001}
+
+
+def frame(x: float) -> dict:
+    return {"components": [{"storeID": 1, "pos": {"x": x, "y": 0.0, "z": 0.0}}]}
+
+
+@pytest.mark.parametrize("count", [2, 4, 5, 6, 7, 12])
+@pytest.mark.parametrize("loop", [False, True])
+def test_static_animation_collapses_to_first_frame(count: int, loop: bool) -> None:
+    frames = [frame(1.0) for _ in range(count)]
+    kept, removed_frames, _ = reduce_frames(frames, loop, TOLERANCES)
+    assert len(kept) == 1
+    assert removed_frames == count - 1
+    assert kept[0]["components"][0]["pos"]["x"] == 1.0
+
+
+def test_linear_ramp_keeps_evenly_spaced_frames() -> None:
+    frames = [frame(float(index)) for index in range(4)] + [frame(4.0 - index) for index in range(4)]
+    kept, removed_frames, _ = reduce_frames(frames, True, TOLERANCES)
+    assert [comp["pos"]["x"] for f in kept for comp in f["components"]] == [0.0, 4.0]
+    assert removed_frames == 6
+
+
+def test_prime_count_motion_is_left_alone() -> None:
+    frames = [frame(float(index * index)) for index in range(7)]
+    kept, removed_frames, _ = reduce_frames(frames, False, TOLERANCES)
+    assert len(kept) == 7
+    assert removed_frames == 0
+
+
+def test_additive_scale_stops_at_zero() -> None:
+    base = [{"components": [{"storeID": 1, "scale": {"x": 2.0, "y": 1.0, "z": 1.0}}]}]
+    shrink = [{"components": [{"storeID": 1, "scale": {"x": 0.5, "y": 0.5, "z": 1.0}}]}]
+    blended = blend_frames([(base, 1.0, "mistura", None), (shrink, 4.0, "aditiva", None)], 1, False)
+    assert blended[0]["components"][0]["scale"] == {"x": 0.0, "y": 0.0, "z": 1.0}
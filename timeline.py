@@ -0,0 +1,188 @@
+from typing import Any
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+# Rótulos calculados sob demanda: nada é criado por frame além da própria lista de frames
+class TimelineModel(QtCore.QAbstractListModel):
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._frames: list[Any] = []
+
+    def frames(self) -> list[Any]:
+        return self._frames
+
+    def set_frames(self, frames: list[Any]) -> None:
+        self.beginResetModel()
+        self._frames = frames
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._frames)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self._frames):
+            return None
+        row = index.row()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            frame = self._frames[row]
+            components = frame.get("components", []) if isinstance(frame, dict) else []
+            comp_count = len(components) if isinstance(components, list) else 0
+            return f"Frame {row + 1}\n{comp_count} comps"
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return row
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+        if role == QtCore.Qt.ItemDataRole.SizeHintRole:
+            return self._cell_size()
+        return None
+
+    def _cell_size(self) -> QtCore.QSize:
+        # Com uniformItemSizes o tamanho vale para todas as células, então mede o maior rótulo
+        metrics = QtGui.QFontMetrics(QtWidgets.QApplication.font())
+        widest = max(
+            metrics.horizontalAdvance(f"Frame {len(self._frames)}"),
+            metrics.horizontalAdvance("9999 comps"),
+        )
+        return QtCore.QSize(widest + 12, metrics.lineSpacing() * 2 + 8)
+
+    def apply_change(self, frame_op: str, frames: list[Any], index: int | None, count: int, to_index: int | None) -> None:
+        if frame_op == "moved" and index is not None and to_index is not None and index != to_index:
+            # beginMoveRows usa a posição antes da remoção como destino
+            destination = to_index + 1 if to_index > index else to_index
+            self.beginMoveRows(QtCore.QModelIndex(), index, index, QtCore.QModelIndex(), destination)
+            self._frames = frames
+            self.endMoveRows()
+            self._relabel(min(index, to_index), max(index, to_index))
+        elif frame_op == "inserted" and index is not None and count > 0:
+            self.beginInsertRows(QtCore.QModelIndex(), index, index + count - 1)
+            self._frames = frames
+            self.endInsertRows()
+            self._relabel(index + count, len(frames) - 1)
+        elif frame_op == "removed" and index is not None and count > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), index, index + count - 1)
+            self._frames = frames
+            self.endRemoveRows()
+            self._relabel(index, len(frames) - 1)
+        elif frame_op == "changed" and len(frames) == len(self._frames):
+            self._frames = frames
+            if index is None:
+                self._relabel(0, len(frames) - 1)
+            else:
+                self._relabel(index, index + max(count, 1) - 1)
+        else:
+            self.set_frames(frames)
+
+    def _relabel(self, first: int, last: int) -> None:
+        last = min(last, len(self._frames) - 1)
+        if first > last:
+            return
+        self.dataChanged.emit(self.index(first), self.index(last))
+
+
+class TimelineView(QtWidgets.QListView):
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.timeline_model = TimelineModel(self)
+        self.setModel(self.timeline_model)
+        self.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.setBatchSize(200)
+
+    def frame_count(self) -> int:
+        return self.timeline_model.rowCount()
+
+    def current_row(self) -> int:
+        index = self.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def set_current_row(self, row: int) -> None:
+        if 0 <= row < self.frame_count():
+            self.setCurrentIndex(self.timeline_model.index(row))
+        else:
+            self.setCurrentIndex(QtCore.QModelIndex())
+
+    def clear(self) -> None:
+        self.timeline_model.set_frames([])
+
+
+# A hierarquia do modelo é montada uma vez; trocar de frame só alterna o destaque dos itens
+class FrameElementsTree(QtWidgets.QTreeWidget):
+    MODIFIED_BRUSH = QtGui.QBrush(QtGui.QColor("#006400"))
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setHeaderHidden(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self._skeleton: list[dict[str, Any]] | None = None
+        self._items: dict[int, list[QtWidgets.QTreeWidgetItem]] = {}
+        self._extras: dict[int, QtWidgets.QTreeWidgetItem] = {}
+        self._highlighted: frozenset[int] = frozenset()
+
+    def clear_elements(self) -> None:
+        self.clear()
+        self._skeleton = None
+        self._items = {}
+        self._extras = {}
+        self._highlighted = frozenset()
+
+    def set_skeleton(self, skeleton: list[dict[str, Any]]) -> bool:
+        if skeleton is self._skeleton:
+            return False
+        self.clear_elements()
+        self._skeleton = skeleton
+        depth_parents: dict[int, QtWidgets.QTreeWidgetItem] = {}
+        top_level: list[QtWidgets.QTreeWidgetItem] = []
+        for element in skeleton:
+            sid = element.get("storeID")
+            item = QtWidgets.QTreeWidgetItem([element.get("name", "")])
+            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, sid)
+            self._items.setdefault(sid, []).append(item)
+            depth = int(element.get("depth", 0))
+            parent = depth_parents.get(depth - 1)
+            if parent:
+                parent.addChild(item)
+            else:
+                top_level.append(item)
+            depth_parents[depth] = item
+            for level in list(depth_parents):
+                if level > depth:
+                    depth_parents.pop(level)
+        self.addTopLevelItems(top_level)
+        self.collapseAll()
+        return True
+
+    def set_extras(self, extras: dict[int, str]) -> None:
+        # storeIDs animados que não existem no modelo ficam no topo, visíveis só nos frames que os usam
+        for sid in [sid for sid in self._extras if sid not in extras]:
+            item = self._extras.pop(sid)
+            self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+        for sid, label in extras.items():
+            if sid in self._extras or sid in self._items:
+                continue
+            item = QtWidgets.QTreeWidgetItem([label])
+            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, sid)
+            item.setForeground(0, self.MODIFIED_BRUSH)
+            item.setHidden(sid not in self._highlighted)
+            self.addTopLevelItem(item)
+            self._extras[sid] = item
+
+    def highlight(self, store_ids: frozenset[int]) -> tuple[int, int]:
+        for sid in store_ids ^ self._highlighted:
+            active = sid in store_ids
+            for item in self._items.get(sid, []):
+                item.setData(0, QtCore.Qt.ItemDataRole.ForegroundRole, self.MODIFIED_BRUSH if active else None)
+            extra = self._extras.get(sid)
+            if extra is not None:
+                extra.setHidden(not active)
+        self._highlighted = store_ids
+        in_model = sum(len(self._items[sid]) for sid in store_ids if sid in self._items)
+        outside = sum(1 for sid in store_ids if sid not in self._items)
+        total = len(self._skeleton or []) + outside
+        return in_model + outside, total
@@ -0,0 +1,178 @@
+import hashlib
+from typing import Any, List
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+# Pixmaps decodificados por membro do arquivo + hash do conteúdo; bytes novos geram entrada nova
+class TextureCache:
+    def __init__(self) -> None:
+        self._digests: dict[str, tuple[bytes, str]] = {}
+        self._pixmaps: dict[tuple[str, str], QtGui.QPixmap] = {}
+
+    def skin_member(self, archive: dict[str, bytes]) -> str | None:
+        for name in archive:
+            if name.lower().endswith("skin.png"):
+                return name
+        return None
+
+    def pixmap(self, archive: dict[str, bytes], name: str | None = None) -> QtGui.QPixmap | None:
+        name = name or self.skin_member(archive)
+        if name is None or name not in archive:
+            return None
+        key = (name, self._digest(name, archive[name]))
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap()
+            if not pixmap.loadFromData(archive[name]):
+                return None
+            self._drop(name)
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def estimated_bytes(self) -> int:
+        return sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8 for pixmap in self._pixmaps.values())
+
+    def invalidate(self, name: str | None = None) -> None:
+        if name is None:
+            self._digests.clear()
+            self._pixmaps.clear()
+            return
+        self._digests.pop(name, None)
+        self._drop(name)
+
+    def _digest(self, name: str, data: bytes) -> str:
+        # Só recalcula o hash quando o objeto bytes do membro foi trocado
+        cached = self._digests.get(name)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self._digests[name] = (data, digest)
+        return digest
+
+    def _drop(self, name: str) -> None:
+        for key in [key for key in self._pixmaps if key[0] == name]:
+            del self._pixmaps[key]
+
+
+class UVOverlayItem(QtWidgets.QGraphicsItem):
+    DETAIL_MIN_PIXELS = 6.0
+
+    def __init__(self, faces: list[tuple[str, float, float, float, float]], color: QtGui.QColor) -> None:
+        super().__init__()
+        self.faces = faces
+        self._faces = [QtCore.QRectF(x1, y1, x2 - x1, y2 - y1) for _, x1, y1, x2, y2 in faces]
+        bounds = QtCore.QRectF()
+        for rect in self._faces:
+            bounds = bounds.united(rect)
+        self._bounds = bounds
+        self._pen = QtGui.QPen(color)
+        self._pen.setCosmetic(True)
+        self._fill = QtGui.QColor(color)
+        self._fill.setAlpha(60)
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def set_color(self, color: QtGui.QColor, width: int = 1) -> None:
+        self._pen = QtGui.QPen(color)
+        self._pen.setCosmetic(True)
+        self._pen.setWidth(width)
+        self._fill = QtGui.QColor(color)
+        self._fill.setAlpha(60)
+        self.update()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._bounds.adjusted(-0.5, -0.5, 0.5, 0.5)
+
+    def paint(
+        self,
+        painter: QtGui.QPainter | None,
+        option: QtWidgets.QStyleOptionGraphicsItem | None,
+        widget: QtWidgets.QWidget | None = None,
+    ) -> None:
+        del widget
+        if painter is None or option is None:
+            return
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        painter.setPen(self._pen)
+        # Com pouco zoom as faces viram poucos pixels: desenha só a caixa envolvente preenchida
+        if self._bounds.width() * lod < self.DETAIL_MIN_PIXELS * 3:
+            painter.fillRect(self._bounds, self._fill)
+            painter.drawRect(self._bounds)
+            return
+        for rect in self._faces:
+            painter.drawRect(rect)
+
+
+# Mostra a textura com as faces de todos os elementos; os itens são criados uma vez e só se movem
+class UVAtlasView(QtWidgets.QGraphicsView):
+    BASE_COLOR = QtGui.QColor(80, 160, 255)
+    SELECTED_COLOR = QtGui.QColor("red")
+    SHIFT_COLOR = QtGui.QColor("green")
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setScene(QtWidgets.QGraphicsScene(self))
+        self.setRenderHints(
+            QtGui.QPainter.RenderHint.Antialiasing | QtGui.QPainter.RenderHint.SmoothPixmapTransform
+        )
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setDragMode(QtWidgets.QGraphicsView.DragMode.ScrollHandDrag)
+        self._items: dict[tuple[int | str, ...], UVOverlayItem] = {}
+        self._selected: list[UVOverlayItem] = []
+        self._shift_items: list[UVOverlayItem] = []
+
+    def set_atlas(self, pixmap: QtGui.QPixmap | None, entries: list[dict[str, Any]]) -> None:
+        scene = self.scene()
+        scene.clear()
+        self._items = {}
+        self._selected = []
+        self._shift_items = []
+        if pixmap is not None:
+            background = scene.addPixmap(pixmap)
+            background.setZValue(-1)
+        for entry in entries:
+            item = UVOverlayItem(entry["faces"], self.BASE_COLOR)
+            item.setToolTip(str(entry.get("name", "")))
+            scene.addItem(item)
+            self._items[tuple(entry["path"])] = item
+        self.fit()
+
+    def highlight(self, paths: list[List[int | str]]) -> None:
+        # Marca os elementos selecionados e cria a sombra que acompanha dU/dV
+        for item in self._shift_items:
+            self.scene().removeItem(item)
+        self._shift_items = []
+        for item in self._selected:
+            item.set_color(self.BASE_COLOR)
+            item.setZValue(0)
+        self._selected = []
+        for path in paths:
+            item = self._items.get(tuple(path))
+            if item is None:
+                continue
+            item.set_color(self.SELECTED_COLOR, 2)
+            item.setZValue(1)
+            self._selected.append(item)
+            shadow = UVOverlayItem(item.faces, self.SHIFT_COLOR)
+            shadow.set_color(self.SHIFT_COLOR, 2)
+            shadow.setZValue(2)
+            self.scene().addItem(shadow)
+            self._shift_items.append(shadow)
+
+    def set_shift(self, du: float, dv: float) -> None:
+        for item in self._shift_items:
+            item.setPos(du, dv)
+
+    def has_overlays(self) -> bool:
+        return bool(self._items)
+
+    def fit(self) -> None:
+        rect = self.scene().itemsBoundingRect()
+        if not rect.isEmpty():
+            self.fitInView(rect, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+
+    def wheelEvent(self, event: QtGui.QWheelEvent | None) -> None:
+        if event is None:
+            return
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        self.scale(factor, factor)
@@ -0,0 +1,119 @@
+from bisect import bisect_left
+from typing import Sequence
+
+# Árvores de segmentos sobre coordenadas fixas (as bordas de todas as faces), usadas pelas varreduras do
+# analyze_uv: inserir, remover e consultar custam O(log n) mais o tamanho da resposta, em vez de comparar
+# cada face nova com todas as ativas.
+
+
+class IntervalIndex:
+    # Intervalos [y1, y2) ativos guardados nos nós canônicos que cobrem; a consulta só desce em subárvores
+    # com algum intervalo e que cruzam a faixa pedida
+    def __init__(self, coords: Sequence[float]) -> None:
+        self.coords = list(coords)
+        size = max(len(self.coords) - 1, 1)
+        self._items: list[set[int]] = [set() for _ in range(4 * size)]
+        self._totals = [0] * (4 * size)
+        self._size = size
+
+    def _range(self, y1: float, y2: float) -> tuple[int, int]:
+        return bisect_left(self.coords, y1), bisect_left(self.coords, y2)
+
+    def add(self, item: int, y1: float, y2: float) -> None:
+        lo, hi = self._range(y1, y2)
+        if lo < hi:
+            self._update(1, 0, self._size, lo, hi, item, True)
+
+    def remove(self, item: int, y1: float, y2: float) -> None:
+        lo, hi = self._range(y1, y2)
+        if lo < hi:
+            self._update(1, 0, self._size, lo, hi, item, False)
+
+    def _update(self, node: int, left: int, right: int, lo: int, hi: int, item: int, insert: bool) -> int:
+        if hi <= left or right <= lo:
+            return 0
+        if lo <= left and right <= hi:
+            items = self._items[node]
+            if insert:
+                items.add(item)
+            else:
+                items.discard(item)
+            delta = 1 if insert else -1
+        else:
+            middle = (left + right) // 2
+            delta = self._update(2 * node, left, middle, lo, hi, item, insert)
+            delta += self._update(2 * node + 1, middle, right, lo, hi, item, insert)
+        self._totals[node] += delta
+        return delta
+
+    def overlapping(self, y1: float, y2: float) -> set[int]:
+        lo, hi = self._range(y1, y2)
+        found: set[int] = set()
+        if lo >= hi:
+            return found
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, left, right = stack.pop()
+            if hi <= left or right <= lo or not self._totals[node]:
+                continue
+            found |= self._items[node]
+            if right - left > 1:
+                middle = (left + right) // 2
+                stack.append((2 * node, left, middle))
+                stack.append((2 * node + 1, middle, right))
+        return found
+
+
+class CoverageIndex:
+    # Contagem de cobertura em x: cada nó sabe quanto do seu trecho está coberto, então as lacunas de uma
+    # faixa saem descendo só pelos nós que não estão totalmente cobertos
+    def __init__(self, coords: Sequence[float]) -> None:
+        self.coords = list(coords)
+        size = max(len(self.coords) - 1, 1)
+        self._counts = [0] * (4 * size)
+        self._covered = [0.0] * (4 * size)
+        self._size = size
+
+    def add(self, x1: float, x2: float, delta: int) -> None:
+        lo, hi = bisect_left(self.coords, x1), bisect_left(self.coords, x2)
+        if lo < hi:
+            self._update(1, 0, self._size, lo, hi, delta)
+
+    def _update(self, node: int, left: int, right: int, lo: int, hi: int, delta: int) -> None:
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self._counts[node] += delta
+        else:
+            middle = (left + right) // 2
+            self._update(2 * node, left, middle, lo, hi, delta)
+            self._update(2 * node + 1, middle, right, lo, hi, delta)
+        if self._counts[node] > 0:
+            self._covered[node] = self.coords[right] - self.coords[left]
+        elif right - left > 1:
+            self._covered[node] = self._covered[2 * node] + self._covered[2 * node + 1]
+        else:
+            self._covered[node] = 0.0
+
+    def gaps(self) -> list[tuple[float, float]]:
+        gaps: list[tuple[float, float]] = []
+        if len(self.coords) < 2:
+            return gaps
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, left, right = stack.pop()
+            length = self.coords[right] - self.coords[left]
+            if self._counts[node] > 0 or self._covered[node] >= length:
+                continue
+            if self._covered[node] == 0.0:
+                start, end = self.coords[left], self.coords[right]
+                if gaps and gaps[-1][1] == start:
+                    gaps[-1] = (gaps[-1][0], end)
+                else:
+                    gaps.append((start, end))
+                continue
+            middle = (left + right) // 2
+            # Direita primeiro na pilha para visitar da esquerda para a direita
+            stack.append((2 * node + 1, middle, right))
+            stack.append((2 * node, left, middle))
+        return gaps
@@ -0,0 +1,98 @@
+from typing import Any, Sequence
+
+# Vetores de pos/rotation/scale viram tuplas (x, y, z) de float uma única vez; as operações
+# trabalham em lote sobre listas dessas tuplas e só no fim voltam ao formato do JSON.
+Vec3 = tuple[float, float, float]
+
+ZERO: Vec3 = (0.0, 0.0, 0.0)
+ONE: Vec3 = (1.0, 1.0, 1.0)
+
+_AXES = (("x", "X"), ("y", "Y"), ("z", "Z"))
+
+
+def _number(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def read(value: Any, default: Vec3 = ZERO) -> Vec3:
+    # Aceita {"x","y","z"} (em qualquer caixa) ou listas [x, y, z]; eixo ausente vale 0
+    if isinstance(value, dict):
+        get = value.get
+        x = get("x")
+        y = get("y")
+        z = get("z")
+        return (
+            _number(get("X") if x is None else x),
+            _number(get("Y") if y is None else y),
+            _number(get("Z") if z is None else z),
+        )
+    if isinstance(value, list) and len(value) >= 3:
+        return _number(value[0]), _number(value[1]), _number(value[2])
+    return default
+
+
+def write(vec: Vec3, like: Any = None) -> Any:
+    # Devolve no mesmo formato de `like`: lista continua lista, chaves maiúsculas continuam
+    # maiúsculas e campos extras do dicionário são preservados
+    if isinstance(like, list) and len(like) >= 3:
+        return [vec[0], vec[1], vec[2], *like[3:]]
+    if isinstance(like, dict):
+        result = dict(like)
+        for (lower, upper), value in zip(_AXES, vec):
+            result[upper if upper in like and lower not in like else lower] = value
+        return result
+    return {"x": vec[0], "y": vec[1], "z": vec[2]}
+
+
+def add(a: Vec3, b: Vec3) -> Vec3:
+    return a[0] + b[0], a[1] + b[1], a[2] + b[2]
+
+
+def sub(a: Vec3, b: Vec3) -> Vec3:
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def read_many(values: Sequence[Any], default: Vec3 = ZERO) -> list[Vec3]:
+    return [read(value, default) for value in values]
+
+
+def write_many(vecs: Sequence[Vec3], likes: Sequence[Any]) -> list[Any]:
+    return [write(vec, like) for vec, like in zip(vecs, likes)]
+
+
+def add_many(bases: Sequence[Vec3], deltas: Sequence[Vec3]) -> list[Vec3]:
+    return [(a[0] + b[0], a[1] + b[1], a[2] + b[2]) for a, b in zip(bases, deltas)]
+
+
+def sub_many(bases: Sequence[Vec3], deltas: Sequence[Vec3]) -> list[Vec3]:
+    return [(a[0] - b[0], a[1] - b[1], a[2] - b[2]) for a, b in zip(bases, deltas)]
+
+
+def lerp_many(starts: Sequence[Vec3], ends: Sequence[Vec3], t: float | Sequence[float]) -> list[Vec3]:
+    if isinstance(t, (int, float)):
+        weight = float(t)
+        return [
+            (a[0] + (b[0] - a[0]) * weight, a[1] + (b[1] - a[1]) * weight, a[2] + (b[2] - a[2]) * weight)
+            for a, b in zip(starts, ends)
+        ]
+    return [
+        (a[0] + (b[0] - a[0]) * w, a[1] + (b[1] - a[1]) * w, a[2] + (b[2] - a[2]) * w)
+        for a, b, w in zip(starts, ends, t)
+    ]
+
+
+def scale_many(vecs: Sequence[Vec3], factor: float | Vec3) -> list[Vec3]:
+    if isinstance(factor, (int, float)):
+        fx = fy = fz = float(factor)
+    else:
+        fx, fy, fz = factor
+    return [(v[0] * fx, v[1] * fy, v[2] * fz) for v in vecs]
+
+
+def clamp_many(vecs: Sequence[Vec3], low: float | Vec3, high: float | Vec3) -> list[Vec3]:
+    lx, ly, lz = (low, low, low) if isinstance(low, (int, float)) else low
+    hx, hy, hz = (high, high, high) if isinstance(high, (int, float)) else high
+    return [
+        (min(max(v[0], lx), hx), min(max(v[1], ly), hy), min(max(v[2], lz), hz))
+        for v in vecs
+    ]